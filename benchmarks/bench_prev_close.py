@@ -0,0 +1,81 @@
+""" Benchmark of the % change to the previous trading day on multi-year histories"""
+import argparse
+import json
+import time
+
+import numpy as np
+import pandas as pd
+
+from xetra.transformations.xetra_aggregations import XetraPartialAggregates
+
+
+def create_aggregates(isin_count: int, days: int, seed: int = 42):
+    """
+    Creating synthetic aggregates per ISIN and day, sorted by ISIN and day
+
+    Params:
+        isin_count (int): number of ISINs
+        days (int): number of trading days per ISIN
+        seed (int): seed of the random prices
+
+    Returns:
+        data_frame (pd.DataFrame): columns 'ISIN', 'Date' and 'op_price'
+    """
+    rng = np.random.default_rng(seed)
+    isins = np.array([f'DE{index:010d}' for index in range(isin_count)], dtype=object)
+    dates = pd.bdate_range('2015-01-01', periods=days).strftime('%Y-%m-%d').to_numpy()
+    return pd.DataFrame({
+        'ISIN': np.repeat(isins, days),
+        'Date': np.tile(dates, isin_count),
+        'op_price': rng.uniform(1, 500, isin_count * days)})
+
+
+def change_groupby_shift(data_frame: pd.DataFrame):
+    """
+    Previous implementation re-sorting by date and shifting per ISIN
+    """
+    prev_price = data_frame.sort_values(by=['Date']).groupby(['ISIN'])['op_price'].shift(1)
+    return ((data_frame['op_price'] - prev_price) / prev_price * 100).to_numpy()
+
+
+def change_kernel(data_frame: pd.DataFrame):
+    """
+    Vectorized kernel comparing adjacent rows of the (ISIN, Date)-sorted aggregates
+    """
+    return XetraPartialAggregates.change_prev_close(
+        data_frame['ISIN'].to_numpy(), data_frame['op_price'].to_numpy())
+
+
+def time_best(function, data_frame: pd.DataFrame, repeat: int):
+    """
+    Returning the best wall clock seconds of repeat runs
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(data_frame)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    """Entry point to run the benchmark of the % change to the previous trading day
+    """
+    parser = argparse.ArgumentParser(
+        description='Benchmark the % change to the previous trading day.')
+    parser.add_argument('--isins', type=int, default=3000)
+    parser.add_argument('--years', type=int, default=5)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    data_frame = create_aggregates(args.isins, args.years * 252)
+    np.testing.assert_array_equal(change_groupby_shift(data_frame), change_kernel(data_frame))
+    results = {
+        'rows': len(data_frame),
+        'groupby_shift_s': time_best(change_groupby_shift, data_frame, args.repeat),
+        'kernel_s': time_best(change_kernel, data_frame, args.repeat),
+    }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+""" Benchmark of report 1 for a watchlist of ISINs filtered while parsing"""
+import argparse
+import json
+import logging
+import tempfile
+import time
+from unittest.mock import patch
+
+from benchmarks.run_benchmarks import META_KEY, SOURCE_CONFIG, TARGET_CONFIG
+from benchmarks.xetra_data_generator import XetraDataGenerator, XetraDataGeneratorConfig
+from xetra.common.local_storage import LocalStorageConnector
+from xetra.common.meta_process import MetaProcess
+from xetra.transformations.xetra_engines import create_xetra_etl
+from xetra.transformations.xetra_transformations import (XetraRunConfig, XetraSourceConfig,
+                                                         XetraTargetConfig)
+
+
+def time_report1(storage: LocalStorageConnector, dates: list, source_config: XetraSourceConfig,
+                 engine: str, repeat: int):
+    """
+    Returning the best wall clock seconds of repeat runs of extract and transform_report1
+    and the number of report rows
+    """
+    with patch.object(MetaProcess, 'return_date_list', return_value=[dates[0], dates]):
+        xetra_etl = create_xetra_etl(storage, storage, META_KEY, source_config,
+                                     XetraTargetConfig(**TARGET_CONFIG),
+                                     XetraRunConfig(engine=engine))
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        report = xetra_etl.transform_report1(xetra_etl.extract())
+        timings.append(time.perf_counter() - start)
+    return min(timings), len(report)
+
+
+def main():
+    """Entry point to run the benchmark of report 1 for a watchlist
+    """
+    parser = argparse.ArgumentParser(
+        description='Benchmark report 1 for the whole universe and for a watchlist.')
+    parser.add_argument('--isins', type=int, default=3000)
+    parser.add_argument('--watchlist', type=int, default=300)
+    parser.add_argument('--days', type=int, default=2)
+    parser.add_argument('--engine', default='pandas')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+    generator = XetraDataGenerator(XetraDataGeneratorConfig(
+        isin_count=args.isins, days=args.days))
+    source_config = XetraSourceConfig(**SOURCE_CONFIG)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        storage = LocalStorageConnector(tmp_dir)
+        for key, content in generator.generate():
+            storage.write_object(content, key)
+        dates = generator.trading_dates()
+        universe_s, universe_rows = time_report1(
+            storage, dates, source_config, args.engine, args.repeat)
+        watchlist_s, watchlist_rows = time_report1(
+            storage, dates, source_config._replace(src_isins=generator.isins[:args.watchlist]),
+            args.engine, args.repeat)
+    results = {
+        'engine': args.engine,
+        'universe_rows': universe_rows,
+        'universe_s': universe_s,
+        'watchlist_rows': watchlist_rows,
+        'watchlist_s': watchlist_s,
+    }
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,225 @@
+""" End-to-end benchmark of the Xetra ETL job against a local moto S3 server"""
+import argparse
+import json
+import logging
+import os
+import platform
+import subprocess
+import tempfile
+import time
+from datetime import datetime
+
+import boto3
+import pandas as pd
+from moto.server import ThreadedMotoServer
+
+from benchmarks.xetra_data_generator import XetraDataGenerator, XetraDataGeneratorConfig
+from xetra.common.local_storage import LocalStorageConnector
+from xetra.common.s3 import S3BucketConnector
+from xetra.common.constants import ETLEngines
+from xetra.transformations.xetra_engines import ETL_ENGINES, create_xetra_etl
+from xetra.transformations.xetra_transformations import XetraRunConfig, XetraSourceConfig, XetraTargetConfig
+
+ACCESS_KEY = 'BENCHMARK_ACCESS_KEY_ID'
+SECRET_KEY = 'BENCHMARK_SECRET_ACCESS_KEY'
+SRC_BUCKET = 'xetra-benchmark-src'
+TRG_BUCKET = 'xetra-benchmark-trg'
+META_KEY = 'meta/report1/xetra_report1_meta_file.csv'
+
+SOURCE_CONFIG = {
+    'src_first_extract_date': '2022-03-14',
+    'src_columns': ['ISIN', 'Mnemonic', 'Date', 'Time', 'StartPrice', 'EndPrice',
+                    'MinPrice', 'MaxPrice', 'TradedVolume'],
+    'src_col_date': 'Date',
+    'src_col_isin': 'ISIN',
+    'src_col_time': 'Time',
+    'src_col_start_price': 'StartPrice',
+    'src_col_end_price': 'EndPrice',
+    'src_col_min_price': 'MinPrice',
+    'src_col_max_price': 'MaxPrice',
+    'src_col_traded_vol': 'TradedVolume'
+}
+TARGET_CONFIG = {
+    'trg_col_isin': 'isin',
+    'trg_col_date': 'date',
+    'trg_col_op_price': 'opening_price_eur',
+    'trg_col_clos_price': 'closing_price_eur',
+    'trg_col_min_price': 'minimum_price_eur',
+    'trg_col_max_price': 'maximum_price_eur',
+    'trg_col_daily_trad_vol': 'daily_traded_volume',
+    'trg_col_ch_prev_clos': 'change_prev_closing_%',
+    'trg_key': 'report1/xetra_daily_report1',
+    'trg_key_date_format': '%Y%m%d_%H%M%S',
+    'trg_format': 'parquet'
+}
+
+
+class XetraBenchmark():
+    """
+    Times the extract, transform_report1 and load stages of XetraETL separately
+    on synthetic data served by a local moto S3 server or a local directory
+    """
+
+    def __init__(self, generator_config: XetraDataGeneratorConfig, port: int = 5055,
+                 backend: str = 's3', run_config: XetraRunConfig = XetraRunConfig()):
+        """
+        Constructor for XetraBenchmark
+
+        Params:
+            generator_config (XetraDataGeneratorConfig): configuration of the synthetic data
+            port (int): port of the local moto S3 server
+            backend (str): storage backend, 's3' for the moto server or 'local'
+            run_config (XetraRunConfig): run configuration, e.g. the engine
+        """
+        self.generator = XetraDataGenerator(generator_config)
+        self.backend = backend
+        self.run_config = run_config
+        self.endpoint_url = f'http://127.0.0.1:{port}'
+        self._server = ThreadedMotoServer(port=port, verbose=False)
+        self._tmp_dir = None
+        self.source_bytes = 0
+        self.source_files = 0
+
+    def __enter__(self):
+        """Starting the moto server and uploading the synthetic data"""
+        if self.backend == 'local':
+            self._tmp_dir = tempfile.TemporaryDirectory()
+            src_storage = LocalStorageConnector(os.path.join(self._tmp_dir.name, SRC_BUCKET))
+            for key, content in self.generator.generate():
+                src_storage.write_object(content, key)
+                self.source_bytes += len(content)
+                self.source_files += 1
+            return self
+        os.environ[ACCESS_KEY] = 'benchmark'
+        os.environ[SECRET_KEY] = 'benchmark'
+        self._server.start()
+        s3_resource = boto3.resource(
+            service_name='s3', endpoint_url=self.endpoint_url, region_name='us-east-1',
+            aws_access_key_id='benchmark', aws_secret_access_key='benchmark')
+        s3_resource.create_bucket(Bucket=SRC_BUCKET)
+        s3_resource.create_bucket(Bucket=TRG_BUCKET)
+        src_bucket = s3_resource.Bucket(SRC_BUCKET)
+        for key, content in self.generator.generate():
+            src_bucket.put_object(Body=content, Key=key)
+            self.source_bytes += len(content)
+            self.source_files += 1
+        return self
+
+    def __exit__(self, *exc_info):
+        """Stopping the moto server"""
+        if self._tmp_dir:
+            self._tmp_dir.cleanup()
+        else:
+            self._server.stop()
+
+    def create_storages(self):
+        """
+        Creating the source and target storage connectors
+
+        Returns:
+            storages (tuple): source and target StorageConnector
+        """
+        if self.backend == 'local':
+            return (LocalStorageConnector(os.path.join(self._tmp_dir.name, SRC_BUCKET)),
+                    LocalStorageConnector(os.path.join(self._tmp_dir.name, TRG_BUCKET)))
+        return (S3BucketConnector(ACCESS_KEY, SECRET_KEY, self.endpoint_url, SRC_BUCKET),
+                S3BucketConnector(ACCESS_KEY, SECRET_KEY, self.endpoint_url, TRG_BUCKET))
+
+    def create_etl(self):
+        """
+        Creating a XetraETL instance on the synthetic trading days
+
+        Returns:
+            xetra_etl (XetraETL): XetraETL instance on the benchmark storages
+        """
+        s3_bucket_src, s3_bucket_trg = self.create_storages()
+        xetra_etl = create_xetra_etl(s3_bucket_src, s3_bucket_trg, META_KEY,
+                                     XetraSourceConfig(**SOURCE_CONFIG),
+                                     XetraTargetConfig(**TARGET_CONFIG), self.run_config)
+        # Fixing the dates so the runs do not depend on the current date
+        dates = self.generator.trading_dates()
+        xetra_etl.extract_date, xetra_etl.extract_date_list = dates[1], dates
+        xetra_etl.meta_update_list = dates[1:]
+        return xetra_etl
+
+    def run(self, repeat: int):
+        """
+        Timing each stage of the ETL job
+
+        Params:
+            repeat (int): number of timed runs per stage
+
+        Returns:
+            timings (dict): wall clock seconds of every run per stage
+        """
+        timings = {'extract': [], 'transform_report1': [], 'load': []}
+        for _ in range(repeat):
+            xetra_etl = self.create_etl()
+            start = time.perf_counter()
+            data_frame = xetra_etl.extract()
+            timings['extract'].append(time.perf_counter() - start)
+            start = time.perf_counter()
+            report = xetra_etl.transform_report1(data_frame)
+            timings['transform_report1'].append(time.perf_counter() - start)
+            start = time.perf_counter()
+            xetra_etl.load(report)
+            timings['load'].append(time.perf_counter() - start)
+        return timings
+
+
+def git_commit():
+    """
+    Returning the current git commit or None outside of a git repository
+    """
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True,
+                              check=True, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    """Entry point to run the Xetra benchmarks
+    """
+    defaults = XetraDataGeneratorConfig()
+    parser = argparse.ArgumentParser(description='Benchmark the Xetra ETL job.')
+    parser.add_argument('--isins', type=int, default=defaults.isin_count)
+    parser.add_argument('--minutes', type=int, default=defaults.trading_minutes)
+    parser.add_argument('--days', type=int, default=defaults.days)
+    parser.add_argument('--seed', type=int, default=defaults.seed)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--port', type=int, default=5055)
+    parser.add_argument('--backend', choices=['s3', 'local'], default='s3',
+                        help='Storage backend serving the synthetic data.')
+    parser.add_argument('--engine', choices=list(ETL_ENGINES), default=ETLEngines.PANDAS.value,
+                        help='Engine of the transformations.')
+    parser.add_argument('--output', default='bench_results.json',
+                        help='Path of the JSON file with the results.')
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger('werkzeug').setLevel(logging.ERROR)
+    generator_config = XetraDataGeneratorConfig(
+        isin_count=args.isins, trading_minutes=args.minutes, days=args.days, seed=args.seed)
+    run_config = XetraRunConfig(engine=args.engine)
+    with XetraBenchmark(generator_config, args.port, args.backend, run_config) as benchmark:
+        timings = benchmark.run(args.repeat)
+        results = {
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'git_commit': git_commit(),
+            'backend': args.backend,
+            'engine': args.engine,
+            'python_version': platform.python_version(),
+            'pandas_version': pd.__version__,
+            'generator_config': generator_config._asdict(),
+            'source_files': benchmark.source_files,
+            'source_bytes': benchmark.source_bytes,
+            'timings_s': timings,
+            'best_s': {stage: min(values) for stage, values in timings.items()},
+        }
+    with open(args.output, 'w', encoding='utf-8') as output_file:
+        json.dump(results, output_file, indent=2)
+    print(json.dumps(results['best_s'], indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+""" Deterministic generator of synthetic Xetra source files"""
+from datetime import datetime, timedelta
+from io import StringIO
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from xetra.common.constants import MetaProcessFormat
+
+
+XETRA_COLUMNS = ['ISIN', 'Mnemonic', 'SecurityDesc', 'SecurityType', 'Currency',
+                 'SecurityID', 'Date', 'Time', 'StartPrice', 'MaxPrice', 'MinPrice',
+                 'EndPrice', 'NumberOfTrades', 'TradedVolume']
+
+
+class XetraDataGeneratorConfig(NamedTuple):
+    """
+    Class for the configuration of the synthetic Xetra data
+
+    Params:
+        isin_count (int): number of ISINs in the universe
+        trading_minutes (int): number of trading minutes per day starting at first_hour
+        days (int): number of trading days, weekends are skipped
+        header_only_hours (list): hours of the day that are published as header-only files
+        start_date (str): first trading day
+        first_hour (int): hour of the first trading minute
+        activity (float): probability that an ISIN is traded in a minute
+        seed (int): seed of the random number generator
+    """
+    isin_count: int = 100
+    trading_minutes: int = 510
+    days: int = 5
+    header_only_hours: list = [6, 7, 17, 18, 19]
+    start_date: str = '2022-03-14'
+    first_hour: int = 8
+    activity: float = 0.3
+    seed: int = 42
+
+
+class XetraDataGenerator():
+    """
+    Generates realistic Xetra source files with one csv file per day and hour
+    """
+
+    def __init__(self, config: XetraDataGeneratorConfig = XetraDataGeneratorConfig()):
+        """
+        Constructor for XetraDataGenerator
+
+        Params:
+            config (XetraDataGeneratorConfig): configuration of the synthetic data
+        """
+        self.config = config
+        self._random = np.random.RandomState(config.seed)
+        self.isins = [f'DE000{number:07d}' for number in range(config.isin_count)]
+        self.mnemonics = [f'X{number:03d}' for number in range(config.isin_count)]
+        self._prices = np.round(self._random.lognormal(3.5, 1.0, config.isin_count), 2)
+
+    def trading_dates(self):
+        """
+        Returning the trading days of the synthetic data
+
+        Returns:
+            dates (list): trading days as strings
+        """
+        date = datetime.strptime(
+            self.config.start_date, MetaProcessFormat.META_DATE_FORMAT.value).date()
+        dates = []
+        while len(dates) < self.config.days:
+            if date.weekday() < 5:
+                dates.append(date.strftime(MetaProcessFormat.META_DATE_FORMAT.value))
+            date += timedelta(days=1)
+        return dates
+
+    def generate(self):
+        """
+        Generating the source files in key order
+
+        Returns:
+            files (generator): tuples of the source key and the csv content
+        """
+        for date in self.trading_dates():
+            data_frame = self._generate_day(date)
+            hours = data_frame['Time'].str[:2].astype(int)
+            for hour in sorted(set(hours) | set(self.config.header_only_hours)):
+                key = f'{date}/{date}_BINS_XETR{hour:02d}.csv'
+                out_buffer = StringIO()
+                data_frame[hours == hour].to_csv(out_buffer, index=False)
+                yield key, out_buffer.getvalue()
+
+    def _generate_day(self, date: str):
+        """
+        Helper function generating the rows of one trading day as random walk per ISIN
+        """
+        minutes = self.config.trading_minutes
+        isin_count = self.config.isin_count
+        returns = self._random.normal(0.0, 0.001, (minutes, isin_count))
+        end_prices = self._prices * np.exp(np.cumsum(returns, axis=0))
+        start_prices = np.vstack([self._prices, end_prices[:-1]])
+        spread = np.abs(self._random.normal(0.0, 0.0005, (2, minutes, isin_count)))
+        max_prices = np.maximum(start_prices, end_prices) * (1 + spread[0])
+        min_prices = np.minimum(start_prices, end_prices) * (1 - spread[1])
+        trades = self._random.poisson(3, (minutes, isin_count)) + 1
+        volumes = trades * self._random.randint(1, 500, (minutes, isin_count))
+        traded = self._random.random_sample((minutes, isin_count)) < self.config.activity
+        self._prices = np.round(end_prices[-1], 2)
+        minute_idx, isin_idx = np.nonzero(traded)
+        minute_of_day = self.config.first_hour * 60 + minute_idx
+        times = [f'{minute // 60:02d}:{minute % 60:02d}' for minute in minute_of_day]
+        return pd.DataFrame({
+            'ISIN': np.array(self.isins)[isin_idx],
+            'Mnemonic': np.array(self.mnemonics)[isin_idx],
+            'SecurityDesc': 'SYNTHETIC SECURITY',
+            'SecurityType': 'Common stock',
+            'Currency': 'EUR',
+            'SecurityID': 2504159 + isin_idx,
+            'Date': date,
+            'Time': times,
+            'StartPrice': np.round(start_prices[minute_idx, isin_idx], 2),
+            'MaxPrice': np.round(max_prices[minute_idx, isin_idx], 2),
+            'MinPrice': np.round(min_prices[minute_idx, isin_idx], 2),
+            'EndPrice': np.round(end_prices[minute_idx, isin_idx], 2),
+            'NumberOfTrades': trades[minute_idx, isin_idx],
+            'TradedVolume': volumes[minute_idx, isin_idx],
+        }, columns=XETRA_COLUMNS)
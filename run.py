@@ -1,12 +1,44 @@
 """ Runnning the Xetra ETL application"""
 import argparse
+import json
 import logging
 import logging.config
+import signal
+import threading
 
-import yaml
+from xetra.common.config import load_config
+from xetra.common.constants import StorageBackends
+from xetra.common.custom_exceptions import WrongConfigException
+
+
+def create_storages(config):
+    """
+    Creating the source and target storage connectors of the configured backend,
+    the connector modules and their dependencies are imported here on first use
+
+    Params:
+        config (XetraJobConfig): validated configuration
+
+    Returns:
+        storages (tuple): source and target StorageConnector
+    """
+    if config.storage['backend'] == StorageBackends.LOCAL.value:
+        from xetra.common.local_storage import LocalStorageConnector
+        # creating the LocalStorageConnector class instance for source and target
+        return (LocalStorageConnector(config.storage['src_root']),
+                LocalStorageConnector(config.storage['trg_root']))
+    from xetra.common.s3 import S3BucketConnector
+    s3_config = config.s3
+    # creating the S3BucketConnector class instance for source and target
+    return (S3BucketConnector(access_key=s3_config['access_key'],
+                              secret_key=s3_config['secret_key'],
+                              endpoint_url=s3_config['src_endpoint_url'],
+                              bucket=s3_config['src_bucket']),
+            S3BucketConnector(access_key=s3_config['access_key'],
+                              secret_key=s3_config['secret_key'],
+                              endpoint_url=s3_config['trg_endpoint_url'],
+                              bucket=s3_config['trg_bucket']))
 
-from xetra.common.s3 import S3BucketConnector
-from xetra.transformations.xetra_transformations import XetraETL, XetraSourceConfig, XetraTargetConfig
 
 def main():
     """Entry point to run the xetra ETL job
@@ -14,36 +46,84 @@ def main():
     # Parsing YAML file
     parser = argparse.ArgumentParser(description='Run the Xetra ETL job.')
     parser.add_argument('config', help='A configuration file in YAML format.')
+    parser.add_argument('--watch', action='store_true',
+                        help='Keep running and process newly published source files.')
+    parser.add_argument('--shard-count', type=int,
+                        help='Split the run of report 1 into this number of shards.')
+    parser.add_argument('--shard-index', type=int,
+                        help='Run only the shard with this index (0 to shard count - 1).')
+    parser.add_argument('--finalize-shards', action='store_true',
+                        help='Merge the finished shards into report 1 and update the meta file.')
+    parser.add_argument('--plan', action='store_true',
+                        help='Print the dates, objects, bytes and requests of the run as JSON '
+                             'without downloading any source file.')
+    parser.add_argument('--compact', action='store_true',
+                        help='Merge the new report 1 files into time-bucketed compacted files.')
     args = parser.parse_args()
-    config = yaml.safe_load(open(args.config))
-    
+    sharded = args.shard_index is not None or args.finalize_shards
+    if (args.shard_count is not None) != sharded or (args.shard_index is not None
+                                                    and args.finalize_shards):
+        parser.error('--shard-count requires exactly one of --shard-index or --finalize-shards')
+    # parsing and validating the YAML file once, before the heavy modules are imported
+    try:
+        config = load_config(args.config)
+    except WrongConfigException as error:
+        parser.error(str(error))
+    if args.compact and config.compaction is None:
+        parser.error('--compact requires a compaction configuration')
+
     # configure logging
-    log_config = config['logging']
-    logging.config.dictConfig(log_config)
+    logging.config.dictConfig(config.logging)
     logger = logging.getLogger(__name__)
-    
-    # reading s3 configuration
-    s3_config =config['s3']
-    # creating the S3BucketConnector class instance for source and target
-    s3_bucket_src = S3BucketConnector(access_key = s3_config['access_key'],
-                                      secret_key= s3_config['secret_key'],
-                                      endpoint_url= s3_config['src_endpoint_url'],
-                                      bucket= s3_config['src_bucket'])
-    s3_bucket_trg = S3BucketConnector(access_key = s3_config['access_key'],
-                                      secret_key= s3_config['secret_key'],
-                                      endpoint_url= s3_config['trg_endpoint_url'],
-                                      bucket= s3_config['trg_bucket'])
-    # reading source configuration
-    source_config = XetraSourceConfig(**config['source'])
-    # reading target configuration
-    target_config = XetraTargetConfig(**config['target'])
-    # reading meta configuration
-    meta_config = config['meta']
-    # creating XetraETL class instance
+
+    # creating the storage connectors
+    s3_bucket_src, s3_bucket_trg = create_storages(config)
+    source_config, target_config, run_config = config.source, config.target, config.run
     logger.info('Xetra ETL job started')
-    xetra_etl = XetraETL(s3_bucket_src, s3_bucket_trg, meta_config['meta_key'], source_config, target_config)
-    # running etl job
-    xetra_etl.etl_report1()
+    if args.compact:
+        # compacting the report 1 files of all runs
+        from xetra.transformations.xetra_compaction import XetraReportCompaction
+        XetraReportCompaction(s3_bucket_trg, source_config, target_config,
+                              config.compaction).compact()
+        logger.info('Xetra ETL job finished')
+        return
+    from xetra.transformations.xetra_engines import create_xetra_etl
+    if args.plan:
+        # planning the run of report 1 without running it
+        from xetra.transformations.xetra_planner import XetraRunPlanner
+        xetra_etl = create_xetra_etl(s3_bucket_src, s3_bucket_trg, config.meta_key,
+                                     source_config, target_config, run_config)
+        print(json.dumps(XetraRunPlanner(xetra_etl).plan(), indent=2))
+        logger.info('Xetra ETL job finished')
+        return
+    if config.reports is not None and not args.watch and not sharded:
+        # running all reports on one extract
+        from xetra.transformations.xetra_reports import XetraReportJob
+        XetraReportJob(s3_bucket_src, s3_bucket_trg, source_config,
+                       config.reports, run_config).run()
+        logger.info('Xetra ETL job finished')
+        return
+    # creating XetraETL class instance
+    xetra_etl = create_xetra_etl(s3_bucket_src, s3_bucket_trg, config.meta_key,
+                                 source_config, target_config, run_config)
+    if args.watch:
+        # running etl job in watch mode until SIGINT or SIGTERM is received
+        stop_event = threading.Event()
+        signal.signal(signal.SIGINT, lambda signum, frame: stop_event.set())
+        signal.signal(signal.SIGTERM, lambda signum, frame: stop_event.set())
+        from xetra.transformations.xetra_watcher import XetraWatcher
+        XetraWatcher(xetra_etl, run_config.watch_interval).run(stop_event)
+    elif sharded:
+        from xetra.transformations.xetra_shards import XetraShardedRun
+        if args.finalize_shards:
+            # merging the shards of a sharded run
+            XetraShardedRun(xetra_etl, args.shard_count).finalize()
+        else:
+            # running one shard of a sharded run
+            XetraShardedRun(xetra_etl, args.shard_count).run_shard(args.shard_index)
+    else:
+        # running etl job
+        xetra_etl.etl_report1()
     logger.info('Xetra ETL job finished')
 
 
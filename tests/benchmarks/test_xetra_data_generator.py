@@ -0,0 +1,66 @@
+"""Test XetraDataGenerator Methods"""
+
+from io import StringIO
+import unittest
+
+import pandas as pd
+
+from benchmarks.xetra_data_generator import XetraDataGenerator, XetraDataGeneratorConfig
+
+
+class TestXetraDataGeneratorMethods(unittest.TestCase):
+    """
+    Testing the XetraDataGenerator class
+    """
+
+    def setUp(self):
+        """Setting up the environment"""
+        self.config = XetraDataGeneratorConfig(
+            isin_count=10, trading_minutes=120, days=3, header_only_hours=[7, 10],
+            start_date='2022-03-18')
+
+    def test_trading_dates_skip_weekend(self):
+        """
+        Tests the trading_dates method skipping the weekend
+        """
+        # Expected results
+        dates_exp = ['2022-03-18', '2022-03-21', '2022-03-22']
+        # Method execution
+        dates_result = XetraDataGenerator(self.config).trading_dates()
+        # Test after method execution
+        self.assertEqual(dates_exp, dates_result)
+
+    def test_generate_deterministic(self):
+        """
+        Tests the generate method returning the same files for the same seed
+        """
+        # Method execution
+        files_result = list(XetraDataGenerator(self.config).generate())
+        files_retry = list(XetraDataGenerator(self.config).generate())
+        files_other = list(XetraDataGenerator(self.config._replace(seed=1)).generate())
+        # Test after method execution
+        self.assertEqual(files_result, files_retry)
+        self.assertNotEqual(files_result, files_other)
+
+    def test_generate_files(self):
+        """
+        Tests the generate method returning one file per hour with consistent prices
+        """
+        # Expected results
+        keys_exp = [f'2022-03-18/2022-03-18_BINS_XETR{hour:02d}.csv' for hour in [7, 8, 9, 10]]
+        # Method execution
+        files_result = dict(XetraDataGenerator(self.config).generate())
+        # Test after method execution
+        self.assertEqual(keys_exp, sorted(files_result)[:4])
+        df_header_only = pd.read_csv(StringIO(files_result[keys_exp[0]]))
+        self.assertTrue(df_header_only.empty)
+        self.assertTrue(pd.read_csv(StringIO(files_result[keys_exp[3]])).empty)
+        df_hour = pd.read_csv(StringIO(files_result[keys_exp[1]]))
+        self.assertFalse(df_hour.empty)
+        self.assertTrue((df_hour['MinPrice'] <= df_hour['StartPrice']).all())
+        self.assertTrue((df_hour['MaxPrice'] >= df_hour['EndPrice']).all())
+        self.assertTrue(df_hour['Time'].str.startswith('08:').all())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,169 @@
+""" Test the loading of the Xetra ETL job configuration"""
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+import yaml
+
+from xetra.common.config import (XetraCompactionConfig, XetraRunConfig, XetraSourceConfig,
+                                 load_config)
+from xetra.common.custom_exceptions import WrongConfigException
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+CONFIG_PATH = os.path.join(REPO_ROOT, 'configs', 'xetra_report1_config.yml')
+
+
+class TestLoadConfig(unittest.TestCase):
+    """
+    Testing the load_config function
+    """
+
+    def setUp(self):
+        """Setting up the environment"""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        with open(CONFIG_PATH, encoding='utf-8') as config_file:
+            self.config = yaml.safe_load(config_file)
+
+    def tearDown(self):
+        """Executing after unit test"""
+        self.tmp_dir.cleanup()
+
+    def _load(self, config: dict):
+        """Helper function writing the config to a file and loading it"""
+        config_path = os.path.join(self.tmp_dir.name, 'config.yml')
+        with open(config_path, 'w', encoding='utf-8') as config_file:
+            yaml.safe_dump(config, config_file)
+        return load_config(config_path)
+
+    def test_load_config_ok(self):
+        """
+        Tests the load_config function with the shipped configuration
+        """
+        # Method execution
+        config = load_config(CONFIG_PATH)
+        # Test after method execution
+        self.assertIsInstance(config.source, XetraSourceConfig)
+        self.assertIsInstance(config.run, XetraRunConfig)
+        self.assertIsInstance(config.compaction, XetraCompactionConfig)
+        self.assertEqual(self.config['meta']['meta_key'], config.meta_key)
+        self.assertEqual(self.config['source']['src_columns'], config.source.src_columns)
+
+    def test_load_config_wrong(self):
+        """
+        Tests the load_config function naming the wrong entry of invalid configurations
+        """
+        # Test init
+        missing_section = {key: value for key, value in self.config.items() if key != 'source'}
+        unknown_key = dict(self.config, run=dict(self.config['run'], cpu_count=4))
+        wrong_engine = dict(self.config, run=dict(self.config['run'], engine='spark'))
+        wrong_backend = dict(self.config, storage={'backend': 'ftp'})
+        missing_key = dict(self.config, target={key: value for key, value
+                                                in self.config['target'].items()
+                                                if key != 'trg_key'})
+        wrong_universe = dict(self.config, source=dict(
+            self.config['source'], src_security_types=['Common stock']))
+        empty_universe = dict(self.config, source=dict(self.config['source'], src_isins=[]))
+        reports_budget = dict(
+            self.config, run=dict(self.config['run'], max_memory_mb=1024),
+            reports=[{'name': 'report1', 'report': 'report1', 'meta_key': 'meta.csv',
+                      'target': self.config['target']}])
+        cases = [(missing_section, "misses the sections ['source']"),
+                 (unknown_key, "section run has the unknown keys ['cpu_count']"),
+                 (wrong_engine, "engine 'spark' in section run is not supported"),
+                 (wrong_backend, "storage backend 'ftp' is not supported"),
+                 (missing_key, "section target misses the keys ['trg_key']"),
+                 (wrong_universe, "filters the column 'SecurityType', which is not in"),
+                 (empty_universe, 'src_isins in section source must be a non-empty list'),
+                 (reports_budget, 'cannot be combined with the section reports')]
+        for config, message_exp in cases:
+            # Method execution
+            with self.assertRaises(WrongConfigException) as context:
+                self._load(config)
+            # Test after method execution
+            self.assertIn(message_exp, str(context.exception))
+
+    def test_load_config_no_file(self):
+        """
+        Tests the load_config function with a missing file
+        """
+        # Method execution and test after method execution
+        with self.assertRaises(WrongConfigException) as context:
+            load_config(os.path.join(self.tmp_dir.name, 'missing.yml'))
+        self.assertIn('cannot be read', str(context.exception))
+
+
+class TestImportTime(unittest.TestCase):
+    """
+    Testing the startup latency of the Xetra ETL application
+    """
+
+    def setUp(self):
+        """Setting up the environment"""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        # Expected results
+        self.deferred_exp = ['pandas', 'numpy', 'boto3', 'pyarrow', 'numba', 'polars']
+        self.budget_us_exp = 500000
+
+    def tearDown(self):
+        """Executing after unit test"""
+        self.tmp_dir.cleanup()
+
+    def _run(self, args: list):
+        """
+        Helper function running Python with -X importtime, returning the process result,
+        the imported modules and the cumulative import time in microseconds
+        """
+        result = subprocess.run([sys.executable, '-X', 'importtime'] + args,
+                                cwd=REPO_ROOT, capture_output=True, text=True, check=False)
+        # Lines look like 'import time:  self [us] | cumulative | imported package'
+        imports = [line.split('|') for line in result.stderr.splitlines()
+                   if line.startswith('import time:') and 'imported package' not in line]
+        modules = {package.strip() for _, _, package in imports}
+        cumulative_us = sum(int(self_us.split(':')[1]) for self_us, _, _ in imports)
+        return result, modules, cumulative_us
+
+    def test_import_run(self):
+        """
+        Tests that importing run.py and loading the configuration defers the heavy
+        dependencies and stays within the import time budget
+        """
+        # Method execution
+        result, modules, cumulative_us = self._run(
+            ['-c', f'import run; run.load_config({CONFIG_PATH!r})'])
+        # Test after method execution
+        self.assertEqual(0, result.returncode)
+        self.assertEqual([], [module for module in self.deferred_exp if module in modules])
+        self.assertLess(cumulative_us, self.budget_us_exp)
+
+    def test_main_rejects_before_heavy_imports(self):
+        """
+        Tests that run.py reports invalid configurations and options from main before
+        the heavy dependencies are imported
+        """
+        # Test init
+        with open(CONFIG_PATH, encoding='utf-8') as config_file:
+            config = yaml.safe_load(config_file)
+        wrong_path = os.path.join(self.tmp_dir.name, 'wrong.yml')
+        with open(wrong_path, 'w', encoding='utf-8') as config_file:
+            yaml.safe_dump(dict(config, run=dict(config['run'], engine='spark')), config_file)
+        no_compaction_path = os.path.join(self.tmp_dir.name, 'no_compaction.yml')
+        with open(no_compaction_path, 'w', encoding='utf-8') as config_file:
+            yaml.safe_dump({key: value for key, value in config.items()
+                            if key != 'compaction'}, config_file)
+        cases = [([wrong_path], "engine 'spark' in section run is not supported"),
+                 ([no_compaction_path, '--compact'],
+                  '--compact requires a compaction configuration')]
+        for args, message_exp in cases:
+            # Method execution
+            result, modules, cumulative_us = self._run(['run.py'] + args)
+            # Test after method execution
+            self.assertEqual(2, result.returncode)
+            self.assertIn(message_exp, result.stderr)
+            self.assertEqual([], [module for module in self.deferred_exp if module in modules])
+            self.assertLess(cumulative_us, self.budget_us_exp)
+
+
+if __name__ == '__main__':
+    unittest.main()
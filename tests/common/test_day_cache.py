@@ -0,0 +1,61 @@
+""" Test DayCache methods"""
+
+import tempfile
+import unittest
+
+import pandas as pd
+import pyarrow as pa
+
+from xetra.common.day_cache import DayCache
+
+
+class TestDayCacheMethods(unittest.TestCase):
+    """
+    Testing the DayCache class
+    """
+
+    def setUp(self):
+        """Setting up the environment"""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.columns = ['ISIN', 'Date', 'Time', 'StartPrice']
+        self.cache = DayCache(self.tmp_dir.name,
+                              DayCache.create_namespace('pandas', False, self.columns))
+        self.df_day = pd.DataFrame([['AT0000A0E9W5', '2022-03-16', '12:00', 20.19]] * 1000,
+                                   columns=self.columns)
+
+    def tearDown(self):
+        """Executing after unit test"""
+        self.tmp_dir.cleanup()
+
+    def test_create_namespace(self):
+        """
+        Tests the create_namespace method separating engines, schemas and columns
+        """
+        # Method execution
+        namespaces = {DayCache.create_namespace('pandas', False, self.columns),
+                      DayCache.create_namespace('pandas', True, self.columns),
+                      DayCache.create_namespace('arrow', False, self.columns),
+                      DayCache.create_namespace('pandas', False, self.columns[:3])}
+        # Test after method execution
+        self.assertEqual(4, len(namespaces))
+
+    def test_write_day_read_day_memory_mapped(self):
+        """
+        Tests the read_day method opening a cached day without copying it
+        """
+        # Test init
+        self.cache.write_day('2022-03-16', self.df_day)
+        self.cache.write_day('2022-03-19', pd.DataFrame())
+        allocated_before = pa.total_allocated_bytes()
+        # Method execution
+        table = self.cache.read_day('2022-03-16')
+        # Test after method execution
+        self.assertEqual(allocated_before, pa.total_allocated_bytes())
+        self.assertTrue(self.df_day.equals(table.to_pandas()))
+        self.assertTrue(self.cache.has_day('2022-03-19'))
+        self.assertEqual(0, self.cache.read_day('2022-03-19').num_rows)
+        self.assertFalse(self.cache.has_day('2022-03-17'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+""" Test IntermediateStore methods"""
+
+import os
+import tempfile
+import unittest
+
+import pandas as pd
+
+from xetra.common.intermediate import IntermediateStore
+
+
+class TestIntermediateStoreMethods(unittest.TestCase):
+    """
+    Testing the IntermediateStore class
+    """
+
+    def setUp(self):
+        """Setting up the environment"""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.run_id = IntermediateStore.create_run_id('meta.csv', '2022-03-16')
+        self.store = IntermediateStore(self.tmp_dir.name, self.run_id)
+        self.df_day = pd.DataFrame([['AT0000A0E9W5', '2022-03-16', '12:00', 20.19]],
+                                   columns=['ISIN', 'Date', 'Time', 'StartPrice'])
+
+    def tearDown(self):
+        """Executing after unit test"""
+        self.tmp_dir.cleanup()
+
+    def test_create_run_id_stable(self):
+        """
+        Tests the create_run_id method returning the same id for the same run
+        """
+        # Method execution
+        run_id_retry = IntermediateStore.create_run_id('meta.csv', '2022-03-16')
+        run_id_other = IntermediateStore.create_run_id('meta.csv', '2022-03-17')
+        run_id_universe = IntermediateStore.create_run_id('meta.csv', '2022-03-16', 'abc')
+        # Test after method execution
+        self.assertEqual(self.run_id, run_id_retry)
+        self.assertNotEqual(self.run_id, run_id_other)
+        self.assertNotEqual(self.run_id, run_id_universe)
+
+    def test_write_day_read_day(self):
+        """
+        Tests the write_day and read_day methods surviving a new store instance
+        """
+        # Expected results
+        keys_exp = ['2022-03-16/2022-03-16_BINS_XETR12.csv']
+        # Method execution
+        self.store.write_day('2022-03-16', self.df_day, keys_exp)
+        store_retry = IntermediateStore(self.tmp_dir.name, self.run_id)
+        # Test after method execution
+        self.assertTrue(store_retry.has_day('2022-03-16'))
+        self.assertFalse(store_retry.has_day('2022-03-17'))
+        self.assertEqual(keys_exp, store_retry.day_keys('2022-03-16'))
+        self.assertTrue(self.df_day.equals(store_retry.read_day('2022-03-16')))
+
+    def test_write_day_incomplete(self):
+        """
+        Tests the write_day method registering a day that was not closed yet
+        """
+        # Method execution
+        self.store.write_day('2022-03-16', self.df_day, [])
+        self.store.write_day('2022-03-17', self.df_day, [], complete=False)
+        store_retry = IntermediateStore(self.tmp_dir.name, self.run_id)
+        # Test after method execution
+        self.assertTrue(store_retry.is_complete('2022-03-16'))
+        self.assertFalse(store_retry.is_complete('2022-03-17'))
+
+    def test_write_day_empty(self):
+        """
+        Tests the write_day method for a day without source data
+        """
+        # Method execution
+        self.store.write_day('2022-03-17', pd.DataFrame(), [])
+        # Test after method execution
+        self.assertTrue(self.store.has_day('2022-03-17'))
+        self.assertTrue(self.store.read_day('2022-03-17').empty)
+
+    def test_clear(self):
+        """
+        Tests the clear method removing all files of the run
+        """
+        # Test init
+        self.store.write_day('2022-03-16', self.df_day, [])
+        # Method execution
+        self.store.clear()
+        # Test after method execution
+        self.assertFalse(os.path.isdir(self.store.run_dir))
+        self.assertFalse(self.store.has_day('2022-03-16'))
+
+
+if __name__ == '__main__':
+    unittest.main()
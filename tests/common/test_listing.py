@@ -0,0 +1,85 @@
+""" Test ListingManifest methods"""
+from datetime import datetime, timedelta
+import json
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from xetra.common.constants import MetaProcessFormat
+from xetra.common.listing import ListingManifest
+from xetra.common.local_storage import LocalStorageConnector
+
+
+class TestListingManifestMethods(unittest.TestCase):
+    """
+    Testing the ListingManifest class
+    """
+
+    def setUp(self):
+        """Setting up the environment"""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.src_storage = LocalStorageConnector(f'{self.tmp_dir.name}/src')
+        self.trg_storage = LocalStorageConnector(f'{self.tmp_dir.name}/trg')
+        self.today, self.yesterday, self.closed = [
+            (datetime.today().date() - timedelta(days=day)).strftime(
+                MetaProcessFormat.META_DATE_FORMAT.value) for day in range(3)]
+        for date in [self.today, self.yesterday, self.closed]:
+            self.src_storage.write_object('col1\nvalA', f'{date}/{date}_BINS_XETR08.csv')
+        self.manifest_key = 'listing/manifest.json'
+
+    def tearDown(self):
+        """Executing after unit test"""
+        self.tmp_dir.cleanup()
+
+    def _list_all(self, refresh_seconds: int = 0):
+        """Helper function listing all dates with a new manifest instance"""
+        listing = ListingManifest(self.src_storage, self.trg_storage,
+                                  self.manifest_key, refresh_seconds)
+        with patch.object(self.src_storage, 'list_objects_in_prefix',
+                          wraps=self.src_storage.list_objects_in_prefix) as list_mock:
+            files = [listing.list_files(date)
+                     for date in [self.closed, self.yesterday, self.today]]
+        listing.save()
+        return files, [call.args[0] for call in list_mock.call_args_list]
+
+    def test_list_files_closed_dates_cached(self):
+        """
+        Tests the list_files method serving closed dates from the saved manifest
+        and listing today and yesterday live
+        """
+        # Expected results
+        files_exp = [[f'{date}/{date}_BINS_XETR08.csv']
+                     for date in [self.closed, self.yesterday, self.today]]
+        # Test init
+        files_first, listed_first = self._list_all()
+        self.src_storage.write_object('col1\nvalB', f'{self.today}/{self.today}_BINS_XETR09.csv')
+        # Method execution
+        files_second, listed_second = self._list_all()
+        # Test after method execution
+        self.assertEqual(files_exp, files_first)
+        self.assertEqual([self.closed, self.yesterday, self.today], listed_first)
+        self.assertEqual([self.yesterday, self.today], listed_second)
+        self.assertEqual(files_exp[:2] + [files_exp[2] + [
+            f'{self.today}/{self.today}_BINS_XETR09.csv']], files_second)
+        manifest = json.loads(self.trg_storage.read_object(self.manifest_key))
+        self.assertEqual({'size', 'etag'}, set(
+            manifest['dates'][self.today]['objects'][files_exp[2][0]]))
+
+    def test_list_files_refresh(self):
+        """
+        Tests the list_files method serving today and yesterday from the manifest within
+        the refresh time and re-listing dates that were listed while they were open
+        """
+        # Test init
+        self._list_all()
+        manifest = json.loads(self.trg_storage.read_object(self.manifest_key))
+        manifest['dates'][self.closed]['closed'] = False
+        self.trg_storage.write_object(json.dumps(manifest), self.manifest_key)
+        # Method execution
+        _, listed_result = self._list_all(refresh_seconds=3600)
+        # Test after method execution
+        self.assertEqual([self.closed], listed_result)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+""" Test LoadManifest methods"""
+import tempfile
+import unittest
+
+import pandas as pd
+
+from xetra.common.load_manifest import LoadManifest
+from xetra.common.local_storage import LocalStorageConnector
+
+
+class TestLoadManifestMethods(unittest.TestCase):
+    """
+    Testing the LoadManifest class
+    """
+
+    def setUp(self):
+        """Setting up the environment"""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.storage = LocalStorageConnector(self.tmp_dir.name)
+        self.manifest_key = 'meta/load_manifest.json'
+        self.df_report = pd.DataFrame({'ISIN': ['AT0000A0E9W5', 'DE0005190003'],
+                                       'opening_price_eur': [20.21, 80.10]})
+
+    def tearDown(self):
+        """Executing after unit test"""
+        self.tmp_dir.cleanup()
+
+    def test_content_hash(self):
+        """
+        Tests the content_hash method ignoring the index but not the values and types
+        """
+        # Test init
+        hash_exp = LoadManifest.content_hash(self.df_report)
+        # Method execution
+        hash_index = LoadManifest.content_hash(self.df_report.set_index(
+            self.df_report.index + 10))
+        hash_value = LoadManifest.content_hash(
+            self.df_report.assign(opening_price_eur=[20.21, 80.11]))
+        hash_type = LoadManifest.content_hash(self.df_report.astype({'ISIN': 'category'}))
+        # Test after method execution
+        self.assertEqual(hash_exp, hash_index)
+        self.assertNotEqual(hash_exp, hash_value)
+        self.assertNotEqual(hash_exp, hash_type)
+
+    def test_record_is_unchanged(self):
+        """
+        Tests the is_unchanged method with the hashes recorded by another instance
+        """
+        # Test init
+        hashes = {'all': LoadManifest.content_hash(self.df_report)}
+        LoadManifest(self.storage, self.manifest_key).record(
+            'report1/xetra_daily_report1_', hashes, 'report1/xetra_daily_report1_x.parquet')
+        load_manifest = LoadManifest(self.storage, self.manifest_key)
+        # Method execution
+        unchanged = load_manifest.is_unchanged('report1/xetra_daily_report1_', hashes)
+        changed = load_manifest.is_unchanged('report1/xetra_daily_report1_', {'all': 'x'})
+        other_output = load_manifest.is_unchanged('report2/', hashes)
+        # Test after method execution
+        self.assertTrue(unchanged)
+        self.assertFalse(changed)
+        self.assertFalse(other_output)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,207 @@
+""" Test local storage connector methods"""
+
+import json
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+import pandas as pd
+
+from xetra.common.custom_exceptions import (ConcurrentUpdateException, PartialWriteException,
+                                            WrongFormatException)
+from xetra.common.local_storage import LocalStorageConnector
+from xetra.common.meta_process import MetaProcess
+
+
+class TestLocalStorageConnectorMethods(unittest.TestCase):
+    """Testing the local storage connector class"""
+
+    def setUp(self):
+        """Setting up the environment"""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.storage = LocalStorageConnector(self.tmp_dir.name)
+
+    def tearDown(self):
+        """Executing after unit test"""
+        self.tmp_dir.cleanup()
+
+    def test_list_files_in_prefix_ok(self):
+        """
+        Tests the list_files_in_prefix method matching the prefix like S3 does
+        """
+        # Expected results
+        keys_exp = ['2022-03-16/2022-03-16_BINS_XETR12.csv',
+                    '2022-03-16/2022-03-16_BINS_XETR13.csv']
+        # Test init
+        for key in keys_exp + ['2022-03-17/2022-03-17_BINS_XETR12.csv']:
+            self.storage.write_object('col1,col2\nvalA,valB', key)
+        # Method execution
+        list_result = self.storage.list_files_in_prefix('2022-03-16')
+        # Tests after method execution
+        self.assertEqual(keys_exp, list_result)
+        self.assertEqual([], self.storage.list_files_in_prefix('no-prefix/'))
+
+    def test_delete_objects_in_prefix_ok(self):
+        """
+        Tests the delete_objects_in_prefix method deleting the objects of the prefix only
+        """
+        # Expected results
+        keys_exp = ['other/test1.csv']
+        # Test init
+        for key in ['prefix/test1.csv', 'prefix/sub/test2.csv'] + keys_exp:
+            self.storage.write_object('col1', key)
+        # Method execution
+        self.storage.delete_objects_in_prefix('prefix/')
+        # Tests after method execution
+        self.assertEqual(keys_exp, self.storage.list_files_in_prefix(''))
+
+    def test_read_csv_to_df_ok(self):
+        """
+        Tests the read_csv_to_df method reading a memory-mapped csv file
+        """
+        # Expected results
+        key_exp = 'prefix/test.csv'
+        log_exp = f'Reading file {self.storage.location}/{key_exp}'
+        # Test init
+        self.storage.write_object('col1,col2\nval1,val2', key_exp)
+        # Method execution
+        with self.assertLogs() as logm:
+            df_result = self.storage.read_csv_to_df(key_exp)
+            # Log test after method execution
+            self.assertIn(log_exp, logm.output[0])
+        # Test after method execution
+        self.assertEqual(['val1', 'val2'], df_result.iloc[0].tolist())
+
+    def test_read_object_missing_key(self):
+        """
+        Tests the read_object method raising key_not_found_exception for a missing key
+        """
+        # Method execution
+        with self.assertRaises(self.storage.key_not_found_exception):
+            self.storage.read_object('missing.csv')
+
+    def test_write_df_to_s3_parquet(self):
+        """
+        Tests the write_df_to_s3 method writing parquet to the local directory
+        """
+        # Expected results
+        df_exp = pd.DataFrame([['A', 'B'], ['C', 'D']], columns=['col1', 'col2'])
+        key_exp = 'report/test.parquet'
+        # Method execution
+        result = self.storage.write_df_to_s3(df_exp, key_exp, 'parquet')
+        # Test after method execution
+        self.assertTrue(result)
+        self.assertTrue(self.storage.exists(key_exp))
+        self.assertFalse(os.path.exists(os.path.join(self.tmp_dir.name, f'{key_exp}.tmp')))
+        df_result = pd.read_parquet(os.path.join(self.tmp_dir.name, 'report', 'test.parquet'))
+        self.assertTrue(df_exp.equals(df_result))
+        with self.assertRaises(WrongFormatException):
+            self.storage.write_df_to_s3(df_exp, key_exp, 'wrong_format')
+
+    def test_meta_process_local(self):
+        """
+        Tests the MetaProcess methods on the local storage
+        """
+        # Expected results
+        dates_exp = ['2022-03-16', '2022-03-17']
+        # Method execution
+        MetaProcess.update_meta_file(dates_exp, 'meta/meta.csv', self.storage)
+        df_meta_result = self.storage.read_csv_to_df('meta/meta.csv')
+        # Test after method execution
+        self.assertEqual(dates_exp, list(df_meta_result['source_date']))
+
+
+    def test_write_object_if_match_changed(self):
+        """
+        Tests the write_object_if_match method rejecting a write on a changed object
+        """
+        # Expected results
+        body_exp = b'col1\nvalB'
+        # Test init
+        key = 'meta/meta.csv'
+        self.storage.write_object(b'col1\nvalA', key)
+        _, etag = self.storage.read_object_with_etag(key)
+        # Method execution
+        self.storage.write_object_if_match(body_exp, key, etag)
+        # Test after method execution
+        self.assertEqual(body_exp, self.storage.read_object(key))
+        with self.assertRaises(ConcurrentUpdateException):
+            self.storage.write_object_if_match(b'col1\nvalC', key, etag)
+        with self.assertRaises(ConcurrentUpdateException):
+            self.storage.write_object_if_match(b'col1\nvalC', key, None)
+        self.assertEqual(body_exp, self.storage.read_object(key))
+        self.assertEqual([key], self.storage.list_files_in_prefix('meta/'))
+
+    def test_meta_process_local_parallel_runs(self):
+        """
+        Tests the update_meta_file method keeping the dates of parallel runs
+        """
+        # Expected results
+        dates_exp = [f'2022-03-{day:02d}' for day in range(1, 17)]
+        # Test init
+        threads = [threading.Thread(target=MetaProcess.update_meta_file,
+                                    args=([date], 'meta/meta.csv', self.storage))
+                   for date in dates_exp]
+        # Method execution
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # Test after method execution
+        df_meta_result = self.storage.read_csv_to_df('meta/meta.csv')
+        self.assertEqual(dates_exp, sorted(df_meta_result['source_date']))
+
+    def test_write_dfs_to_s3_ok(self):
+        """
+        Tests the write_dfs_to_s3 method writing all non-empty parts and the commit marker
+        """
+        # Expected results
+        keys_exp = [f'report/date=2022-03-{day:02d}/part-0.parquet' for day in range(1, 9)]
+        df_exp = pd.DataFrame({'col1': ['valA', 'valB']})
+        # Test init
+        parts = {key: df_exp for key in keys_exp}
+        parts['report/date=2022-03-09/part-0.parquet'] = pd.DataFrame()
+        # Method execution
+        keys_result = self.storage.write_dfs_to_s3(
+            parts, 'parquet', commit_key='report/_SUCCESS', max_workers=3)
+        # Test after method execution
+        self.assertEqual(keys_exp, keys_result)
+        self.assertEqual(['report/_SUCCESS'] + keys_exp,
+                         sorted(self.storage.list_files_in_prefix('report/')))
+        self.assertEqual({'parts': keys_exp, 'rows': 16},
+                         json.loads(self.storage.read_object('report/_SUCCESS')))
+
+    def test_write_dfs_to_s3_failure(self):
+        """
+        Tests the write_dfs_to_s3 method reporting the failed parts and writing
+        no commit marker
+        """
+        # Expected results
+        failed_key_exp = 'report/date=2022-03-02/part-0.parquet'
+        # Test init
+        keys = [f'report/date=2022-03-{day:02d}/part-0.parquet' for day in range(1, 5)]
+        write_object = self.storage.write_object
+
+        def write_object_failing(body, key):
+            if key == failed_key_exp:
+                raise OSError('No space left on device')
+            return write_object(body, key)
+        # Method execution
+        with patch.object(self.storage, 'write_object', side_effect=write_object_failing), \
+                self.assertLogs(level='ERROR') as logm, \
+                self.assertRaises(PartialWriteException) as context:
+            self.storage.write_dfs_to_s3(
+                {key: pd.DataFrame({'col1': ['valA']}) for key in keys}, 'parquet',
+                commit_key='report/_SUCCESS')
+        # Test after method execution
+        self.assertEqual([failed_key_exp], list(context.exception.failures))
+        self.assertIsInstance(context.exception.failures[failed_key_exp], OSError)
+        self.assertIn(failed_key_exp, logm.output[0])
+        self.assertEqual(sorted(set(keys) - {failed_key_exp}),
+                         sorted(self.storage.list_files_in_prefix('report/')))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,12 +4,13 @@ from datetime import datetime, timedelta
 from io import StringIO
 import os
 import unittest
+from unittest.mock import patch
 
 import boto3
 import pandas as pd
-from moto import mock_s3
+from moto import mock_aws
 from xetra.common.constants import MetaProcessFormat
-from xetra.common.custom_exceptions import WrongMetaFileException
+from xetra.common.custom_exceptions import ConcurrentUpdateException, WrongMetaFileException
 from xetra.common.meta_process import MetaProcess
 
 from xetra.common.s3 import S3BucketConnector
@@ -22,7 +23,7 @@ class TestMetaProcessMethods(unittest.TestCase):
 
     def setUp(self):
         # Mocking S3 connection start
-        self.mock_s3 = mock_s3()
+        self.mock_s3 = mock_aws()
         self.mock_s3.start()
         # Defining the class arguments
         self.s3_access_key = 'AWS_ACCESS_KEY_ID'
@@ -184,6 +185,61 @@ class TestMetaProcessMethods(unittest.TestCase):
             }
         )
 
+    def test_update_meta_file_concurrent_update(self):
+        """
+        Tests the update_meta_file method merging the dates of a run that updated
+        the meta file in the meantime
+        """
+        # Expected results
+        date_list_other = ['2022-03-15', '2022-03-16']
+        date_list_new = ['2022-03-21', '2022-03-22']
+        date_list_exp = date_list_other + date_list_new
+        log_exp = 'The meta file meta.csv was updated by another run, retrying'
+        # Test init
+        meta_key = 'meta.csv'
+        meta_content_other = (
+            f'{MetaProcessFormat.META_SOURCE_DATE_COL.value},'
+            f'{MetaProcessFormat.META_PROCESS_COL.value}\n'
+            f'{date_list_other[0]},2022-03-16 10:00:00\n'
+            f'{date_list_other[1]},2022-03-16 10:00:00\n')
+        write_object_if_match = self.s3_bucket_meta.write_object_if_match
+
+        def write_after_other_run(body, key, etag):
+            """Failing the first write as another run wrote the meta file before"""
+            if etag is None:
+                self.s3_bucket.put_object(Body=meta_content_other, Key=key)
+                raise ConcurrentUpdateException
+            return write_object_if_match(body, key, etag)
+
+        # Method Execution
+        with patch.object(self.s3_bucket_meta, 'write_object_if_match',
+                          side_effect=write_after_other_run) as mock:
+            with self.assertLogs() as logm:
+                MetaProcess.update_meta_file(date_list_new, meta_key, self.s3_bucket_meta)
+        # Test after method execution
+        self.assertIn(log_exp, '\n'.join(logm.output))
+        self.assertEqual(2, mock.call_count)
+        df_meta_result = pd.read_csv(StringIO(self.s3_bucket.Object(key=meta_key).get().get(
+            'Body').read().decode('utf-8')))
+        self.assertEqual(date_list_exp, list(
+            df_meta_result[MetaProcessFormat.META_SOURCE_DATE_COL.value]))
+
+    def test_update_meta_file_retries_exhausted(self):
+        """
+        Tests the update_meta_file method raising ConcurrentUpdateException when every
+        conditional write fails
+        """
+        # Expected results
+        calls_exp = MetaProcessFormat.META_UPDATE_RETRIES.value
+        # Method Execution
+        with patch.object(self.s3_bucket_meta, 'write_object_if_match',
+                          side_effect=ConcurrentUpdateException) as mock, \
+                patch('xetra.common.meta_process.time.sleep'):
+            with self.assertRaises(ConcurrentUpdateException):
+                MetaProcess.update_meta_file(['2022-03-21'], 'meta.csv', self.s3_bucket_meta)
+        # Test after method execution
+        self.assertEqual(calls_exp, mock.call_count)
+
     def test_return_date_list_no_meta_file(self):
         """
         Tests the return_date_list method when there is no meta file
@@ -0,0 +1,66 @@
+""" Test RunMetrics methods"""
+
+import json
+import unittest
+
+from xetra.common.metrics import RunMetrics
+
+
+class TestRunMetricsMethods(unittest.TestCase):
+    """
+    Testing the RunMetrics class
+    """
+
+    def test_disabled(self):
+        """
+        Tests that nothing is collected when the instrumentation is disabled
+        """
+        # Test init
+        metrics = RunMetrics()
+        # Method execution
+        with metrics.stage('extract'):
+            with metrics.s3_call('GET') as call:
+                call.nbytes = 100
+        metrics.add_rows('extract', 0, 10)
+        # Test after method execution
+        self.assertEqual({}, metrics.stages)
+        self.assertEqual({}, metrics.s3_calls)
+        self.assertEqual({}, metrics.rows)
+
+    def test_stage_and_s3_call(self):
+        """
+        Tests the stage and s3_call methods accumulating calls, times and bytes
+        """
+        # Test init
+        metrics = RunMetrics(enabled=True)
+        # Method execution
+        with metrics.stage('extract'):
+            for nbytes in [100, 250]:
+                with metrics.s3_call('GET') as call:
+                    call.nbytes = nbytes
+        metrics.add_rows('extract', 0, 10)
+        # Test after method execution
+        self.assertEqual(1, metrics.stages['extract']['count'])
+        self.assertGreaterEqual(metrics.stages['extract']['wall_s'], 0.0)
+        self.assertEqual(2, metrics.s3_calls['GET']['count'])
+        self.assertEqual(350, metrics.s3_calls['GET']['bytes'])
+        self.assertEqual({'rows_in': 0, 'rows_out': 10}, metrics.rows['extract'])
+
+    def test_report(self):
+        """
+        Tests the report method returning a JSON serializable run report
+        """
+        # Test init
+        metrics = RunMetrics(enabled=True)
+        with metrics.stage('load'):
+            pass
+        # Method execution
+        report = json.loads(json.dumps(metrics.report()))
+        # Test after method execution
+        self.assertIn('load', report['stages'])
+        self.assertGreater(report['peak_rss_mb'], 0)
+        self.assertIn('cpu_s', report['stages']['load'])
+
+
+if __name__ == '__main__':
+    unittest.main()
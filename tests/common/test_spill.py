@@ -0,0 +1,81 @@
+"""Test SpillStore Methods"""
+
+import os
+import tempfile
+import unittest
+
+import pandas as pd
+import pyarrow as pa
+
+from xetra.common.spill import SpillStore
+
+
+class TestSpillStoreMethods(unittest.TestCase):
+    """
+    Testing the SpillStore class
+    """
+
+    def setUp(self):
+        """Setting up the environment"""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.df_src = pd.DataFrame({
+            'ISIN': ['AT0000A0E9W5', 'DE000BAY0017', 'AT0000A0E9W5', 'DE0005190003'],
+            'Time': ['08:00', '08:00', '09:00', '10:00'],
+            'TradedVolume': [1, 2, 3, 4]})
+
+    def tearDown(self):
+        """Executing after unit test"""
+        self.tmp_dir.cleanup()
+
+    def test_append_read_partitions(self):
+        """
+        Tests the append and read_partitions methods keeping the rows of a key together
+        """
+        # Test init
+        spill_store = SpillStore('ISIN', 4, self.tmp_dir.name)
+        # Method execution
+        spill_store.append(self.df_src.loc[0:1])
+        spill_store.append(pa.Table.from_pandas(self.df_src.loc[2:3], preserve_index=False))
+        spill_store.append(self.df_src.loc[0:-1])
+        partitions = [pd.concat([table.to_pandas() for table in partition], ignore_index=True)
+                      for partition in spill_store.read_partitions()]
+        # Test after method execution
+        self.assertEqual(2, spill_store.spills)
+        self.assertEqual(4, spill_store.rows)
+        self.assertEqual(4, sum(len(partition) for partition in partitions))
+        for isin, df_isin in self.df_src.groupby('ISIN'):
+            df_partition = [partition for partition in partitions
+                            if isin in set(partition['ISIN'])]
+            self.assertEqual(1, len(df_partition))
+            self.assertEqual(list(df_isin['Time']),
+                             list(df_partition[0].loc[df_partition[0]['ISIN'] == isin, 'Time']))
+
+    def test_clear(self):
+        """
+        Tests the clear method removing the spill files
+        """
+        # Test init
+        spill_store = SpillStore('ISIN', 2, self.tmp_dir.name)
+        spill_store.append(self.df_src)
+        # Method execution
+        spill_store.clear()
+        # Test after method execution
+        self.assertFalse(os.path.exists(spill_store.spill_dir))
+        self.assertEqual([], list(spill_store.read_partitions()))
+
+    def test_nbytes(self):
+        """
+        Tests the nbytes method for Pandas DataFrames and Arrow tables
+        """
+        # Test init
+        table = pa.Table.from_pandas(self.df_src, preserve_index=False)
+        # Method execution
+        nbytes_df = SpillStore.nbytes(self.df_src)
+        nbytes_table = SpillStore.nbytes(table)
+        # Test after method execution
+        self.assertEqual(int(self.df_src.memory_usage(deep=True).sum()), nbytes_df)
+        self.assertEqual(table.nbytes, nbytes_table)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,11 +3,12 @@
 from io import BytesIO, StringIO
 import os
 import unittest
+from unittest.mock import patch
 
 import boto3
 import pandas as pd
-from moto import mock_s3
-from xetra.common.custom_exceptions import WrongFormatException
+from moto import mock_aws
+from xetra.common.custom_exceptions import ConcurrentUpdateException, WrongFormatException
 
 from xetra.common.s3 import S3BucketConnector
 
@@ -18,7 +19,7 @@ class TestS3BucketConnectorMethods(unittest.TestCase):
     def setUp(self):
         """Setting up the environment"""
         # Mocking S3 connection start
-        self.mock_s3 = mock_s3()
+        self.mock_s3 = mock_aws()
         self.mock_s3.start()
         # Defining the class arguments
         self.s3_access_key = 'AWS_ACCESS_KEY_ID'
@@ -89,6 +90,34 @@ class TestS3BucketConnectorMethods(unittest.TestCase):
         # Tests after method execution
         self.assertTrue(not list_result)
 
+    def test_list_file_sizes_in_prefix_ok(self):
+        """
+        Tests the list_file_sizes_in_prefix method returning the object sizes
+        """
+        # Expected Results
+        sizes_exp = {'prefix/test1.csv': 9, 'prefix/test2.csv': 4}
+        # Test init
+        self.s3_bucket.put_object(Body='col1\nvalA', Key='prefix/test1.csv')
+        self.s3_bucket.put_object(Body='col1', Key='prefix/test2.csv')
+        # Method execution
+        sizes_result = self.s3_bucket_conn.list_file_sizes_in_prefix('prefix/')
+        # Tests after method execution
+        self.assertEqual(sizes_exp, sizes_result)
+
+    def test_delete_objects_in_prefix_ok(self):
+        """
+        Tests the delete_objects_in_prefix method deleting the objects of the prefix only
+        """
+        # Expected Results
+        keys_exp = ['other/test1.csv']
+        # Test init
+        for key in ['prefix/test1.csv', 'prefix/sub/test2.csv'] + keys_exp:
+            self.s3_bucket.put_object(Body='col1', Key=key)
+        # Method execution
+        self.s3_bucket_conn.delete_objects_in_prefix('prefix/')
+        # Tests after method execution
+        self.assertEqual(keys_exp, self.s3_bucket_conn.list_files_in_prefix(''))
+
     def test_read_csv_to_df_ok(self):
         """
         Tests the read_csv_to_df method for reading 1 .csv file from the mocked S3 bucket
@@ -234,5 +263,54 @@ class TestS3BucketConnectorMethods(unittest.TestCase):
             self.assertIn(log_exp, logm.output[0])
 
 
+    def test_write_object_if_match_conditions(self):
+        """
+        Tests the write_object_if_match method writing with the ETag of the read object
+        and raising ConcurrentUpdateException if the object was changed or created since
+        """
+        # Expected Results
+        key_exp = 'meta.csv'
+        body_exp = b'col1\nval1'
+        # Test init
+        self.s3_bucket.put_object(Body=b'col1', Key=key_exp)
+        _, etag = self.s3_bucket_conn.read_object_with_etag(key_exp)
+        # Method Execution
+        self.s3_bucket_conn.write_object_if_match(body_exp, key_exp, etag)
+        self.s3_bucket_conn.write_object_if_match(b'col1', 'new.csv', None)
+        # Test after method execution
+        self.assertEqual(body_exp, self.s3_bucket_conn.read_object(key_exp))
+        self.assertEqual(b'col1', self.s3_bucket_conn.read_object('new.csv'))
+        # The ETag is stale after the first write, new.csv exists already
+        with self.assertRaises(ConcurrentUpdateException):
+            self.s3_bucket_conn.write_object_if_match(b'col1\nval2', key_exp, etag)
+        with self.assertRaises(ConcurrentUpdateException):
+            self.s3_bucket_conn.write_object_if_match(b'col1\nval2', 'new.csv', None)
+        self.assertEqual(body_exp, self.s3_bucket_conn.read_object(key_exp))
+
+    def test_write_dfs_to_s3_ok(self):
+        """
+        Tests the write_dfs_to_s3 method uploading the parts concurrently and the
+        commit marker last
+        """
+        # Expected results
+        keys_exp = [f'report/date=2022-03-{day:02d}/part-0.parquet' for day in range(1, 9)]
+        df_exp = pd.DataFrame([['A', 'B'], ['C', 'D']], columns=['col1', 'col2'])
+        # Method execution
+        with patch.object(self.s3_bucket_conn._client, 'put_object',
+                          wraps=self.s3_bucket_conn._client.put_object) as put_mock:
+            keys_result = self.s3_bucket_conn.write_dfs_to_s3(
+                {key: df_exp for key in keys_exp}, 'parquet', commit_key='report/_SUCCESS',
+                max_workers=4)
+        # Test after method execution
+        self.assertEqual(keys_exp, keys_result)
+        # The threads upload with the thread-safe client, not the shared resource
+        self.assertEqual(len(keys_exp) + 1, put_mock.call_count)
+        for key in keys_exp:
+            data = self.s3_bucket.Object(key=key).get().get('Body').read()
+            self.assertTrue(df_exp.equals(pd.read_parquet(BytesIO(data))))
+        marker = self.s3_bucket.Object(key='report/_SUCCESS').get().get('Body').read()
+        self.assertIn(keys_exp[-1], marker.decode('utf-8'))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,121 @@
+"""Test XetraPartialAggregates Methods"""
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from xetra.transformations.xetra_aggregations import XetraPartialAggregates
+from xetra.transformations.xetra_transformations import XetraSourceConfig, XetraTargetConfig
+
+
+class TestXetraPartialAggregatesMethods(unittest.TestCase):
+    """
+    Testing the XetraPartialAggregates class
+    """
+
+    def setUp(self):
+        """Setting up the environment"""
+        self.source_config = XetraSourceConfig(
+            src_first_extract_date='2022-03-01',
+            src_columns=['ISIN', 'Mnemonic', 'Date', 'Time', 'StartPrice', 'EndPrice',
+                         'MinPrice', 'MaxPrice', 'TradedVolume'],
+            src_col_date='Date',
+            src_col_isin='ISIN',
+            src_col_time='Time',
+            src_col_start_price='StartPrice',
+            src_col_end_price='EndPrice',
+            src_col_min_price='MinPrice',
+            src_col_max_price='MaxPrice',
+            src_col_traded_vol='TradedVolume')
+        self.target_config = XetraTargetConfig(
+            trg_col_isin='isin',
+            trg_col_date='date',
+            trg_col_op_price='opening_price_eur',
+            trg_col_clos_price='closing_price_eur',
+            trg_col_min_price='minimum_price_eur',
+            trg_col_max_price='maximum_price_eur',
+            trg_col_daily_trad_vol='daily_traded_volume',
+            trg_col_ch_prev_clos='change_prev_closing_%',
+            trg_key='report1/xetra_daily_report1',
+            trg_key_date_format='%Y%m%d_%H%M%S',
+            trg_format='parquet')
+        data = [
+            ['AT0000A0E9W5', 'SANT', '2022-03-17', '13:00', 20.21, 18.27, 18.21, 20.42, 633],
+            ['DE0005190003', 'BMW', '2022-03-17', '08:00', 80.10, 80.50, 79.90, 80.70, 120],
+            ['AT0000A0E9W5', 'SANT', '2022-03-17', '14:00', 18.27, 21.19, 18.27, 21.34, 455],
+            ['DE0005190003', 'BMW', '2022-03-17', '09:00', 80.50, 81.00, 80.40, 81.20, 300],
+            ['AT0000A0E9W5', 'SANT', '2022-03-18', '07:00', 20.58, 19.27, 18.89, 20.58, 9066],
+            ['AT0000A0E9W5', 'SANT', '2022-03-18', '08:00', 19.27, 21.14, 19.27, 21.14, 1220]]
+        self.df_src = pd.DataFrame(data, columns=self.source_config.src_columns)
+
+    def test_from_source(self):
+        """
+        Tests the from_source method aggregating per ISIN and day
+        """
+        # Method execution
+        df_result = XetraPartialAggregates.from_source(
+            self.df_src, self.source_config, self.target_config)
+        # Test after method execution
+        self.assertEqual(3, df_result.shape[0])
+        self.assertEqual(['13:00', 20.21, '14:00', 21.19, 18.21, 21.34, 1088],
+                         df_result.iloc[0, 2:].tolist())
+
+    def test_merge_split_source(self):
+        """
+        Tests the merge method returning the aggregates of the whole source data
+        """
+        # Expected results
+        df_exp = XetraPartialAggregates.from_source(
+            self.df_src, self.source_config, self.target_config)
+        # Test init
+        partials = [XetraPartialAggregates.from_source(
+            self.df_src.loc[[index]], self.source_config, self.target_config)
+            for index in reversed(self.df_src.index)]
+        # Method execution
+        df_result = XetraPartialAggregates.merge(
+            partials, self.source_config, self.target_config)
+        # Test after method execution
+        self.assertTrue(df_exp.equals(df_result))
+
+    def test_merge_empty(self):
+        """
+        Tests the merge method with empty partial aggregates only
+        """
+        # Method execution
+        df_result = XetraPartialAggregates.merge(
+            [pd.DataFrame()], self.source_config, self.target_config)
+        # Test after method execution
+        self.assertTrue(df_result.empty)
+
+    def test_change_prev_close(self):
+        """
+        Tests the change_prev_close method against a groupby shift per ISIN
+        """
+        # Test init
+        rng = np.random.default_rng(42)
+        df_input = pd.DataFrame({
+            'ISIN': np.sort(rng.choice(['AT0000A0E9W5', 'DE0005190003', 'DE0007100000'], 50)),
+            'op_price': rng.uniform(10, 100, 50)})
+        prev_price = df_input.groupby('ISIN')['op_price'].shift(1)
+        change_exp = ((df_input['op_price'] - prev_price) / prev_price * 100).to_numpy()
+        # Method execution
+        change_result = XetraPartialAggregates.change_prev_close(
+            df_input['ISIN'].to_numpy(), df_input['op_price'].to_numpy())
+        # Test after method execution
+        np.testing.assert_array_equal(change_exp, change_result)
+        self.assertEqual(3, np.isnan(change_result).sum())
+
+    def test_change_prev_close_empty(self):
+        """
+        Tests the change_prev_close method without aggregates
+        """
+        # Method execution
+        change_result = XetraPartialAggregates.change_prev_close(
+            np.array([], dtype=object), np.array([]))
+        # Test after method execution
+        self.assertEqual(0, len(change_result))
+
+
+if __name__ == '__main__':
+    unittest.main()
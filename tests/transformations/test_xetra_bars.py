@@ -0,0 +1,125 @@
+"""Test XetraIntradayBars Methods"""
+
+import unittest
+
+import pandas as pd
+
+from xetra.common.custom_exceptions import WrongFormatException
+from xetra.transformations.xetra_bars import XetraIntradayBars
+from xetra.transformations.xetra_transformations import XetraSourceConfig, XetraTargetConfig
+
+
+class TestXetraIntradayBarsMethods(unittest.TestCase):
+    """
+    Testing the XetraIntradayBars class
+    """
+
+    def setUp(self):
+        """Setting up the environment"""
+        self.source_config = XetraSourceConfig(
+            src_first_extract_date='2022-03-01',
+            src_columns=['ISIN', 'Mnemonic', 'Date', 'Time', 'StartPrice', 'EndPrice',
+                         'MinPrice', 'MaxPrice', 'TradedVolume'],
+            src_col_date='Date',
+            src_col_isin='ISIN',
+            src_col_time='Time',
+            src_col_start_price='StartPrice',
+            src_col_end_price='EndPrice',
+            src_col_min_price='MinPrice',
+            src_col_max_price='MaxPrice',
+            src_col_traded_vol='TradedVolume')
+        self.target_config = XetraTargetConfig(
+            trg_col_isin='isin',
+            trg_col_date='date',
+            trg_col_op_price='opening_price_eur',
+            trg_col_clos_price='closing_price_eur',
+            trg_col_min_price='minimum_price_eur',
+            trg_col_max_price='maximum_price_eur',
+            trg_col_daily_trad_vol='daily_traded_volume',
+            trg_col_ch_prev_clos='change_prev_closing_%',
+            trg_key='bars/xetra_intraday_bars',
+            trg_key_date_format='%Y%m%d_%H%M%S',
+            trg_format='parquet',
+            trg_bar_resolutions=(15, 1, 5))
+        columns_src = ['ISIN', 'Mnemonic', 'Date', 'Time', 'StartPrice',
+                       'EndPrice', 'MinPrice', 'MaxPrice', 'TradedVolume']
+        data = [
+            ['AT0000A0E9W5', 'SANT', '2022-03-15', '08:07', 20.31, 20.40, 20.30, 20.42, 300],
+            ['AT0000A0E9W5', 'SANT', '2022-03-15', '08:01', 20.19, 20.25, 20.15, 20.33, 100],
+            ['AT0000A0E9W5', 'SANT', '2022-03-15', '08:02', 20.25, 20.30, 20.20, 20.35, 200],
+            ['AT0000A0E9W5', 'SANT', '2022-03-15', '08:16', 20.40, 20.10, 20.05, 20.41, 400],
+            ['DE000BAY0017', 'BAYN', '2022-03-15', '08:01', 52.36, 52.40, 52.32, 52.40, 50],
+            ['DE000BAY0017', 'BAYN', '2022-03-15', '08:01', 52.40, 52.50, 52.40, 52.55, 70],
+            ['AT0000A0E9W5', 'SANT', '2022-03-16', '08:03', 21.00, 21.10, 20.90, 21.20, 500],
+            ['AT0000A0E9W5', 'SANT', '2022-03-16', None, 21.00, 21.10, 20.90, 21.20, 500]]
+        self.df_src = pd.DataFrame(data, columns=columns_src)
+
+    def test_from_source_ok(self):
+        """
+        Tests the from_source method creating the bars of all resolutions
+        """
+        # Expected results
+        columns_exp = ['resolution_min', 'ISIN', 'Date', 'Time', 'opening_price_eur',
+                       'maximum_price_eur', 'minimum_price_eur', 'closing_price_eur',
+                       'traded_volume']
+        data_exp = [
+            [1, 'AT0000A0E9W5', '2022-03-15', '08:01', 20.19, 20.33, 20.15, 20.25, 100],
+            [1, 'AT0000A0E9W5', '2022-03-15', '08:02', 20.25, 20.35, 20.20, 20.30, 200],
+            [1, 'AT0000A0E9W5', '2022-03-15', '08:07', 20.31, 20.42, 20.30, 20.40, 300],
+            [1, 'AT0000A0E9W5', '2022-03-15', '08:16', 20.40, 20.41, 20.05, 20.10, 400],
+            [1, 'AT0000A0E9W5', '2022-03-16', '08:03', 21.00, 21.20, 20.90, 21.10, 500],
+            [1, 'DE000BAY0017', '2022-03-15', '08:01', 52.36, 52.55, 52.32, 52.50, 120],
+            [5, 'AT0000A0E9W5', '2022-03-15', '08:00', 20.19, 20.35, 20.15, 20.30, 300],
+            [5, 'AT0000A0E9W5', '2022-03-15', '08:05', 20.31, 20.42, 20.30, 20.40, 300],
+            [5, 'AT0000A0E9W5', '2022-03-15', '08:15', 20.40, 20.41, 20.05, 20.10, 400],
+            [5, 'AT0000A0E9W5', '2022-03-16', '08:00', 21.00, 21.20, 20.90, 21.10, 500],
+            [5, 'DE000BAY0017', '2022-03-15', '08:00', 52.36, 52.55, 52.32, 52.50, 120],
+            [15, 'AT0000A0E9W5', '2022-03-15', '08:00', 20.19, 20.42, 20.15, 20.40, 600],
+            [15, 'AT0000A0E9W5', '2022-03-15', '08:15', 20.40, 20.41, 20.05, 20.10, 400],
+            [15, 'AT0000A0E9W5', '2022-03-16', '08:00', 21.00, 21.20, 20.90, 21.10, 500],
+            [15, 'DE000BAY0017', '2022-03-15', '08:00', 52.36, 52.55, 52.32, 52.50, 120]]
+        df_exp = pd.DataFrame(data_exp, columns=columns_exp)
+        # Method execution
+        df_result = XetraIntradayBars.from_source(
+            self.df_src, self.source_config, self.target_config)
+        # Test after method execution
+        self.assertTrue(df_exp.equals(df_result))
+
+    def test_from_source_not_multiple(self):
+        """
+        Tests the from_source method with a resolution that is no multiple of a finer one
+        """
+        # Expected results
+        data_exp = [[7, 'AT0000A0E9W5', '2022-03-15', '07:56', 20.19, 20.35, 20.15, 20.30, 300],
+                    [7, 'AT0000A0E9W5', '2022-03-15', '08:03', 20.31, 20.42, 20.30, 20.40, 300]]
+        # Test init
+        target_config = self.target_config._replace(trg_bar_resolutions=(5, 7))
+        # Method execution
+        df_result = XetraIntradayBars.from_source(
+            self.df_src.loc[0:2], self.source_config, target_config)
+        # Test after method execution
+        self.assertEqual(data_exp, df_result[df_result['resolution_min'] == 7].values.tolist())
+
+    def test_from_source_emptydf(self):
+        """
+        Tests the from_source method with source data without complete rows
+        """
+        # Method execution
+        df_result = XetraIntradayBars.from_source(
+            self.df_src.loc[7:7], self.source_config, self.target_config)
+        # Test after method execution
+        self.assertTrue(df_result.empty)
+
+    def test_from_source_wrong_time_format(self):
+        """
+        Tests the from_source method with times that are not in the HH:MM format
+        """
+        # Test init
+        df_input = self.df_src.assign(Time='08:01:30')
+        # Method execution
+        with self.assertRaises(WrongFormatException):
+            XetraIntradayBars.from_source(df_input, self.source_config, self.target_config)
+
+
+if __name__ == '__main__':
+    unittest.main()
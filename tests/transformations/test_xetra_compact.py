@@ -0,0 +1,120 @@
+"""Test XetraCompactSchema Methods"""
+
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from xetra.transformations.xetra_compact import XetraCompactSchema
+from xetra.transformations.xetra_transformations import XetraSourceConfig
+
+
+class TestXetraCompactSchemaMethods(unittest.TestCase):
+    """
+    Testing the XetraCompactSchema class
+    """
+
+    def setUp(self):
+        """Setting up the environment"""
+        self.source_config = XetraSourceConfig(
+            src_first_extract_date='2022-03-01',
+            src_columns=['ISIN', 'Mnemonic', 'Date', 'Time', 'StartPrice', 'EndPrice',
+                         'MinPrice', 'MaxPrice', 'TradedVolume'],
+            src_col_date='Date',
+            src_col_isin='ISIN',
+            src_col_time='Time',
+            src_col_start_price='StartPrice',
+            src_col_end_price='EndPrice',
+            src_col_min_price='MinPrice',
+            src_col_max_price='MaxPrice',
+            src_col_traded_vol='TradedVolume')
+        columns_src = ['ISIN', 'Mnemonic', 'SecurityDesc', 'Date', 'Time', 'StartPrice',
+                       'EndPrice', 'MinPrice', 'MaxPrice', 'TradedVolume']
+        data = [
+            ['DE000BAY0017', 'BAYN', 'BAYER AG', '2022-03-15',
+                '08:00', 52.36, 52.4, 52.32, 52.4, 1280],
+            ['AT0000A0E9W5', 'SANT', 'S+T AG', '2022-03-15',
+                '09:01', 20.1234, 1563.18, 18.2, 20.33, 877],
+            ['AT0000A0E9W5', 'SANT', 'S+T AG', '2022-03-15',
+                '23:59', 18.27, 21.19, 0.0005, 21.34, 987],
+            ['AT0000A0E9W5', 'SANT', 'S+T AG', '2022-03-15',
+                None, 18.27, 21.19, 18.27, 21.34, 455]]
+        self.df_src = pd.DataFrame(data, columns=columns_src)
+
+    def test_compact_ok(self):
+        """
+        Tests the compact method converting the source data into the compact schema
+        """
+        # Expected results
+        dtypes_exp = {'ISIN': 'category', 'Mnemonic': 'category', 'Date': 'int32',
+                      'Time': 'int16', 'StartPrice': 'float32', 'EndPrice': 'float32',
+                      'MinPrice': 'float32', 'MaxPrice': 'float32', 'TradedVolume': 'int64'}
+        time_exp = [480, 541, 1439]
+        date_exp = [19066] * 3
+        # Method execution
+        df_result = XetraCompactSchema.compact(self.df_src, self.source_config)
+        # Test after method execution
+        self.assertEqual(dtypes_exp, df_result.dtypes.astype(str).to_dict())
+        self.assertEqual(time_exp, list(df_result['Time']))
+        self.assertEqual(date_exp, list(df_result['Date']))
+
+    def test_compact_lossy_price(self):
+        """
+        Tests the compact method keeping float64 prices that can not be restored exactly
+        """
+        # Test init
+        df_input = self.df_src.copy()
+        df_input.loc[0, 'StartPrice'] = 52.123456
+        # Method execution
+        df_result = XetraCompactSchema.compact(df_input, self.source_config)
+        # Test after method execution
+        self.assertEqual(np.float64, df_result['StartPrice'].dtype)
+        self.assertEqual(np.float32, df_result['EndPrice'].dtype)
+
+    def test_compact_already_compact(self):
+        """
+        Tests the compact method with data that is already in the compact schema
+        """
+        # Test init
+        df_exp = XetraCompactSchema.compact(self.df_src, self.source_config)
+        # Method execution
+        df_result = XetraCompactSchema.compact(df_exp, self.source_config)
+        # Test after method execution
+        self.assertTrue(df_exp.equals(df_result))
+
+    def test_restore_ok(self):
+        """
+        Tests the restore method restoring the original column types and values
+        """
+        # Expected results
+        df_exp = self.df_src.loc[0:2, self.source_config.src_columns]
+        # Test init
+        df_input = XetraCompactSchema.compact(self.df_src, self.source_config)
+        # Method execution
+        df_result = XetraCompactSchema.restore(df_input, self.source_config)
+        # Test after method execution
+        self.assertTrue(df_exp.equals(df_result))
+
+    def test_concat_ok(self):
+        """
+        Tests the concat method with DataFrames of different categories and price types
+        """
+        # Expected results
+        categories_exp = ['AT0000A0E9W5', 'DE0005190003', 'DE000BAY0017']
+        # Test init
+        df_input1 = self.df_src.loc[0:1]
+        df_input2 = self.df_src.loc[2:2].assign(ISIN='DE0005190003', EndPrice=21.123456)
+        data_frames = [XetraCompactSchema.compact(df_input1, self.source_config),
+                       XetraCompactSchema.compact(df_input2, self.source_config)]
+        # Method execution
+        df_result = XetraCompactSchema.concat(data_frames)
+        # Test after method execution
+        self.assertEqual(categories_exp, list(df_result['ISIN'].cat.categories))
+        self.assertEqual(['DE000BAY0017', 'AT0000A0E9W5', 'DE0005190003'],
+                         list(df_result['ISIN']))
+        self.assertEqual([52.4, 1563.18, 21.123456], list(df_result['EndPrice']))
+        self.assertEqual(np.float32, df_result['StartPrice'].dtype)
+
+
+if __name__ == '__main__':
+    unittest.main()
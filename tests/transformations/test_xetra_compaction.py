@@ -0,0 +1,131 @@
+"""Test XetraReportCompaction Methods"""
+from io import BytesIO
+import json
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import pandas as pd
+
+from xetra.common.local_storage import LocalStorageConnector
+from xetra.transformations.xetra_compaction import XetraCompactionConfig, XetraReportCompaction
+from xetra.transformations.xetra_transformations import XetraSourceConfig, XetraTargetConfig
+
+
+class TestXetraReportCompactionMethods(unittest.TestCase):
+    """
+    Testing the XetraReportCompaction class
+    """
+
+    def setUp(self):
+        """Setting up the environment"""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.storage = LocalStorageConnector(self.tmp_dir.name)
+        self.source_config = XetraSourceConfig(
+            src_first_extract_date='2022-03-01',
+            src_columns=['ISIN', 'Mnemonic', 'Date', 'Time', 'StartPrice', 'EndPrice',
+                         'MinPrice', 'MaxPrice', 'TradedVolume'],
+            src_col_date='Date',
+            src_col_isin='ISIN',
+            src_col_time='Time',
+            src_col_start_price='StartPrice',
+            src_col_end_price='EndPrice',
+            src_col_min_price='MinPrice',
+            src_col_max_price='MaxPrice',
+            src_col_traded_vol='TradedVolume')
+        self.target_config = XetraTargetConfig(
+            trg_col_isin='isin',
+            trg_col_date='date',
+            trg_col_op_price='opening_price_eur',
+            trg_col_clos_price='closing_price_eur',
+            trg_col_min_price='minimum_price_eur',
+            trg_col_max_price='maximum_price_eur',
+            trg_col_daily_trad_vol='daily_traded_volume',
+            trg_col_ch_prev_clos='change_prev_closing_%',
+            trg_key='report1/xetra_daily_report1',
+            trg_key_date_format='%Y%m%d_%H%M%S',
+            trg_format='parquet')
+        self.compaction_config = XetraCompactionConfig(
+            compact_prefix='report1/compacted/xetra_daily_report1_',
+            manifest_key='meta/compaction_manifest.json')
+        # Runs of 2022-03-31 and 2022-04-01, the second run recomputed 2022-03-31
+        self._write_report('20220331_180000', [
+            ['DE0005190003', '2022-03-31', 80.10],
+            ['AT0000A0E9W5', '2022-03-31', 20.21]])
+        self._write_report('20220401_180000', [
+            ['AT0000A0E9W5', '2022-03-31', 20.25],
+            ['AT0000A0E9W5', '2022-04-01', 20.58]])
+        # Run reports below the target key are not compacted
+        self.storage.write_object(
+            '{}', 'report1/xetra_daily_report120220401_180000_run_report.json')
+
+    def tearDown(self):
+        """Executing after unit test"""
+        self.tmp_dir.cleanup()
+
+    def _write_report(self, run_timestamp: str, rows: list):
+        """Helper function writing the report file of a run"""
+        self.storage.write_df_to_s3(
+            pd.DataFrame(rows, columns=['ISIN', 'Date', 'opening_price_eur']),
+            f'{self.target_config.trg_key}{run_timestamp}{self.target_config.trg_format}',
+            'parquet')
+
+    def _read_bucket(self, bucket: str):
+        """Helper function reading a compacted file"""
+        return pd.read_parquet(BytesIO(self.storage.read_object(
+            f'{self.compaction_config.compact_prefix}{bucket}.parquet'))).values.tolist()
+
+    def _compaction(self):
+        """Helper function creating a new compaction instance"""
+        return XetraReportCompaction(self.storage, self.source_config,
+                                     self.target_config, self.compaction_config)
+
+    def test_compact_newest_run_wins(self):
+        """
+        Tests the compact method writing sorted monthly files with the rows of the newest run
+        """
+        # Expected results
+        march_exp = [['AT0000A0E9W5', '2022-03-31', 20.25],
+                     ['DE0005190003', '2022-03-31', 80.10]]
+        april_exp = [['AT0000A0E9W5', '2022-04-01', 20.58]]
+        # Method execution
+        buckets_result = self._compaction().compact()
+        # Test after method execution
+        self.assertEqual({'2022-03': 2, '2022-04': 1}, buckets_result)
+        self.assertEqual(march_exp, self._read_bucket('2022-03'))
+        self.assertEqual(april_exp, self._read_bucket('2022-04'))
+        manifest = json.loads(self.storage.read_object(self.compaction_config.manifest_key))
+        self.assertEqual(['report1/xetra_daily_report120220331_180000parquet',
+                          'report1/xetra_daily_report120220401_180000parquet'],
+                         manifest['sources'])
+        self.assertEqual(2, manifest['buckets']['2022-03']['rows'])
+
+    def test_compact_incremental(self):
+        """
+        Tests the compact method reading only new report files and rewriting only
+        their time buckets
+        """
+        # Expected results
+        april_exp = [['AT0000A0E9W5', '2022-04-01', 20.60],
+                     ['AT0000A0E9W5', '2022-04-04', 21.00]]
+        # Test init
+        self._compaction().compact()
+        self._write_report('20220404_180000', [
+            ['AT0000A0E9W5', '2022-04-01', 20.60],
+            ['AT0000A0E9W5', '2022-04-04', 21.00]])
+        # Method execution
+        compaction = self._compaction()
+        with patch.object(self.storage, 'write_df_to_s3',
+                          wraps=self.storage.write_df_to_s3) as write_mock:
+            buckets_result = compaction.compact()
+            buckets_noop = self._compaction().compact()
+        # Test after method execution
+        self.assertEqual({'2022-04': 2}, buckets_result)
+        self.assertEqual({}, buckets_noop)
+        self.assertEqual(1, write_mock.call_count)
+        self.assertEqual(april_exp, self._read_bucket('2022-04'))
+        self.assertEqual(2, len(self._read_bucket('2022-03')))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+"""Test XetraOHLCVKernel Methods"""
+from io import StringIO
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import pandas as pd
+
+from benchmarks.xetra_data_generator import XetraDataGenerator, XetraDataGeneratorConfig
+from xetra.common.local_storage import LocalStorageConnector
+from xetra.common.meta_process import MetaProcess
+from xetra.transformations.xetra_compact import XetraCompactSchema
+from xetra.transformations.xetra_kernels import XetraOHLCVKernel
+from xetra.transformations.xetra_transformations import (XetraETL, XetraRunConfig,
+                                                         XetraSourceConfig, XetraTargetConfig)
+
+
+@unittest.skipUnless(XetraOHLCVKernel.available(), 'numba is not installed')
+class TestXetraOHLCVKernelMethods(unittest.TestCase):
+    """
+    Testing the XetraOHLCVKernel class
+    """
+
+    def setUp(self):
+        """Setting up the environment"""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.storage = LocalStorageConnector(self.tmp_dir.name)
+        self.source_config = XetraSourceConfig(
+            src_first_extract_date='2022-03-01',
+            src_columns=['ISIN', 'Mnemonic', 'Date', 'Time', 'StartPrice', 'EndPrice',
+                         'MinPrice', 'MaxPrice', 'TradedVolume'],
+            src_col_date='Date',
+            src_col_isin='ISIN',
+            src_col_time='Time',
+            src_col_start_price='StartPrice',
+            src_col_end_price='EndPrice',
+            src_col_min_price='MinPrice',
+            src_col_max_price='MaxPrice',
+            src_col_traded_vol='TradedVolume')
+        self.target_config = XetraTargetConfig(
+            trg_col_isin='isin',
+            trg_col_date='date',
+            trg_col_op_price='opening_price_eur',
+            trg_col_clos_price='closing_price_eur',
+            trg_col_min_price='minimum_price_eur',
+            trg_col_max_price='maximum_price_eur',
+            trg_col_daily_trad_vol='daily_traded_volume',
+            trg_col_ch_prev_clos='change_prev_closing_%',
+            trg_key='report1/xetra_daily_report1_',
+            trg_key_date_format='%Y%m%d_%H%M%S',
+            trg_format='parquet')
+        generator = XetraDataGenerator(XetraDataGeneratorConfig(
+            isin_count=20, trading_minutes=30, days=3, start_date='2022-03-14'))
+        self.extract_date, *_ = self.extract_date_list = generator.trading_dates()
+        # Shuffled rows with duplicate times, the first and last row per time win,
+        # header-only files are dropped like in the extraction
+        data_frames = [pd.read_csv(StringIO(content)) for _, content in generator.generate()]
+        data_frame = pd.concat([data_frame for data_frame in data_frames
+                                if not data_frame.empty], ignore_index=True)
+        data_frame = pd.concat([data_frame, data_frame.assign(
+            StartPrice=data_frame['StartPrice'] + 1, EndPrice=data_frame['EndPrice'] + 1)])
+        self.df_src = data_frame.sample(frac=1, random_state=42, ignore_index=True)
+
+    def tearDown(self):
+        """Executing after unit test"""
+        self.tmp_dir.cleanup()
+
+    def _transform_report1(self, data_frame: pd.DataFrame, ohlcv_kernel: bool):
+        """Helper function creating report 1 with or without the kernel"""
+        with patch.object(MetaProcess, 'return_date_list',
+                          return_value=[self.extract_date, self.extract_date_list]):
+            xetra_etl = XetraETL(self.storage, self.storage, 'meta.csv', self.source_config,
+                                 self.target_config, XetraRunConfig(ohlcv_kernel=ohlcv_kernel))
+        return xetra_etl.transform_report1(data_frame.copy())
+
+    def test_transform_report1_kernel(self):
+        """
+        Tests the transform_report1 method with the kernel returning the pandas result
+        in the original and the compact schema
+        """
+        for data_frame in [self.df_src, XetraCompactSchema.compact(
+                self.df_src, self.source_config)]:
+            # Expected results
+            df_exp = self._transform_report1(data_frame, ohlcv_kernel=False)
+            # Method execution
+            df_result = self._transform_report1(data_frame, ohlcv_kernel=True)
+            # Test after method execution
+            pd.testing.assert_frame_equal(df_exp, df_result)
+            self.assertEqual(60, len(df_result))
+
+    def test_transform_report1_kernel_unavailable(self):
+        """
+        Tests the transform_report1 method falling back to pandas without numba
+        """
+        # Expected results
+        log_exp = 'numba is not installed, report 1 is aggregated with pandas.'
+        df_exp = self._transform_report1(self.df_src, ohlcv_kernel=False)
+        # Method execution
+        with patch.object(XetraOHLCVKernel, 'available', return_value=False), \
+                self.assertLogs(level='WARNING') as logm:
+            df_result = self._transform_report1(self.df_src, ohlcv_kernel=True)
+        # Test after method execution
+        self.assertIn(log_exp, logm.output[0])
+        pd.testing.assert_frame_equal(df_exp, df_result)
+
+    def test_aggregate(self):
+        """
+        Tests the aggregate method taking the opening and closing price by time
+        """
+        # Test init
+        df_input = pd.DataFrame(
+            [['AT0000A0E9W5', 'SANT', '2022-03-17', '14:00', 18.27, 21.19, 18.27, 21.34, 455],
+             ['AT0000A0E9W5', 'SANT', '2022-03-17', '13:00', 20.21, 18.27, 18.21, 20.42, 633],
+             ['AT0000A0E9W5', 'SANT', '2022-03-18', '07:00', 20.58, 19.27, 18.89, 20.58, 9066]],
+            columns=self.source_config.src_columns)
+        # Method execution
+        df_result = XetraOHLCVKernel.aggregate(df_input, self.source_config, self.target_config)
+        # Test after method execution
+        self.assertEqual([['AT0000A0E9W5', '2022-03-17', 20.21, 21.19, 18.21, 21.34, 1088],
+                          ['AT0000A0E9W5', '2022-03-18', 20.58, 19.27, 18.89, 20.58, 9066]],
+                         df_result.values.tolist())
+
+    def test_aggregate_sorted(self):
+        """
+        Tests the aggregate method returning the groups sorted by ISIN and day, also for
+        categories that are not in sorted order
+        """
+        # Expected results
+        keys_exp = [['AT0000A0E9W5', '2022-03-17'], ['AT0000A0E9W5', '2022-03-18'],
+                    ['DE0005772206', '2022-03-17']]
+        # Test init
+        df_input = pd.DataFrame(
+            [['DE0005772206', 'FPH', '2022-03-17', '08:00', 1.0, 1.0, 1.0, 1.0, 1],
+             ['AT0000A0E9W5', 'SANT', '2022-03-18', '07:00', 2.0, 2.0, 2.0, 2.0, 2],
+             ['AT0000A0E9W5', 'SANT', '2022-03-17', '08:00', 3.0, 3.0, 3.0, 3.0, 3]],
+            columns=self.source_config.src_columns)
+        df_categorical = df_input.assign(ISIN=pd.Categorical(
+            df_input['ISIN'], categories=['DE0005772206', 'AT0000A0E9W5']))
+        for data_frame in [df_input, df_categorical]:
+            # Method execution
+            df_result = XetraOHLCVKernel.aggregate(
+                data_frame, self.source_config, self.target_config)
+            # Test after method execution
+            self.assertEqual(keys_exp, df_result[['ISIN', 'Date']].values.tolist())
+            self.assertEqual([3, 2, 1], df_result['daily_traded_volume'].tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
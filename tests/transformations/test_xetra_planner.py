@@ -0,0 +1,92 @@
+"""Test XetraRunPlanner Methods"""
+from datetime import datetime, timedelta
+import tempfile
+import unittest
+
+from benchmarks.xetra_data_generator import XetraDataGenerator, XetraDataGeneratorConfig
+from xetra.common.local_storage import LocalStorageConnector
+from xetra.transformations.xetra_planner import XetraRunPlanner
+from xetra.transformations.xetra_transformations import (XetraETL, XetraRunConfig,
+                                                         XetraSourceConfig, XetraTargetConfig)
+
+
+class TestXetraRunPlannerMethods(unittest.TestCase):
+    """
+    Testing the XetraRunPlanner class
+    """
+
+    def setUp(self):
+        """Setting up the environment"""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.src_storage = LocalStorageConnector(f'{self.tmp_dir.name}/src')
+        self.trg_storage = LocalStorageConnector(f'{self.tmp_dir.name}/trg')
+        # Recent trading days, so the date list until today stays short
+        start_date = (datetime.today() - timedelta(days=8)).strftime('%Y-%m-%d')
+        self.generator = XetraDataGenerator(XetraDataGeneratorConfig(
+            isin_count=10, days=4, start_date=start_date))
+        self.sources = dict(self.generator.generate())
+        for key, content in self.sources.items():
+            self.src_storage.write_object(content, key)
+        self.trg_storage.write_object(
+            'source_date,datetime_of_processing\n2000-01-01,2000-01-01 00:00:00\n',
+            'meta/meta.csv')
+        self.source_config = XetraSourceConfig(
+            src_first_extract_date=self.generator.trading_dates()[1],
+            src_columns=['ISIN', 'Mnemonic', 'Date', 'Time', 'StartPrice', 'EndPrice',
+                         'MinPrice', 'MaxPrice', 'TradedVolume'],
+            src_col_date='Date',
+            src_col_isin='ISIN',
+            src_col_time='Time',
+            src_col_start_price='StartPrice',
+            src_col_end_price='EndPrice',
+            src_col_min_price='MinPrice',
+            src_col_max_price='MaxPrice',
+            src_col_traded_vol='TradedVolume')
+        self.target_config = XetraTargetConfig(
+            trg_col_isin='isin',
+            trg_col_date='date',
+            trg_col_op_price='opening_price_eur',
+            trg_col_clos_price='closing_price_eur',
+            trg_col_min_price='minimum_price_eur',
+            trg_col_max_price='maximum_price_eur',
+            trg_col_daily_trad_vol='daily_traded_volume',
+            trg_col_ch_prev_clos='change_prev_closing_%',
+            trg_key='report1/xetra_daily_report1_',
+            trg_key_date_format='%Y%m%d_%H%M%S',
+            trg_format='parquet')
+        self.run_config = XetraRunConfig(run_report=True)
+
+    def tearDown(self):
+        """Executing after unit test"""
+        self.tmp_dir.cleanup()
+
+    def test_plan_matches_run(self):
+        """
+        Tests the plan method listing the objects without reading them and
+        predicting the requests of the run
+        """
+        # Test init
+        xetra_etl = XetraETL(self.src_storage, self.trg_storage, 'meta/meta.csv',
+                             self.source_config, self.target_config, self.run_config)
+        keys_exp = [key for key in self.sources
+                    if key.split('/')[0] in xetra_etl.extract_date_list]
+        header_only_exp = [key for key in keys_exp if len(self.sources[key]) <= 136]
+        # Method execution
+        plan = XetraRunPlanner(xetra_etl).plan()
+        # Test after method execution
+        self.assertEqual(1, xetra_etl.metrics.s3_calls['GET']['count'])
+        self.assertEqual(xetra_etl.extract_date_list, plan['dates'])
+        self.assertEqual(len(keys_exp), plan['objects'])
+        self.assertEqual(sum(len(self.sources[key]) for key in keys_exp), plan['bytes'])
+        self.assertEqual(sorted(header_only_exp), sorted(plan['header_only_objects']))
+        self.assertTrue(len(header_only_exp))
+        xetra_etl = XetraETL(self.src_storage, self.trg_storage, 'meta/meta.csv',
+                             self.source_config, self.target_config, self.run_config)
+        xetra_etl.etl_report1()
+        self.assertEqual(plan['requests'], {
+            operation: xetra_etl.metrics.s3_calls[operation]['count']
+            for operation in ['LIST', 'GET', 'PUT']})
+
+
+if __name__ == "__main__":
+    unittest.main()
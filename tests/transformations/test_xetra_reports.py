@@ -0,0 +1,209 @@
+"""Test XetraReportJob Methods"""
+
+from io import BytesIO
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import pandas as pd
+
+from benchmarks.xetra_data_generator import XetraDataGenerator, XetraDataGeneratorConfig
+from xetra.common.custom_exceptions import WrongReportException
+from xetra.common.local_storage import LocalStorageConnector
+from xetra.common.meta_process import MetaProcess
+from xetra.transformations.xetra_reports import XetraReportConfig, XetraReportJob
+from xetra.transformations.xetra_transformations import (XetraETL, XetraRunConfig,
+                                                         XetraSourceConfig, XetraTargetConfig)
+
+
+class TestXetraReportJobMethods(unittest.TestCase):
+    """
+    Testing the XetraReportJob class
+    """
+
+    def setUp(self):
+        """Setting up the environment"""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.src_storage = LocalStorageConnector(f'{self.tmp_dir.name}/src')
+        self.trg_storage = LocalStorageConnector(f'{self.tmp_dir.name}/trg')
+        self.generator = XetraDataGenerator(XetraDataGeneratorConfig(isin_count=20, days=4))
+        for key, content in self.generator.generate():
+            self.src_storage.write_object(content, key)
+        self.dates = self.generator.trading_dates()
+        self.source_config = XetraSourceConfig(
+            src_first_extract_date=self.dates[1],
+            src_columns=['ISIN', 'Mnemonic', 'Date', 'Time', 'StartPrice', 'EndPrice',
+                         'MinPrice', 'MaxPrice', 'TradedVolume'],
+            src_col_date='Date',
+            src_col_isin='ISIN',
+            src_col_time='Time',
+            src_col_start_price='StartPrice',
+            src_col_end_price='EndPrice',
+            src_col_min_price='MinPrice',
+            src_col_max_price='MaxPrice',
+            src_col_traded_vol='TradedVolume')
+        config_dict_trg = {
+            'trg_col_isin': 'isin',
+            'trg_col_date': 'date',
+            'trg_col_op_price': 'opening_price_eur',
+            'trg_col_clos_price': 'closing_price_eur',
+            'trg_col_min_price': 'minimum_price_eur',
+            'trg_col_max_price': 'maximum_price_eur',
+            'trg_col_daily_trad_vol': 'daily_traded_volume',
+            'trg_col_ch_prev_clos': 'change_prev_closing_%',
+            'trg_key_date_format': '%Y%m%d_%H%M%S',
+        }
+        self.report_configs = [
+            XetraReportConfig(
+                name='report1_parquet', report='report1', meta_key='meta/report1_parquet.csv',
+                trg_args=XetraTargetConfig(trg_key='report1_parquet/xetra_daily_report1',
+                                           trg_format='parquet', **config_dict_trg)),
+            XetraReportConfig(
+                name='report1_csv', report='report1', meta_key='meta/report1_csv.csv',
+                trg_args=XetraTargetConfig(trg_key='report1_csv/xetra_daily_report1',
+                                           trg_format='csv', **config_dict_trg))]
+        # Each report has its own meta file and therefore its own dates
+        self.report_dates = {
+            'meta/report1_parquet.csv': [self.dates[1], self.dates[0:3]],
+            'meta/report1_csv.csv': [self.dates[2], self.dates[1:4]],
+        }
+
+    def tearDown(self):
+        """Executing after unit test"""
+        self.tmp_dir.cleanup()
+
+    def _return_date_list(self, first_date, meta_key, s3_bucket_meta):
+        """Helper function returning the dates of the meta file of a report"""
+        return self.report_dates[meta_key]
+
+    def test_run_shared_extract(self):
+        """
+        Tests the run method reading each source file once and writing every report
+        """
+        # Expected results
+        files_exp = len([key for key, _ in self.generator.generate()])
+        # Test init
+        with patch.object(MetaProcess, 'return_date_list', side_effect=self._return_date_list):
+            df_exps = []
+            for report_config in self.report_configs:
+                xetra_etl = XetraETL(self.src_storage, self.trg_storage, report_config.meta_key,
+                                     self.source_config, report_config.trg_args)
+                df_exps.append(xetra_etl.transform_report1(xetra_etl.extract()))
+            report_job = XetraReportJob(self.src_storage, self.trg_storage, self.source_config,
+                                        self.report_configs)
+        # Method execution
+        with patch.object(self.src_storage, 'read_csv_to_df',
+                          wraps=self.src_storage.read_csv_to_df) as read_mock:
+            report_job.run()
+        # Test after method execution
+        self.assertEqual(self.dates, report_job.extract_date_list)
+        self.assertEqual(files_exp, read_mock.call_count)
+        parquet_key = self.trg_storage.list_files_in_prefix('report1_parquet/')[0]
+        df_result = pd.read_parquet(BytesIO(self.trg_storage.read_object(parquet_key)))
+        self.assertTrue(df_exps[0].equals(df_result))
+        csv_key = self.trg_storage.list_files_in_prefix('report1_csv/')[0]
+        df_result = self.trg_storage.read_csv_to_df(csv_key)
+        self.assertEqual(len(df_exps[1]), len(df_result))
+        self.assertEqual(self.dates[2:4], list(df_result['Date'].unique()))
+        for meta_key, (extract_date, extract_date_list) in self.report_dates.items():
+            df_meta = self.trg_storage.read_csv_to_df(meta_key)
+            self.assertEqual([date for date in extract_date_list if date >= extract_date],
+                             list(df_meta['source_date']))
+
+    def test_run_intraday_bars(self):
+        """
+        Tests the run method writing the intraday bars as partitioned parquet files
+        """
+        # Expected results
+        partitions_exp = ['_SUCCESS'] + [
+            f'resolution_min={resolution}/Date={date}/part-0.parquet'
+            for resolution in [1, 15, 5] for date in self.dates[1:3]]
+        # Test init
+        report_config = XetraReportConfig(
+            name='bars', report='intraday_bars', meta_key='meta/report1_parquet.csv',
+            trg_args=self.report_configs[0].trg_args._replace(trg_key='bars/xetra_bars_'))
+        with patch.object(MetaProcess, 'return_date_list', side_effect=self._return_date_list):
+            xetra_etl = XetraETL(self.src_storage, self.trg_storage, report_config.meta_key,
+                                 self.source_config, report_config.trg_args)
+            df_exp = xetra_etl.transform_intraday_bars(xetra_etl.extract())
+            report_job = XetraReportJob(self.src_storage, self.trg_storage, self.source_config,
+                                        [report_config])
+        # Method execution
+        report_job.run()
+        # Test after method execution
+        keys = self.trg_storage.list_files_in_prefix('bars/')
+        self.assertEqual(partitions_exp, [key.split('/', 2)[2] for key in keys])
+        df_result = pd.read_parquet(
+            f'{self.trg_storage.root_dir}/{keys[1].rsplit("/", 3)[0]}')
+        self.assertEqual(len(df_exp), len(df_result))
+        df_meta = self.trg_storage.read_csv_to_df(report_config.meta_key)
+        self.assertEqual(self.dates[1:3], list(df_meta['source_date']))
+
+    def test_run_intermediate_cleared(self):
+        """
+        Tests the run method sharing and removing the intermediate files of the extract
+        """
+        # Test init
+        with tempfile.TemporaryDirectory() as intermediate_dir:
+            with patch.object(MetaProcess, 'return_date_list',
+                              side_effect=self._return_date_list):
+                report_job = XetraReportJob(
+                    self.src_storage, self.trg_storage, self.source_config,
+                    self.report_configs, XetraRunConfig(intermediate_dir=intermediate_dir))
+            # Method execution
+            with patch.object(report_job.intermediate, 'clear') as clear_mock:
+                report_job.run()
+        # Test after method execution
+        clear_mock.assert_called_once()
+        self.assertEqual(self.dates, sorted(report_job.intermediate.manifest['days']))
+        for xetra_etl in report_job.etls:
+            self.assertIs(report_job.intermediate, xetra_etl.intermediate)
+
+    def test_run_intermediate_universe_retry(self):
+        """
+        Tests the run method not reusing the intermediate files of a failed run
+        on another universe
+        """
+        # Expected results
+        isins_exp = sorted(self.generator.isins)
+        # Test init
+        report_configs = self.report_configs[:1]
+        watchlist_config = self.source_config._replace(src_isins=self.generator.isins[:1])
+        with tempfile.TemporaryDirectory() as intermediate_dir:
+            run_config = XetraRunConfig(intermediate_dir=intermediate_dir)
+            with patch.object(MetaProcess, 'return_date_list',
+                              side_effect=self._return_date_list):
+                failed_job = XetraReportJob(self.src_storage, self.trg_storage,
+                                            watchlist_config, report_configs, run_config)
+                report_job = XetraReportJob(self.src_storage, self.trg_storage,
+                                            self.source_config, report_configs, run_config)
+            with patch.object(XetraETL, 'load', side_effect=OSError):
+                with self.assertRaises(OSError):
+                    failed_job.run()
+            # Method execution
+            report_job.run()
+            # Test after method execution
+            self.assertNotEqual(failed_job.intermediate.run_dir, report_job.intermediate.run_dir)
+        parquet_key = self.trg_storage.list_files_in_prefix('report1_parquet/')[0]
+        df_result = pd.read_parquet(BytesIO(self.trg_storage.read_object(parquet_key)))
+        self.assertEqual(isins_exp, sorted(df_result['ISIN'].unique()))
+
+    def test_init_wrong_report(self):
+        """
+        Tests the constructor with a report that is not supported
+        """
+        # Expected results
+        log_exp = 'The report wrong_report is not supported!'
+        # Test init
+        report_config = self.report_configs[0]._replace(report='wrong_report')
+        # Method execution
+        with self.assertLogs() as logm:
+            with self.assertRaises(WrongReportException):
+                XetraReportJob(self.src_storage, self.trg_storage, self.source_config,
+                               [report_config])
+            # Log test after method execution
+            self.assertIn(log_exp, logm.output[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,161 @@
+"""Test XetraRollingState Methods"""
+
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.xetra_data_generator import XetraDataGenerator, XetraDataGeneratorConfig
+from xetra.common.local_storage import LocalStorageConnector
+from xetra.common.meta_process import MetaProcess
+from xetra.transformations.xetra_rolling import XetraRollingState
+from xetra.transformations.xetra_transformations import (XetraETL, XetraSourceConfig,
+                                                         XetraTargetConfig)
+
+
+class TestXetraRollingStateMethods(unittest.TestCase):
+    """
+    Testing the XetraRollingState class
+    """
+
+    def setUp(self):
+        """Setting up the environment"""
+        self.source_config = XetraSourceConfig(
+            src_first_extract_date='2022-03-01',
+            src_columns=['ISIN', 'Mnemonic', 'Date', 'Time', 'StartPrice', 'EndPrice',
+                         'MinPrice', 'MaxPrice', 'TradedVolume'],
+            src_col_date='Date',
+            src_col_isin='ISIN',
+            src_col_time='Time',
+            src_col_start_price='StartPrice',
+            src_col_end_price='EndPrice',
+            src_col_min_price='MinPrice',
+            src_col_max_price='MaxPrice',
+            src_col_traded_vol='TradedVolume')
+        self.target_config = XetraTargetConfig(
+            trg_col_isin='isin',
+            trg_col_date='date',
+            trg_col_op_price='opening_price_eur',
+            trg_col_clos_price='closing_price_eur',
+            trg_col_min_price='minimum_price_eur',
+            trg_col_max_price='maximum_price_eur',
+            trg_col_daily_trad_vol='daily_traded_volume',
+            trg_col_ch_prev_clos='change_prev_closing_%',
+            trg_key='rolling/xetra_rolling_windows',
+            trg_key_date_format='%Y%m%d_%H%M%S',
+            trg_format='parquet',
+            trg_rolling_windows=(2, 3))
+        columns_report = ['ISIN', 'Date', 'closing_price_eur']
+        data_report = [['AT0000A0E9W5', '2022-03-15', 10.0],
+                       ['AT0000A0E9W5', '2022-03-16', 11.0],
+                       ['DE000BAY0017', '2022-03-16', 50.0],
+                       ['AT0000A0E9W5', '2022-03-17', 12.1],
+                       ['AT0000A0E9W5', '2022-03-18', 9.68],
+                       ['DE000BAY0017', '2022-03-18', 55.0]]
+        self.df_report = pd.DataFrame(data_report, columns=columns_report)
+
+    def test_update_ok(self):
+        """
+        Tests the update method computing the moving averages and volatilities
+        """
+        # Expected results
+        columns_exp = ['ISIN', 'Date', 'closing_price_eur', 'moving_avg_2', 'volatility_2',
+                       'moving_avg_3', 'volatility_3']
+        data_exp = [['AT0000A0E9W5', '2022-03-15', 10.0, np.nan, np.nan, np.nan, np.nan],
+                    ['AT0000A0E9W5', '2022-03-16', 11.0, 10.5, np.nan, np.nan, np.nan],
+                    ['AT0000A0E9W5', '2022-03-17', 12.1, 11.55, 0.0, 11.03, np.nan],
+                    ['AT0000A0E9W5', '2022-03-18', 9.68, 10.89, 21.21, 10.93, 17.32],
+                    ['DE000BAY0017', '2022-03-16', 50.0, np.nan, np.nan, np.nan, np.nan],
+                    ['DE000BAY0017', '2022-03-18', 55.0, 52.5, np.nan, np.nan, np.nan]]
+        df_exp = pd.DataFrame(data_exp, columns=columns_exp)
+        # Test init
+        rolling_state = XetraRollingState(4)
+        # Method execution
+        df_result = rolling_state.update(self.df_report, self.source_config, self.target_config)
+        # Test after method execution
+        self.assertTrue(df_exp.equals(df_result))
+        self.assertEqual([4, 2], list(rolling_state.counts))
+
+    def test_update_incremental(self):
+        """
+        Tests the update method day by day against one update with all days
+        """
+        # Test init
+        df_exp = XetraRollingState(4).update(
+            self.df_report, self.source_config, self.target_config)
+        rolling_state = XetraRollingState(4)
+        data_frames = []
+        # Method execution
+        for _, df_day in self.df_report.groupby('Date'):
+            rolling_state = XetraRollingState.from_bytes(rolling_state.to_bytes(), 4)
+            data_frames.append(rolling_state.update(
+                df_day, self.source_config, self.target_config))
+        # Test after method execution
+        df_result = pd.concat(data_frames).sort_values(['ISIN', 'Date'], ignore_index=True)
+        self.assertTrue(df_exp.equals(df_result))
+
+    def test_update_days_already_appended(self):
+        """
+        Tests the update method skipping days that are already in the state
+        """
+        # Test init
+        rolling_state = XetraRollingState(4)
+        rolling_state.update(self.df_report, self.source_config, self.target_config)
+        # Method execution
+        df_result = rolling_state.update(
+            self.df_report.loc[3:5], self.source_config, self.target_config)
+        # Test after method execution
+        self.assertTrue(df_result.empty)
+        self.assertEqual([4, 2], list(rolling_state.counts))
+
+    def test_from_bytes_resized(self):
+        """
+        Tests the from_bytes method enlarging the ring buffers of a persisted state
+        """
+        # Expected results
+        closes_exp = [11.0, 12.1, 9.68, np.nan, np.nan]
+        # Test init
+        rolling_state = XetraRollingState(3)
+        rolling_state.update(self.df_report, self.source_config,
+                             self.target_config._replace(trg_rolling_windows=(2,)))
+        # Method execution
+        rolling_state = XetraRollingState.from_bytes(rolling_state.to_bytes(), 5)
+        # Test after method execution
+        self.assertEqual(5, rolling_state.capacity)
+        self.assertEqual([3, 2], list(rolling_state.counts))
+        np.testing.assert_array_equal(closes_exp, rolling_state.closes[0])
+
+    def test_etl_rolling_windows(self):
+        """
+        Tests the transform and load methods of XetraETL persisting the state between runs
+        """
+        # Test init
+        generator = XetraDataGenerator(XetraDataGeneratorConfig(isin_count=5, days=4))
+        dates = generator.trading_dates()
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            storage = LocalStorageConnector(tmp_dir)
+            for key, content in generator.generate():
+                storage.write_object(content, key)
+            data_frames = []
+            # Method execution
+            for index in range(1, len(dates)):
+                with patch.object(MetaProcess, 'return_date_list',
+                                  return_value=[dates[index], dates[index - 1:index + 1]]):
+                    xetra_etl = XetraETL(storage, storage, 'meta.csv',
+                                         self.source_config, self.target_config)
+                    data_frames.append(
+                        xetra_etl.transform_rolling_windows(xetra_etl.extract()))
+                    xetra_etl.load_rolling_windows(data_frames[-1])
+            state_exists = storage.exists('rolling/xetra_rolling_windowsrolling_state.npz')
+        # Test after method execution
+        self.assertTrue(state_exists)
+        df_result = pd.concat(data_frames, ignore_index=True)
+        self.assertEqual(15, len(df_result))
+        self.assertEqual(5, df_result['moving_avg_3'].notna().sum())
+        self.assertEqual(0, df_result['volatility_3'].notna().sum())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,284 @@
+"""Test XetraShardedRun Methods"""
+from datetime import datetime, timedelta
+from io import BytesIO
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import boto3
+import pandas as pd
+import yaml
+from moto.server import ThreadedMotoServer
+
+from benchmarks.xetra_data_generator import XetraDataGenerator, XetraDataGeneratorConfig
+from xetra.common.custom_exceptions import WrongShardException
+from xetra.common.local_storage import LocalStorageConnector
+from xetra.common.meta_process import MetaProcess
+from xetra.common.s3 import S3BucketConnector
+from xetra.transformations.xetra_engines import create_xetra_etl
+from xetra.transformations.xetra_shards import XetraShardedRun
+from xetra.transformations.xetra_transformations import (XetraETL, XetraRunConfig,
+                                                         XetraSourceConfig, XetraTargetConfig)
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+SOURCE_CONFIG = {
+    'src_columns': ['ISIN', 'Mnemonic', 'Date', 'Time', 'StartPrice', 'EndPrice',
+                    'MinPrice', 'MaxPrice', 'TradedVolume'],
+    'src_col_date': 'Date',
+    'src_col_isin': 'ISIN',
+    'src_col_time': 'Time',
+    'src_col_start_price': 'StartPrice',
+    'src_col_end_price': 'EndPrice',
+    'src_col_min_price': 'MinPrice',
+    'src_col_max_price': 'MaxPrice',
+    'src_col_traded_vol': 'TradedVolume'
+}
+TARGET_CONFIG = {
+    'trg_col_isin': 'isin',
+    'trg_col_date': 'date',
+    'trg_col_op_price': 'opening_price_eur',
+    'trg_col_clos_price': 'closing_price_eur',
+    'trg_col_min_price': 'minimum_price_eur',
+    'trg_col_max_price': 'maximum_price_eur',
+    'trg_col_daily_trad_vol': 'daily_traded_volume',
+    'trg_col_ch_prev_clos': 'change_prev_closing_%',
+    'trg_key': 'report1/xetra_daily_report1',
+    'trg_key_date_format': '%Y%m%d_%H%M%S',
+    'trg_format': 'parquet'
+}
+META_KEY = 'meta/report1/xetra_report1_meta_file.csv'
+
+
+class TestXetraShardedRunMethods(unittest.TestCase):
+    """
+    Testing the XetraShardedRun class
+    """
+
+    def setUp(self):
+        """Setting up the environment"""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.src_storage = LocalStorageConnector(f'{self.tmp_dir.name}/src')
+        self.trg_storage = LocalStorageConnector(f'{self.tmp_dir.name}/trg')
+        generator = XetraDataGenerator(XetraDataGeneratorConfig(isin_count=20, days=6))
+        for key, content in generator.generate():
+            self.src_storage.write_object(content, key)
+        self.dates = generator.trading_dates()
+        self.source_config = XetraSourceConfig(
+            src_first_extract_date=self.dates[1], **SOURCE_CONFIG)
+        self.target_config = XetraTargetConfig(**TARGET_CONFIG)
+        self.date_list = (self.dates[1], self.dates)
+
+    def tearDown(self):
+        """Executing after unit test"""
+        self.tmp_dir.cleanup()
+
+    def _create_etl(self, run_config: XetraRunConfig = XetraRunConfig()):
+        """Helper function creating a XetraETL instance on the fixed dates"""
+        with patch.object(MetaProcess, 'return_date_list', return_value=self.date_list):
+            return create_xetra_etl(self.src_storage, self.trg_storage, META_KEY,
+                                    self.source_config, self.target_config, run_config)
+
+    def test_shard_dates(self):
+        """
+        Tests the shard_dates method splitting the dates into contiguous ranges
+        """
+        # Expected results
+        dates_exp = [self.dates[0:2], self.dates[2:4], self.dates[4:6]]
+        # Test init
+        sharded_run = XetraShardedRun(self._create_etl(), 3)
+        # Method execution
+        dates_result = [sharded_run.shard_dates(index) for index in range(3)]
+        # Test after method execution
+        self.assertEqual(dates_exp, dates_result)
+        with self.assertRaises(WrongShardException):
+            sharded_run.shard_dates(3)
+
+    def test_finalize_equals_unsharded_run(self):
+        """
+        Tests the run_shard and finalize methods creating the report of an unsharded
+        run for all engines
+        """
+        for run_config in [XetraRunConfig(), XetraRunConfig(compact_schema=True),
+                           XetraRunConfig(engine='arrow'), XetraRunConfig(engine='polars')]:
+            with self.subTest(run_config=run_config):
+                # Expected results
+                xetra_etl = self._create_etl(run_config)
+                df_exp = xetra_etl.transform_report1(xetra_etl.extract())
+                if not isinstance(df_exp, pd.DataFrame):
+                    df_exp = df_exp.to_pandas()
+                meta_exp = self.dates[1:]
+                # Test init
+                for shard_index in [2, 0, 1]:
+                    XetraShardedRun(self._create_etl(run_config), 3).run_shard(shard_index)
+                # Method execution
+                sharded_run = XetraShardedRun(self._create_etl(run_config), 3)
+                sharded_run.finalize()
+                # Test after method execution
+                self.assertEqual(
+                    [], self.trg_storage.list_files_in_prefix(sharded_run.shard_prefix))
+                trg_key = self.trg_storage.list_files_in_prefix('report1/xetra_daily_report1')
+                trg_key = [key for key in trg_key if key.endswith('parquet')
+                           and '/shards/' not in key][0]
+                df_result = pd.read_parquet(BytesIO(self.trg_storage.read_object(trg_key)))
+                pd.testing.assert_frame_equal(df_exp, df_result)
+                df_meta = self.trg_storage.read_csv_to_df(META_KEY)
+                self.assertEqual(meta_exp, list(df_meta['source_date']))
+                self.tearDown()
+                self.setUp()
+
+    def test_run_shard_clears_intermediate(self):
+        """
+        Tests the run_shard method resuming from and then removing the intermediate
+        files of its own shard only
+        """
+        # Test init
+        intermediate_dir = f'{self.tmp_dir.name}/intermediate'
+        run_config = XetraRunConfig(intermediate_dir=intermediate_dir)
+        sharded_run = XetraShardedRun(self._create_etl(run_config), 2)
+        shard_dirs = [os.path.join(sharded_run.intermediate_dir, f'shard-{index:04d}-of-0002')
+                      for index in range(2)]
+        # Method execution
+        with patch.object(XetraShardedRun, '_delta_key', side_effect=OSError):
+            with self.assertRaises(OSError):
+                sharded_run.run_shard(0)
+        files_failed = os.listdir(shard_dirs[0])
+        XetraShardedRun(self._create_etl(run_config), 2).run_shard(1)
+        files_other = os.listdir(shard_dirs[0])
+        XetraShardedRun(self._create_etl(run_config), 2).run_shard(0)
+        # Test after method execution
+        self.assertIn('manifest.json', files_failed)
+        self.assertEqual(sorted(files_failed), sorted(files_other))
+        self.assertFalse(os.path.exists(shard_dirs[0]))
+        self.assertFalse(os.path.exists(shard_dirs[1]))
+        XetraShardedRun(self._create_etl(run_config), 2).finalize()
+        df_meta = self.trg_storage.read_csv_to_df(META_KEY)
+        self.assertEqual(self.dates[1:], list(df_meta['source_date']))
+
+    def test_finalize_other_universe(self):
+        """
+        Tests the finalize method not merging the shards of a run on another universe
+        """
+        # Test init
+        watchlist_config = self.source_config._replace(src_isins=['DE0000000001'])
+        with patch.object(MetaProcess, 'return_date_list', return_value=self.date_list):
+            watchlist_etl = create_xetra_etl(self.src_storage, self.trg_storage, META_KEY,
+                                             watchlist_config, self.target_config,
+                                             XetraRunConfig())
+        for shard_index in range(2):
+            XetraShardedRun(watchlist_etl, 2).run_shard(shard_index)
+        sharded_run = XetraShardedRun(self._create_etl(), 2)
+        # Method execution
+        with self.assertRaises(WrongShardException):
+            sharded_run.finalize()
+        # Test after method execution
+        self.assertNotEqual(XetraShardedRun(watchlist_etl, 2).shard_prefix,
+                            sharded_run.shard_prefix)
+
+    def test_finalize_missing_shard(self):
+        """
+        Tests the finalize method raising WrongShardException when a shard is missing
+        """
+        # Expected results
+        log_exp = 'The shards [1] of 2 are missing!'
+        # Test init
+        XetraShardedRun(self._create_etl(), 2).run_shard(0)
+        # Method execution
+        with self.assertLogs() as logm:
+            with self.assertRaises(WrongShardException):
+                XetraShardedRun(self._create_etl(), 2).finalize()
+        # Test after method execution
+        self.assertIn(log_exp, logm.output[-1])
+        self.assertFalse(self.trg_storage.exists(META_KEY))
+
+
+class TestXetraShardedRunProcesses(unittest.TestCase):
+    """
+    Testing sharded runs of run.py in several local processes against a moto S3 server
+    """
+
+    def setUp(self):
+        """Setting up the environment"""
+        with socket.socket() as free_socket:
+            free_socket.bind(('127.0.0.1', 0))
+            port = free_socket.getsockname()[1]
+        self.endpoint_url = f'http://127.0.0.1:{port}'
+        self.server = ThreadedMotoServer(port=port, verbose=False)
+        self.server.start()
+        self.env = dict(os.environ, SHARD_TEST_KEY_ID='test', SHARD_TEST_SECRET='test',
+                        PYTHONPATH=REPO_DIR)
+        os.environ['SHARD_TEST_KEY_ID'] = 'test'
+        os.environ['SHARD_TEST_SECRET'] = 'test'
+        s3_resource = boto3.resource(
+            service_name='s3', endpoint_url=self.endpoint_url, region_name='us-east-1',
+            aws_access_key_id='test', aws_secret_access_key='test')
+        s3_resource.create_bucket(Bucket='src-bucket')
+        s3_resource.create_bucket(Bucket='trg-bucket')
+        # Recent trading days, so the date list until today stays short
+        start_date = (datetime.today() - timedelta(days=8)).strftime('%Y-%m-%d')
+        generator = XetraDataGenerator(XetraDataGeneratorConfig(
+            isin_count=20, days=4, start_date=start_date))
+        for key, content in generator.generate():
+            s3_resource.Bucket('src-bucket').put_object(Body=content, Key=key)
+        self.dates = generator.trading_dates()
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.config_path = os.path.join(self.tmp_dir.name, 'config.yml')
+        with open(self.config_path, 'w', encoding='utf-8') as config_file:
+            yaml.safe_dump({
+                's3': {'access_key': 'SHARD_TEST_KEY_ID', 'secret_key': 'SHARD_TEST_SECRET',
+                       'src_endpoint_url': self.endpoint_url, 'src_bucket': 'src-bucket',
+                       'trg_endpoint_url': self.endpoint_url, 'trg_bucket': 'trg-bucket'},
+                'source': dict(SOURCE_CONFIG, src_first_extract_date=self.dates[1]),
+                'target': TARGET_CONFIG,
+                'meta': {'meta_key': META_KEY},
+                'logging': {'version': 1},
+            }, config_file)
+
+    def tearDown(self):
+        """Executing after unit test"""
+        self.server.stop()
+        self.tmp_dir.cleanup()
+        os.environ.pop('SHARD_TEST_KEY_ID')
+        os.environ.pop('SHARD_TEST_SECRET')
+
+    def _run(self, *args):
+        """Helper function starting run.py in a new process"""
+        return subprocess.Popen([sys.executable, os.path.join(REPO_DIR, 'run.py'),
+                                 self.config_path, *args], env=self.env)
+
+    def test_shard_processes(self):
+        """
+        Tests three shard processes and the finalize process creating the report
+        of an unsharded run
+        """
+        # Expected results
+        s3_bucket_src = S3BucketConnector('SHARD_TEST_KEY_ID', 'SHARD_TEST_SECRET',
+                                          self.endpoint_url, 'src-bucket')
+        s3_bucket_trg = S3BucketConnector('SHARD_TEST_KEY_ID', 'SHARD_TEST_SECRET',
+                                          self.endpoint_url, 'trg-bucket')
+        xetra_etl = XetraETL(s3_bucket_src, s3_bucket_trg, META_KEY,
+                             XetraSourceConfig(src_first_extract_date=self.dates[1],
+                                               **SOURCE_CONFIG),
+                             XetraTargetConfig(**TARGET_CONFIG))
+        df_exp = xetra_etl.transform_report1(xetra_etl.extract())
+        # Test init
+        processes = [self._run('--shard-count', '3', '--shard-index', str(index))
+                     for index in range(3)]
+        return_codes = [process.wait(timeout=300) for process in processes]
+        # Method execution
+        finalize_code = self._run('--shard-count', '3', '--finalize-shards').wait(timeout=300)
+        # Test after method execution
+        self.assertEqual([0, 0, 0, 0], return_codes + [finalize_code])
+        trg_key = [key for key in s3_bucket_trg.list_files_in_prefix(TARGET_CONFIG['trg_key'])
+                   if '/shards/' not in key][0]
+        df_result = pd.read_parquet(BytesIO(s3_bucket_trg.read_object(trg_key)))
+        pd.testing.assert_frame_equal(df_exp, df_result)
+        df_meta = s3_bucket_trg.read_csv_to_df(META_KEY)
+        self.assertEqual(xetra_etl.meta_update_list, list(df_meta['source_date']))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,17 +1,21 @@
 """Test XetraETL Methods"""
 
 from io import BytesIO
+import json
 import os
+import tempfile
 import unittest
+from datetime import datetime
 from unittest.mock import patch
 
 import boto3
 import pandas as pd
-from moto import mock_s3
+from moto import mock_aws
 
 from xetra.common.s3 import S3BucketConnector
+from xetra.common.spill import SpillStore
 from xetra.common.meta_process import MetaProcess
-from xetra.transformations.xetra_transformations import XetraETL, XetraSourceConfig, XetraTargetConfig
+from xetra.transformations.xetra_transformations import XetraETL, XetraRunConfig, XetraSourceConfig, XetraTargetConfig
 
 
 class TestXetraETLMethods(unittest.TestCase):
@@ -22,7 +26,7 @@ class TestXetraETLMethods(unittest.TestCase):
     def setUp(self):
         """Setting up the environment"""
         # Mocking S3 connection start
-        self.mock_s3 = mock_s3()
+        self.mock_s3 = mock_aws()
         self.mock_s3.start()
         # Defining the class arguments
         self.s3_access_key = 'AWS_ACCESS_KEY_ID'
@@ -173,6 +177,154 @@ class TestXetraETLMethods(unittest.TestCase):
             df_result = xetra_etl.extract()
         self.assertTrue(df_exp.equals(df_result))
 
+    def test_extract_files_resumed(self):
+        """
+        Tests the extract method reusing the intermediate files of a failed run
+        """
+        # Expected results
+        df_exp = self.df_src.loc[1:8].reset_index(drop=True)
+        # Test init
+        extract_date = '2022-03-17'
+        extract_date_list = ['2022-03-16', '2022-03-17',
+                             '2022-03-18', '2022-03-19', '2022-03-20']
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            run_config = XetraRunConfig(intermediate_dir=tmp_dir)
+            # Method execution
+            with patch.object(MetaProcess, 'return_date_list',
+                              return_value=[extract_date, extract_date_list]):
+                xetra_etl = XetraETL(self.s3_src_bucket, self.s3_trg_bucket, self.meta_key,
+                                     self.source_config, self.target_config, run_config)
+                xetra_etl.extract()
+                xetra_etl_retry = XetraETL(self.s3_src_bucket, self.s3_trg_bucket, self.meta_key,
+                                           self.source_config, self.target_config, run_config)
+                with patch.object(self.s3_src_bucket, 'read_csv_to_df') as read_mock:
+                    df_result = xetra_etl_retry.extract()
+        # Test after method execution
+        read_mock.assert_not_called()
+        self.assertTrue(df_exp.equals(df_result))
+
+    def test_extract_files_resumed_next_day(self):
+        """
+        Tests the extract method resuming a failed run on the next day with a date list
+        one day longer, reading only the files published after the failed run
+        """
+        # Expected results
+        df_exp = self.df_src.loc[1:8].reset_index(drop=True)
+        # Test init
+        extract_date = '2022-03-17'
+        extract_date_list = ['2022-03-16', '2022-03-17',
+                             '2022-03-18', '2022-03-19', '2022-03-20']
+        new_key = '2022-03-19/2022-03-19_BINS_XETR09.csv'
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            run_config = XetraRunConfig(intermediate_dir=tmp_dir)
+            # The failed run on 2022-03-19 did not see the last file of the day yet
+            with patch.object(MetaProcess, 'return_date_list',
+                              return_value=[extract_date, extract_date_list[:-1]]), \
+                    patch.object(XetraETL, '_list_source', lambda _, date: [
+                        key for key in self.s3_src_bucket.list_files_in_prefix(date)
+                        if key != new_key]), \
+                    patch('xetra.transformations.xetra_transformations.datetime') as dt_mock:
+                dt_mock.today.return_value = datetime(2022, 3, 19)
+                xetra_etl = XetraETL(self.s3_src_bucket, self.s3_trg_bucket, self.meta_key,
+                                     self.source_config, self.target_config, run_config)
+                xetra_etl.extract()
+            # Method execution
+            with patch.object(MetaProcess, 'return_date_list',
+                              return_value=[extract_date, extract_date_list]):
+                xetra_etl_retry = XetraETL(self.s3_src_bucket, self.s3_trg_bucket,
+                                           self.meta_key, self.source_config,
+                                           self.target_config, run_config)
+                with patch.object(self.s3_src_bucket, 'read_csv_to_df',
+                                  wraps=self.s3_src_bucket.read_csv_to_df) as read_mock:
+                    df_result = xetra_etl_retry.extract()
+        # Test after method execution
+        self.assertEqual(xetra_etl.intermediate.run_dir, xetra_etl_retry.intermediate.run_dir)
+        self.assertEqual([new_key], [call.args[0] for call in read_mock.call_args_list])
+        self.assertTrue(df_exp.equals(df_result))
+
+    def test_extract_files_listing_manifest(self):
+        """
+        Tests the extract method listing the closed dates only in the first run
+        """
+        # Expected results
+        df_exp = self.df_src.loc[1:8].reset_index(drop=True)
+        # Test init
+        extract_date = '2022-03-17'
+        extract_date_list = ['2022-03-16', '2022-03-17',
+                             '2022-03-18', '2022-03-19', '2022-03-20']
+        run_config = XetraRunConfig(listing_manifest_key='listing/manifest.json')
+        # Method execution
+        with patch.object(MetaProcess, 'return_date_list',
+                          return_value=[extract_date, extract_date_list]):
+            xetra_etl = XetraETL(self.s3_src_bucket, self.s3_trg_bucket, self.meta_key,
+                                 self.source_config, self.target_config, run_config)
+            xetra_etl.extract()
+            xetra_etl_rerun = XetraETL(self.s3_src_bucket, self.s3_trg_bucket, self.meta_key,
+                                       self.source_config, self.target_config, run_config)
+            with patch.object(self.s3_src_bucket, 'list_objects_in_prefix') as list_mock:
+                df_result = xetra_etl_rerun.extract()
+        # Test after method execution
+        list_mock.assert_not_called()
+        self.assertTrue(df_exp.equals(df_result))
+
+    def test_extract_files_day_cache(self):
+        """
+        Tests the extract method reading the closed days from the day cache in a rerun
+        """
+        # Test init
+        extract_date = '2022-03-17'
+        extract_date_list = ['2022-03-16', '2022-03-17',
+                             '2022-03-18', '2022-03-19', '2022-03-20']
+        for compact_schema in [False, True]:
+            with tempfile.TemporaryDirectory() as tmp_dir, patch.object(
+                    MetaProcess, 'return_date_list',
+                    return_value=[extract_date, extract_date_list]):
+                run_config = XetraRunConfig(day_cache_dir=tmp_dir, compact_schema=compact_schema)
+                xetra_etl = XetraETL(self.s3_src_bucket, self.s3_trg_bucket, self.meta_key,
+                                     self.source_config, self.target_config, run_config)
+                df_exp = xetra_etl.extract()
+                # Method execution
+                xetra_etl_rerun = XetraETL(self.s3_src_bucket, self.s3_trg_bucket, self.meta_key,
+                                           self.source_config, self.target_config, run_config)
+                with patch.object(self.s3_src_bucket, 'read_csv_to_df') as read_mock, \
+                        patch.object(self.s3_src_bucket, 'list_files_in_prefix') as list_mock:
+                    df_result = xetra_etl_rerun.extract()
+            # Test after method execution
+            read_mock.assert_not_called()
+            list_mock.assert_not_called()
+            pd.testing.assert_frame_equal(df_exp, df_result)
+
+    def test_extract_summaries(self):
+        """
+        Tests the extract_summaries method caching the summaries of the source files
+        by ETag and creating report 1 from them in a rerun without reading the files
+        """
+        # Expected results
+        summary_count_exp = 8
+        # Test init
+        extract_date = '2022-03-17'
+        extract_date_list = ['2022-03-16', '2022-03-17', '2022-03-18', '2022-03-19']
+        run_config = XetraRunConfig(summary_prefix='summaries/')
+        with patch.object(MetaProcess, 'return_date_list',
+                          return_value=[extract_date, extract_date_list]):
+            xetra_etl = XetraETL(self.s3_src_bucket, self.s3_trg_bucket, self.meta_key,
+                                 self.source_config, self.target_config, run_config)
+            df_exp = xetra_etl.transform_report1(xetra_etl.extract())
+            # Method execution
+            df_first = xetra_etl.transform_report1_from_partials(
+                xetra_etl.extract_summaries())
+            xetra_etl_rerun = XetraETL(self.s3_src_bucket, self.s3_trg_bucket, self.meta_key,
+                                       self.source_config, self.target_config, run_config)
+            with patch.object(self.s3_src_bucket, 'read_csv_to_df') as read_mock:
+                df_result = xetra_etl_rerun.transform_report1_from_partials(
+                    xetra_etl_rerun.extract_summaries())
+        # Test after method execution
+        read_mock.assert_not_called()
+        summary_keys = self.s3_trg_bucket.list_files_in_prefix('summaries/')
+        self.assertEqual(summary_count_exp, len(summary_keys))
+        pd.testing.assert_frame_equal(df_exp, df_first)
+        pd.testing.assert_frame_equal(df_exp, df_result)
+
     def test_transform_report1_emptydf(self):
         """
         Tests the transform_report1 method with an empty DataFrame as an input argument
@@ -221,6 +373,91 @@ class TestXetraETLMethods(unittest.TestCase):
         # Test after method execution
         self.assertTrue(df_exp.equals(df_result))
 
+    def test_transform_report1_compact_schema(self):
+        """
+        Tests the transform_report1 method with the compact schema against the default schema
+        """
+        # Test init
+        extract_date = '2022-03-17'
+        extract_date_list = ['2022-03-16',
+                             '2022-03-17', '2022-03-18', '2022-03-19']
+        run_config = XetraRunConfig(compact_schema=True)
+        with patch.object(MetaProcess, 'return_date_list',
+                          return_value=[extract_date, extract_date_list]):
+            xetra_etl = XetraETL(self.s3_src_bucket, self.s3_trg_bucket,
+                                 self.meta_key, self.source_config, self.target_config)
+            xetra_etl_compact = XetraETL(self.s3_src_bucket, self.s3_trg_bucket, self.meta_key,
+                                         self.source_config, self.target_config, run_config)
+            df_exp = xetra_etl.transform_report1(xetra_etl.extract())
+            # Method execution
+            df_input = xetra_etl_compact.extract()
+            df_result = xetra_etl_compact.transform_report1(df_input)
+        # Test after method execution
+        self.assertEqual('int16', str(df_input[self.source_config.src_col_time].dtype))
+        self.assertTrue(df_exp.equals(df_result))
+
+    def test_extract_transform_report1_spilled(self):
+        """
+        Tests the extract_transform_report1 method spilling to local files
+        against the in-memory run
+        """
+        # Test init
+        extract_date = '2022-03-17'
+        extract_date_list = ['2022-03-16',
+                             '2022-03-17', '2022-03-18', '2022-03-19']
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            run_config = XetraRunConfig(max_memory_mb=1, spill_dir=tmp_dir, spill_partitions=3)
+            with patch.object(MetaProcess, 'return_date_list',
+                              return_value=[extract_date, extract_date_list]):
+                xetra_etl = XetraETL(self.s3_src_bucket, self.s3_trg_bucket, self.meta_key,
+                                     self.source_config, self.target_config, run_config)
+            df_exp = xetra_etl.transform_report1(xetra_etl.extract())
+            # Method execution
+            with patch.object(SpillStore, 'nbytes', return_value=2 ** 20):
+                with self.assertLogs() as logm:
+                    df_result = xetra_etl.extract_transform_report1()
+            spill_files = os.listdir(tmp_dir)
+        # Test after method execution
+        self.assertTrue(df_exp.equals(df_result))
+        self.assertEqual(4, len([log for log in logm.output if 'Spilling' in log]))
+        self.assertEqual([], spill_files)
+
+    def test_load_unchanged(self):
+        """
+        Tests the load method skipping the write of an unchanged report and the meta
+        file rewrite without new dates
+        """
+        # Expected results
+        log_exp = 'Xetra target data unchanged, the write is skipped.'
+        # Test init
+        extract_date = '2022-03-17'
+        extract_date_list = ['2022-03-17', '2022-03-18', '2022-03-19']
+        run_config = XetraRunConfig(load_manifest_key='meta/load_manifest.json')
+        with patch.object(MetaProcess, 'return_date_list',
+                          return_value=[extract_date, extract_date_list]):
+            XetraETL(self.s3_src_bucket, self.s3_trg_bucket, self.meta_key, self.source_config,
+                     self.target_config, run_config).load(self.df_report)
+            manifest_exp = self.s3_trg_bucket.read_object('meta/load_manifest.json')
+            xetra_etl = XetraETL(self.s3_src_bucket, self.s3_trg_bucket, self.meta_key,
+                                 self.source_config, self.target_config, run_config)
+        with patch.object(MetaProcess, 'return_date_list', return_value=['2200-01-01', []]):
+            xetra_etl_no_dates = XetraETL(self.s3_src_bucket, self.s3_trg_bucket, self.meta_key,
+                                          self.source_config, self.target_config, run_config)
+        # Method execution
+        with patch.object(self.s3_trg_bucket, 'write_df_to_s3') as write_mock, \
+                self.assertLogs() as logm:
+            # Same content, different index
+            xetra_etl.load(self.df_report.set_index(self.df_report.index + 10))
+        with patch.object(MetaProcess, 'update_meta_file') as meta_mock:
+            xetra_etl_no_dates.load(pd.DataFrame())
+        # Test after method execution
+        self.assertIn(log_exp, logm.output[0])
+        write_mock.assert_not_called()
+        meta_mock.assert_not_called()
+        self.assertEqual(manifest_exp, self.s3_trg_bucket.read_object('meta/load_manifest.json'))
+        self.assertEqual(1, len(self.s3_trg_bucket.list_files_in_prefix(
+            self.target_config.trg_key)))
+
     def test_load(self):
         """
         Tests the load method
@@ -309,6 +546,33 @@ class TestXetraETLMethods(unittest.TestCase):
             }
         )
 
+    def test_etl_report1_run_report(self):
+        """
+        Tests the etl_report1 method writing the run report next to the target file
+        """
+        # Expected results
+        stages_exp = ['extract', 'transform_report1', 'load']
+        # Test init
+        extract_date = '2022-03-17'
+        extract_date_list = ['2022-03-16',
+                             '2022-03-17', '2022-03-18', '2022-03-19']
+        run_config = XetraRunConfig(run_report=True, run_report_to_target=True)
+        # Method execution
+        with patch.object(MetaProcess, 'return_date_list',
+                          return_value=[extract_date, extract_date_list]):
+            xetra_etl = XetraETL(self.s3_src_bucket, self.s3_trg_bucket, self.meta_key,
+                                 self.source_config, self.target_config, run_config)
+            xetra_etl.etl_report1()
+        # Test after method execution
+        report_file = [key for key in self.s3_trg_bucket.list_files_in_prefix(
+            self.target_config.trg_key) if key.endswith('_run_report.json')][0]
+        report = json.loads(
+            self.trg_bucket.Object(key=report_file).get().get('Body').read())
+        self.assertEqual(stages_exp, list(report['stages']))
+        # 8 source files and the meta file
+        self.assertEqual(9, report['s3_calls']['GET']['count'])
+        self.assertEqual({'rows_in': 8, 'rows_out': 3}, report['rows']['transform_report1'])
+
 
 if __name__ == '__main__':
     unittest.main()
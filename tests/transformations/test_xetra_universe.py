@@ -0,0 +1,150 @@
+"""Test XetraUniverse Methods"""
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import pandas as pd
+import pyarrow as pa
+
+from benchmarks.xetra_data_generator import XetraDataGenerator, XetraDataGeneratorConfig
+from xetra.common.constants import ETLEngines
+from xetra.common.local_storage import LocalStorageConnector
+from xetra.common.meta_process import MetaProcess
+from xetra.transformations.xetra_engines import create_xetra_etl
+from xetra.transformations.xetra_transformations import (XetraRunConfig, XetraSourceConfig,
+                                                         XetraTargetConfig)
+from xetra.transformations.xetra_universe import XetraUniverse
+
+
+class TestXetraUniverseMethods(unittest.TestCase):
+    """
+    Testing the XetraUniverse class
+    """
+
+    def setUp(self):
+        """Setting up the environment"""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.storage = LocalStorageConnector(self.tmp_dir.name)
+        self.source_config = XetraSourceConfig(
+            src_first_extract_date='2022-03-01',
+            src_columns=['ISIN', 'Mnemonic', 'Date', 'Time', 'StartPrice', 'EndPrice',
+                         'MinPrice', 'MaxPrice', 'TradedVolume'],
+            src_col_date='Date',
+            src_col_isin='ISIN',
+            src_col_time='Time',
+            src_col_start_price='StartPrice',
+            src_col_end_price='EndPrice',
+            src_col_min_price='MinPrice',
+            src_col_max_price='MaxPrice',
+            src_col_traded_vol='TradedVolume')
+        self.target_config = XetraTargetConfig(
+            trg_col_isin='isin',
+            trg_col_date='date',
+            trg_col_op_price='opening_price_eur',
+            trg_col_clos_price='closing_price_eur',
+            trg_col_min_price='minimum_price_eur',
+            trg_col_max_price='maximum_price_eur',
+            trg_col_daily_trad_vol='daily_traded_volume',
+            trg_col_ch_prev_clos='change_prev_closing_%',
+            trg_key='report1/xetra_daily_report1_',
+            trg_key_date_format='%Y%m%d_%H%M%S',
+            trg_format='parquet')
+        self.generator = XetraDataGenerator(XetraDataGeneratorConfig(
+            isin_count=20, trading_minutes=30, days=2, start_date='2022-03-14'))
+        for key, content in self.generator.generate():
+            self.storage.write_object(content, key)
+        self.extract_date, *_ = self.extract_date_list = self.generator.trading_dates()
+
+    def tearDown(self):
+        """Executing after unit test"""
+        self.tmp_dir.cleanup()
+
+    def _extract(self, source_config: XetraSourceConfig, engine: str):
+        """Helper function extracting the source files with an engine"""
+        with patch.object(MetaProcess, 'return_date_list',
+                          return_value=[self.extract_date, self.extract_date_list]):
+            xetra_etl = create_xetra_etl(self.storage, self.storage, 'meta.csv', source_config,
+                                         self.target_config, XetraRunConfig(engine=engine))
+        data = xetra_etl.extract()
+        # Arrow and Polars data are compared in Pandas
+        return data.to_pandas() if hasattr(data, 'to_pandas') else data
+
+    def test_from_config(self):
+        """
+        Tests the from_config method without and with allow-lists
+        """
+        # Test init
+        source_config = self.source_config._replace(
+            src_isins=['DE0000000002', 'DE0000000001', 'DE0000000002'], src_mnemonics=['X001'])
+        # Method execution
+        universe_none = XetraUniverse.from_config(self.source_config)
+        universe = XetraUniverse.from_config(source_config)
+        universe_other = XetraUniverse.from_config(source_config._replace(src_mnemonics=None))
+        # Test after method execution
+        self.assertIsNone(universe_none)
+        self.assertEqual({'ISIN': ['DE0000000001', 'DE0000000002'], 'Mnemonic': ['X001']},
+                         universe.allowed)
+        self.assertNotEqual(universe.fingerprint(), universe_other.fingerprint())
+        self.assertEqual('', XetraUniverse.fingerprint_of(universe_none))
+        self.assertEqual(universe.fingerprint(), XetraUniverse.fingerprint_of(universe))
+
+    def test_filter_df_table(self):
+        """
+        Tests the filter_df and filter_table methods keeping the rows in all allow-lists
+        """
+        # Expected results
+        rows_exp = [['DE0000000001', 'X001']]
+        # Test init
+        universe = XetraUniverse({'ISIN': ['DE0000000001', 'DE0000000002'],
+                                  'Mnemonic': ['X001']})
+        df_input = pd.DataFrame([['DE0000000001', 'X001'], ['DE0000000002', 'X002'],
+                                 ['DE0000000003', 'X001'], [None, 'X001']],
+                                columns=['ISIN', 'Mnemonic'])
+        # Method execution
+        df_result = universe.filter_df(df_input)
+        table_result = universe.filter_table(pa.Table.from_pandas(df_input))
+        # Test after method execution
+        self.assertEqual(rows_exp, df_result.values.tolist())
+        self.assertEqual(rows_exp, table_result.to_pandas().values.tolist())
+
+    def test_filter_lines(self):
+        """
+        Tests the filter_lines method checking the shortest allow-list before parsing
+        and keeping files with quoted fields unchanged
+        """
+        # Expected results
+        body_exp = b'ISIN,Mnemonic,Date\nDE0000000001,X001,2022-03-17\n'
+        # Test init
+        universe = XetraUniverse({'ISIN': ['DE0000000001', 'DE0000000002'],
+                                  'Mnemonic': ['X001']})
+        body = (b'ISIN,Mnemonic,Date\nDE0000000001,X001,2022-03-17\n'
+                b'DE0000000002,X002,2022-03-17\nDE0000000003,X003,2022-03-17\n')
+        body_quoted = body + b'"DE0000000004",X004,2022-03-17\n'
+        # Method execution
+        body_result = universe.filter_lines(body)
+        body_quoted_result = universe.filter_lines(body_quoted)
+        # Test after method execution
+        self.assertEqual(body_exp, body_result)
+        self.assertEqual(body_quoted, body_quoted_result)
+
+    def test_extract_universe(self):
+        """
+        Tests the extract method reading only the rows of the allow-list
+        with all engines
+        """
+        # Test init
+        isins = self.generator.isins[3:6]
+        source_config = self.source_config._replace(src_isins=isins)
+        for engine in [engine.value for engine in ETLEngines]:
+            # Expected results
+            df_all = self._extract(self.source_config, engine)
+            df_exp = df_all[df_all['ISIN'].isin(isins)].reset_index(drop=True)
+            # Method execution
+            df_result = self._extract(source_config, engine)
+            # Test after method execution
+            self.assertEqual(set(isins), set(df_result['ISIN']))
+            pd.testing.assert_frame_equal(df_exp, df_result)
+
+
+if __name__ == '__main__':
+    unittest.main()
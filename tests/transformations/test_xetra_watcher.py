@@ -0,0 +1,318 @@
+"""Test XetraWatcher Methods"""
+
+from datetime import datetime, timedelta
+from io import BytesIO
+import os
+import threading
+import unittest
+from unittest.mock import patch
+
+import boto3
+import pandas as pd
+from moto import mock_aws
+
+from xetra.common.s3 import S3BucketConnector
+from xetra.common.meta_process import MetaProcess
+from xetra.transformations.xetra_transformations import XetraETL, XetraSourceConfig, XetraTargetConfig
+from xetra.transformations.xetra_watcher import XetraWatcher
+
+
+class TestXetraWatcherMethods(unittest.TestCase):
+    """
+    Testing the XetraWatcher class
+    """
+
+    def setUp(self):
+        """Setting up the environment"""
+        # Mocking S3 connection start
+        self.mock_s3 = mock_aws()
+        self.mock_s3.start()
+        # Defining the class arguments
+        self.s3_access_key = 'AWS_ACCESS_KEY_ID'
+        self.s3_secret_key = 'AWS_SECRET_ACCESS_KEY'
+        self.s3_endpoint_url = 'https://s3.us-east-2.amazonaws.com'
+        self.s3_bucket_name_src = 'src-bucket'
+        self.s3_bucket_name_trg = 'trg-bucket'
+        self.meta_key = 'meta_key'
+        # create s3 access keys as environment variables
+        os.environ[self.s3_access_key] = 'KEY1'
+        os.environ[self.s3_secret_key] = 'KEY2'
+        # Create bucket on mocked S3
+        self.s3 = boto3.resource(
+            service_name='s3', endpoint_url=self.s3_endpoint_url)
+        self.s3.create_bucket(Bucket=self.s3_bucket_name_src,
+                              CreateBucketConfiguration={
+                                  'LocationConstraint': 'us-east-2'
+                              })
+        self.s3.create_bucket(Bucket=self.s3_bucket_name_trg,
+                              CreateBucketConfiguration={
+                                  'LocationConstraint': 'us-east-2'
+                              })
+        self.src_bucket = self.s3.Bucket(self.s3_bucket_name_src)
+        self.trg_bucket = self.s3.Bucket(self.s3_bucket_name_trg)
+        # Creat testing instances
+        self.s3_src_bucket = S3BucketConnector(self.s3_access_key,
+                                               self.s3_secret_key,
+                                               self.s3_endpoint_url,
+                                               self.s3_bucket_name_src)
+        self.s3_trg_bucket = S3BucketConnector(self.s3_access_key,
+                                               self.s3_secret_key,
+                                               self.s3_endpoint_url,
+                                               self.s3_bucket_name_trg)
+        config_dict_src = {
+            'src_first_extract_date': '2022-03-01',
+            'src_columns': ['ISIN', 'Mnemonic', 'Date',
+                            'Time', 'StartPrice', 'EndPrice',
+                            'MinPrice', 'MaxPrice', 'TradedVolume'],
+            'src_col_date': 'Date',
+            'src_col_isin': 'ISIN',
+            'src_col_time': 'Time',
+            'src_col_start_price': 'StartPrice',
+            'src_col_end_price': 'EndPrice',
+            'src_col_min_price': 'MinPrice',
+            'src_col_max_price': 'MaxPrice',
+            'src_col_traded_vol': 'TradedVolume'
+        }
+        config_dict_trg = {
+            'trg_col_isin': 'isin',
+            'trg_col_date': 'date',
+            'trg_col_op_price': 'opening_price_eur',
+            'trg_col_clos_price': 'closing_price_eur',
+            'trg_col_min_price': 'minimum_price_eur',
+            'trg_col_max_price': 'maximum_price_eur',
+            'trg_col_daily_trad_vol': 'daily_traded_volume',
+            'trg_col_ch_prev_clos': 'change_prev_closing_%',
+            'trg_key': 'report1/xetra_daily_report1',
+            'trg_key_date_format': '%Y%m%d_%H%M%S',
+            'trg_format': 'parquet'
+        }
+        self.source_config = XetraSourceConfig(**config_dict_src)
+        self.target_config = XetraTargetConfig(**config_dict_trg)
+        # creating source files on mocked s3
+        columns_src = ['ISIN', 'Mnemonic', 'Date', 'Time', 'StartPrice',
+                       'EndPrice', 'MinPrice', 'MaxPrice', 'TradedVolume']
+        data = [
+            ['AT0000A0E9W5', 'SANT', '2022-03-15',
+                '12:00', 20.19, 18.45, 18.20, 20.33, 877],
+            ['AT0000A0E9W5', 'SANT', '2022-03-16',
+                '15:00', 18.27, 21.19, 18.27, 21.34, 987],
+            ['AT0000A0E9W5', 'SANT', '2022-03-17',
+                '13:00', 20.21, 18.27, 18.21, 20.42, 633],
+            ['AT0000A0E9W5', 'SANT', '2022-03-17',
+                '14:00', 18.27, 21.19, 18.27, 21.34, 455],
+            ['AT0000A0E9W5', 'SANT', '2022-03-18',
+                '07:00', 20.58, 19.27, 18.89, 20.58, 9066],
+            ['AT0000A0E9W5', 'SANT', '2022-03-18',
+                '08:00', 19.27, 21.14, 19.27, 21.14, 1220],
+            ['AT0000A0E9W5', 'SANT', '2022-03-19',
+                '07:00', 23.58, 23.58, 23.58, 23.58, 1035],
+            ['AT0000A0E9W5', 'SANT', '2022-03-19',
+                '08:00', 23.58, 24.22, 23.31, 24.34, 1028],
+            ['AT0000A0E9W5', 'SANT', '2022-03-19', '09:00', 24.22, 22.21, 22.21, 25.01, 1523]]
+        self.df_src = pd.DataFrame(data, columns=columns_src)
+        self.s3_src_bucket.write_df_to_s3(
+            self.df_src.loc[0:0], '2022-03-15/2022-03-15_BINS_XETR12.csv', 'csv')
+        self.s3_src_bucket.write_df_to_s3(
+            self.df_src.loc[1:1], '2022-03-16/2022-03-16_BINS_XETR13.csv', 'csv')
+        self.s3_src_bucket.write_df_to_s3(
+            self.df_src.loc[2:2], '2022-03-17/2022-03-17_BINS_XETR14.csv', 'csv')
+        self.s3_src_bucket.write_df_to_s3(
+            self.df_src.loc[3:3], '2022-03-17/2022-03-17_BINS_XETR15.csv', 'csv')
+        self.s3_src_bucket.write_df_to_s3(
+            self.df_src.loc[4:4], '2022-03-18/2022-03-18_BINS_XETR16.csv', 'csv')
+        self.s3_src_bucket.write_df_to_s3(
+            self.df_src.loc[5:5], '2022-03-18/2022-03-18_BINS_XETR17.csv', 'csv')
+        self.s3_src_bucket.write_df_to_s3(
+            self.df_src.loc[6:6], '2022-03-19/2022-03-19_BINS_XETR07.csv', 'csv')
+        self.s3_src_bucket.write_df_to_s3(
+            self.df_src.loc[7:7], '2022-03-19/2022-03-19_BINS_XETR08.csv', 'csv')
+        self.s3_src_bucket.write_df_to_s3(
+            self.df_src.loc[8:8], '2022-03-19/2022-03-19_BINS_XETR09.csv', 'csv')
+        columns_report = ['ISIN', 'Date', 'opening_price_eur', 'closing_price_eur',
+                          'minimum_price_eur', 'maximum_price_eur', 'daily_traded_volume',
+                          'change_prev_closing_%']
+        data_report = [['AT0000A0E9W5', '2022-03-17', 20.21, 18.27, 18.21, 21.34, 1088, 10.62],
+                       ['AT0000A0E9W5', '2022-03-18', 20.58,
+                           19.27, 18.89, 21.14, 10286, 1.83],
+                       ['AT0000A0E9W5', '2022-03-19', 23.58, 24.22, 22.21, 25.01, 3586, 14.58]]
+        self.df_report = pd.DataFrame(data_report, columns=columns_report)
+
+    def tearDown(self):
+        """Executing after unit test"""
+        # Mocking S3 connection stopped
+        self.mock_s3.stop()
+
+    def _create_watcher(self):
+        """Helper function creating a XetraWatcher on the mocked buckets"""
+        extract_date = '2022-03-17'
+        extract_date_list = ['2022-03-16',
+                             '2022-03-17', '2022-03-18', '2022-03-19']
+        with patch.object(MetaProcess, 'return_date_list',
+                          return_value=[extract_date, extract_date_list]):
+            xetra_etl = XetraETL(self.s3_src_bucket, self.s3_trg_bucket,
+                                 self.meta_key, self.source_config, self.target_config)
+        return XetraWatcher(xetra_etl, 0)
+
+    def _read_partition(self, watcher, date):
+        """Helper function reading a report partition from the mocked target bucket"""
+        data = self.trg_bucket.Object(key=watcher.partition_key(date)).get().get('Body').read()
+        return pd.read_parquet(BytesIO(data))
+
+    def test_poll_once_first_poll(self):
+        """
+        Tests the poll_once method writing one report partition per source day
+        """
+        # Expected results
+        dates_exp = ['2022-03-17', '2022-03-18', '2022-03-19']
+        # Test init
+        watcher = self._create_watcher()
+        df_exp = watcher.xetra_etl.transform_report1(watcher.xetra_etl.extract())
+        # Method execution
+        dates_result = watcher.poll_once()
+        # Test after method execution
+        self.assertEqual(dates_exp, dates_result)
+        df_result = pd.concat([self._read_partition(watcher, date) for date in dates_result],
+                              ignore_index=True)
+        self.assertTrue(df_exp.equals(df_result))
+        df_meta_result = self.s3_trg_bucket.read_csv_to_df(self.meta_key)
+        self.assertEqual(dates_exp, list(df_meta_result['source_date']))
+
+    def test_poll_once_new_files_only(self):
+        """
+        Tests the poll_once method reading only newly published source files
+        """
+        # Expected results
+        key_new = '2022-03-19/2022-03-19_BINS_XETR10.csv'
+        df_new = pd.DataFrame([['AT0000A0E9W5', 'SANT', '2022-03-19',
+                                '10:00', 22.21, 26.00, 22.00, 26.50, 100]],
+                              columns=self.df_src.columns)
+        # Test init
+        watcher = self._create_watcher()
+        watcher.poll_once()
+        # Method execution
+        with patch.object(self.s3_src_bucket, 'read_csv_to_df') as read_mock:
+            dates_result = watcher.poll_once()
+        read_mock.assert_not_called()
+        self.assertEqual([], dates_result)
+        self.s3_src_bucket.write_df_to_s3(df_new, key_new, 'csv')
+        dates_result = watcher.poll_once()
+        # Test after method execution
+        self.assertEqual(['2022-03-19'], dates_result)
+        df_result = self._read_partition(watcher, '2022-03-19')
+        self.assertEqual(26.00, df_result['closing_price_eur'][0])
+        self.assertEqual(26.50, df_result['maximum_price_eur'][0])
+        self.assertEqual(3686, df_result['daily_traded_volume'][0])
+
+    def test_poll_once_late_files_after_rollover(self):
+        """
+        Tests the poll_once method reading late files of yesterday after the
+        midnight rollover
+        """
+        # Expected results
+        dates = [(datetime.today() - timedelta(days=days)).strftime('%Y-%m-%d')
+                 for days in [2, 1, 0]]
+        key_late = f'{dates[1]}/{dates[1]}_BINS_XETR17.csv'
+        # Test init
+        for date, hour, price in zip(dates, ['16', '16', '08'], [10.0, 11.0, 12.0]):
+            self.s3_src_bucket.write_df_to_s3(pd.DataFrame(
+                [['AT0000A0E9W5', 'SANT', date, f'{hour}:00', price, price, price, price, 100]],
+                columns=self.df_src.columns), f'{date}/{date}_BINS_XETR{hour}.csv', 'csv')
+        with patch.object(MetaProcess, 'return_date_list', return_value=[dates[1], dates]):
+            xetra_etl = XetraETL(self.s3_src_bucket, self.s3_trg_bucket,
+                                 self.meta_key, self.source_config, self.target_config)
+        watcher = XetraWatcher(xetra_etl, 0)
+        watcher.poll_once()
+        self.s3_src_bucket.write_df_to_s3(pd.DataFrame(
+            [['AT0000A0E9W5', 'SANT', dates[1], '17:00', 11.0, 13.2, 11.0, 13.2, 50]],
+            columns=self.df_src.columns), key_late, 'csv')
+        # Method execution
+        dates_result = watcher.poll_once()
+        # Test after method execution
+        self.assertEqual([dates[1]], dates_result)
+        df_result = self._read_partition(watcher, dates[1])
+        self.assertEqual(13.2, df_result['closing_price_eur'][0])
+        self.assertEqual(150, df_result['daily_traded_volume'][0])
+        self.assertEqual(10.0, df_result['change_prev_closing_%'][0])
+        self.assertIn(dates[1], watcher.watch_dates)
+
+    def test_poll_once_after_batch_run(self):
+        """
+        Tests the poll_once method writing the partitions of today when the watcher is
+        started after the batch run registered all days in the meta file
+        """
+        # Expected results
+        dates = [(datetime.today() - timedelta(days=days)).strftime('%Y-%m-%d')
+                 for days in [2, 1, 0]]
+        key_new = f'{dates[2]}/{dates[2]}_BINS_XETR09.csv'
+        # Test init
+        for date, hour, price in zip(dates[1:], ['16', '08'], [11.0, 12.0]):
+            self.s3_src_bucket.write_df_to_s3(pd.DataFrame(
+                [['AT0000A0E9W5', 'SANT', date, f'{hour}:00', price, price, price, price, 100]],
+                columns=self.df_src.columns), f'{date}/{date}_BINS_XETR{hour}.csv', 'csv')
+        source_config = self.source_config._replace(src_first_extract_date=dates[1])
+        XetraETL(self.s3_src_bucket, self.s3_trg_bucket, self.meta_key,
+                 source_config, self.target_config).etl_report1()
+        xetra_etl = XetraETL(self.s3_src_bucket, self.s3_trg_bucket, self.meta_key,
+                             source_config, self.target_config)
+        watcher = XetraWatcher(xetra_etl, 0)
+        self.s3_src_bucket.write_df_to_s3(pd.DataFrame(
+            [['AT0000A0E9W5', 'SANT', dates[2], '09:00', 12.0, 13.2, 12.0, 13.2, 50]],
+            columns=self.df_src.columns), key_new, 'csv')
+        # Method execution
+        dates_result = watcher.poll_once()
+        # Test after method execution
+        self.assertEqual('2200-01-01', xetra_etl.extract_date)
+        self.assertEqual([dates[2]], dates_result)
+        df_result = self._read_partition(watcher, dates[2])
+        self.assertEqual(13.2, df_result['closing_price_eur'][0])
+        self.assertEqual(150, df_result['daily_traded_volume'][0])
+        self.assertEqual(9.09, df_result['change_prev_closing_%'][0])
+        # The dates are recomputed from the meta file after the midnight rollover
+        watcher.today -= timedelta(days=1)
+        with patch.object(MetaProcess, 'return_date_list',
+                          wraps=MetaProcess.return_date_list) as dates_mock:
+            watcher.poll_once()
+        dates_mock.assert_called_once()
+        self.assertEqual(datetime.today().date(), watcher.today)
+        self.assertEqual(dates[2], watcher.report_start)
+
+    def test_run_poll_failed(self):
+        """
+        Tests the run method logging a failed poll and polling again
+        """
+        # Expected results
+        log_exp = 'Polling the Xetra source files failed, retrying in 0 seconds'
+        # Test init
+        watcher = self._create_watcher()
+        stop_event = threading.Event()
+
+        def poll_once():
+            if poll_mock.call_count == 1:
+                raise OSError('Listing failed')
+            stop_event.set()
+            return []
+        # Method execution
+        with patch.object(watcher, 'poll_once', side_effect=poll_once) as poll_mock, \
+                self.assertLogs(level='ERROR') as logm:
+            watcher.run(stop_event)
+        # Test after method execution
+        self.assertEqual(2, poll_mock.call_count)
+        self.assertIn(log_exp, logm.output[0])
+
+    def test_run_stopped(self):
+        """
+        Tests the run method returning when the stop event is set
+        """
+        # Test init
+        watcher = self._create_watcher()
+        stop_event = threading.Event()
+        stop_event.set()
+        # Method execution
+        with patch.object(watcher, 'poll_once') as poll_mock:
+            watcher.run(stop_event)
+        # Test after method execution
+        poll_mock.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,360 @@
+"""
+Configuration of the Xetra ETL job and its validation
+"""
+from typing import NamedTuple
+
+import yaml
+
+from xetra.common.constants import (CompactionFormat, ConfigFormat, ETLEngines,
+                                    StorageBackends, XetraReports)
+from xetra.common.custom_exceptions import WrongConfigException
+
+
+class XetraSourceConfig(NamedTuple):
+    """
+    Class for source configuration data
+
+    Params:
+        src_first_extract_date (str): determines the date for extracting the source
+        src_columns (list): source column names
+        src_col_date (str): column name for date in source
+        src_col_isin (str): column name for isin source
+        src_col_time (str): column name for time in source
+        src_col_start_price (str): column name for starting price in source
+        src_col_min_price (str): column name for minimum price in source
+        src_col_max_price (str): column name for maximum price in source
+        src_col_trade_vol (str): column name for traded volumn in source
+        src_col_mnemonic (str): column name for mnemonic in source
+        src_col_security_type (str): column name for security type in source
+        src_isins (list): allow-list of ISINs, None reads all ISINs
+        src_mnemonics (list): allow-list of mnemonics, None reads all mnemonics
+        src_security_types (list): allow-list of security types, None reads all types
+    """
+
+    src_first_extract_date: str
+    src_columns: list
+    src_col_date: str
+    src_col_isin: str
+    src_col_time: str
+    src_col_start_price: str
+    src_col_end_price: str
+    src_col_min_price: str
+    src_col_max_price: str
+    src_col_traded_vol: str
+    src_col_mnemonic: str = 'Mnemonic'
+    src_col_security_type: str = 'SecurityType'
+    src_isins: list = None
+    src_mnemonics: list = None
+    src_security_types: list = None
+
+
+class XetraTargetConfig(NamedTuple):
+    """
+    Class for target configuration data
+
+    Params:
+        trg_col_isin (str): column name for isin in target
+        trg_col_date (str): column name for date in target
+        trg_col_op_price (str): column name for opening price in target
+        trg_col_clos_price (str): column name for closing price in target
+        trg_col_min_price (str): column name for minimum price in target
+        trg_col_max_price (str): column name for maximum price in target
+        trg_daily_traded_volume (str): column names for daily traded volume in target
+        trg_key (str): basic key for target file
+        trg_key_date_format (str): date format of the target file key
+        trg_format (str): file format of the target file
+        trg_col_bar_resolution (str): column name for the resolution in minutes of the
+                                      intraday bars in target
+        trg_col_bar_volume (str): column name for the traded volume of the intraday bars
+        trg_bar_resolutions (tuple): resolutions in minutes of the intraday bars
+        trg_col_moving_avg (str): column name prefix for the moving averages of the
+                                  closing price in target
+        trg_col_volatility (str): column name prefix for the volatilities in target
+        trg_rolling_windows (tuple): windows in trading days of the rolling-window report
+        trg_rolling_state_key (str): key of the persisted rolling-window state,
+                                     None uses trg_key + 'rolling_state.npz'
+    """
+    trg_col_isin: str
+    trg_col_date: str
+    trg_col_op_price: str
+    trg_col_clos_price: str
+    trg_col_min_price: str
+    trg_col_max_price: str
+    trg_col_daily_trad_vol: str
+    trg_col_ch_prev_clos: str
+    trg_key: str
+    trg_key_date_format: str
+    trg_format: str
+    trg_col_bar_resolution: str = 'resolution_min'
+    trg_col_bar_volume: str = 'traded_volume'
+    trg_bar_resolutions: tuple = (1, 5, 15)
+    trg_col_moving_avg: str = 'moving_avg'
+    trg_col_volatility: str = 'volatility'
+    trg_rolling_windows: tuple = (20, 50, 200)
+    trg_rolling_state_key: str = None
+
+
+class XetraRunConfig(NamedTuple):
+    """
+    Class for run configuration data
+
+    Params:
+        intermediate_dir (str): local directory for the intermediate files per extracted day,
+                                None disables resuming of failed runs
+        watch_interval (int): seconds between two polls of the source listing in watch mode
+        run_report (bool): collects timings, S3 calls, row counts and peak memory of the run
+        run_report_to_target (bool): writes the run report as JSON next to the target file
+        engine (str): engine of the transformations, one of ETLEngines (pandas, arrow, polars)
+        compact_schema (bool): keeps the extracted data of the pandas engine in the compact
+                               schema of XetraCompactSchema to reduce the memory usage
+        max_memory_mb (int): memory budget of report 1, the extracted data is spilled to
+                             local files partitioned by ISIN when it is nearly reached,
+                             None keeps all data in memory, not supported with the
+                             reports on one shared extract
+        spill_dir (str): local directory for the spill files, None uses a temporary directory
+        spill_partitions (int): number of ISIN partitions of the spill files
+        listing_manifest_key (str): key of the manifest on the target caching the source
+                                    listing of each date, None lists every date live
+        listing_refresh_s (int): seconds the cached listing of today and yesterday is
+                                 reused, older dates are never listed again
+        day_cache_dir (str): local directory keeping the extracted closed days across runs
+                             as memory-mapped Arrow IPC files, None disables the cache
+        summary_prefix (str): prefix on the target of the partial aggregates cached per
+                              source file and ETag, report 1 is then created from the
+                              cached summaries, None extracts the source data
+        ohlcv_kernel (bool): True aggregates report 1 of the pandas engine with the
+                             numba-compiled kernel, falls back to pandas if numba is
+                             not installed
+        load_manifest_key (str): key of the manifest on the target with the content hashes
+                                 of the last written outputs, unchanged outputs and meta
+                                 files without new dates are then not written again,
+                                 None always writes
+        write_workers (int): maximum number of partitions of a partitioned output that are
+                             serialized and uploaded at the same time
+    """
+    intermediate_dir: str = None
+    watch_interval: int = 300
+    run_report: bool = False
+    run_report_to_target: bool = False
+    engine: str = ETLEngines.PANDAS.value
+    compact_schema: bool = False
+    max_memory_mb: int = None
+    spill_dir: str = None
+    spill_partitions: int = 16
+    listing_manifest_key: str = None
+    listing_refresh_s: int = 0
+    day_cache_dir: str = None
+    summary_prefix: str = None
+    ohlcv_kernel: bool = False
+    load_manifest_key: str = None
+    write_workers: int = 8
+
+
+class XetraReportConfig(NamedTuple):
+    """
+    Class for report configuration data
+
+    Params:
+        name (str): unique name of the report in the job, used in the run report
+        report (str): report that is created, one of XetraReports
+        meta_key (str): key of the meta file of the report
+        trg_args (XetraTargetConfig): NamedTuple class with target configuration data
+    """
+    name: str
+    report: str
+    meta_key: str
+    trg_args: XetraTargetConfig
+
+
+class XetraCompactionConfig(NamedTuple):
+    """
+    Class for compaction configuration data
+
+    Params:
+        compact_prefix (str): prefix of the compacted files on the target
+        manifest_key (str): key of the manifest of the compacted files and report files
+        bucket_format (str): strftime format of the report date defining the time bucket
+                             of a compacted file, monthly by default
+    """
+    compact_prefix: str
+    manifest_key: str
+    bucket_format: str = CompactionFormat.MONTHLY_BUCKET_FORMAT.value
+
+
+class XetraJobConfig(NamedTuple):
+    """
+    Class for the validated configuration of the Xetra ETL job
+
+    Params:
+        logging (dict): logging configuration for logging.config.dictConfig
+        storage (dict): storage configuration with the backend 's3' or 'local'
+        s3 (dict): S3 configuration, None for the local backend
+        source (XetraSourceConfig): NamedTuple class with source configuration data
+        target (XetraTargetConfig): NamedTuple class with target configuration data
+        meta_key (str): key of the meta file of report 1
+        run (XetraRunConfig): NamedTuple class with run configuration data
+        reports (list): XetraReportConfig of the reports on one shared extract, None
+                        runs report 1 only
+        compaction (XetraCompactionConfig): NamedTuple class with compaction
+                                            configuration data, None if not configured
+    """
+    logging: dict
+    storage: dict
+    s3: dict
+    source: XetraSourceConfig
+    target: XetraTargetConfig
+    meta_key: str
+    run: XetraRunConfig
+    reports: list = None
+    compaction: XetraCompactionConfig = None
+
+
+def load_config(config_path: str):
+    """
+    Reading and validating the YAML configuration of the Xetra ETL job once at startup
+
+    Only the standard library and yaml are imported, so configuration errors are
+    reported before any heavy dependency is loaded.
+
+    Params:
+        config_path (str): path of the YAML configuration file
+
+    Returns:
+        config (XetraJobConfig): validated configuration
+
+    Raises WrongConfigException with a message naming the invalid entry.
+    """
+    try:
+        with open(config_path, encoding='utf-8') as config_file:
+            config = yaml.safe_load(config_file)
+    except OSError as error:
+        raise WrongConfigException(
+            f'The config file {config_path} cannot be read: {error}') from error
+    except yaml.YAMLError as error:
+        raise WrongConfigException(
+            f'The config file {config_path} is not valid YAML: {error}') from error
+    config = _check_mapping(config, 'config file')
+    missing = [section for section in ConfigFormat.REQUIRED_SECTIONS.value
+               if section not in config]
+    if missing:
+        raise WrongConfigException(f'The config file misses the sections {missing}.')
+    # Storage
+    storage = _check_mapping(
+        config.get('storage', {'backend': StorageBackends.S3.value}), 'storage')
+    s3_config = None
+    if storage.get('backend') == StorageBackends.LOCAL.value:
+        _check_keys(storage, ConfigFormat.LOCAL_STORAGE_KEYS.value, 'storage')
+    elif storage.get('backend') == StorageBackends.S3.value:
+        s3_config = _check_mapping(config.get('s3'), 's3')
+        _check_keys(s3_config, ConfigFormat.S3_KEYS.value, 's3')
+    else:
+        raise WrongConfigException(
+            f'The storage backend {storage.get("backend")!r} is not supported, use one of '
+            f'{[backend.value for backend in StorageBackends]}.')
+    meta = _check_mapping(config['meta'], 'meta')
+    _check_keys(meta, ['meta_key'], 'meta')
+    run = _create(XetraRunConfig, config.get('run') or {}, 'run')
+    if run.engine not in [engine.value for engine in ETLEngines]:
+        raise WrongConfigException(
+            f'The engine {run.engine!r} in section run is not supported, use one of '
+            f'{[engine.value for engine in ETLEngines]}.')
+    # Reports on one shared extract
+    reports = None
+    if config.get('reports') is not None:
+        if not isinstance(config['reports'], list):
+            raise WrongConfigException('The section reports must be a list.')
+        reports = [_create_report(report, index)
+                   for index, report in enumerate(config['reports'])]
+        names = [report.name for report in reports]
+        if len(set(names)) != len(names):
+            raise WrongConfigException(f'The report names {names} are not unique.')
+        if run.max_memory_mb:
+            raise WrongConfigException(
+                'The max_memory_mb in section run limits the memory of report 1 only and '
+                'cannot be combined with the section reports.')
+    source = _check_universe(_create(XetraSourceConfig, config['source'], 'source'))
+    compaction = None
+    if config.get('compaction') is not None:
+        compaction = _create(XetraCompactionConfig, config['compaction'], 'compaction')
+    return XetraJobConfig(
+        logging=_check_mapping(config['logging'], 'logging'),
+        storage=storage,
+        s3=s3_config,
+        source=source,
+        target=_create(XetraTargetConfig, config['target'], 'target'),
+        meta_key=meta['meta_key'],
+        run=run,
+        reports=reports,
+        compaction=compaction)
+
+
+def _create_report(report: dict, index: int):
+    """
+    Helper function for load_config() validating the configuration of one report
+    """
+    section = f'reports[{index}]'
+    report = _check_mapping(report, section)
+    _check_keys(report, ['name', 'report', 'meta_key', 'target'], section)
+    if report['report'] not in [xetra_report.value for xetra_report in XetraReports]:
+        raise WrongConfigException(
+            f'The report {report["report"]!r} in section {section} is not supported, use '
+            f'one of {[xetra_report.value for xetra_report in XetraReports]}.')
+    return XetraReportConfig(
+        name=report['name'],
+        report=report['report'],
+        meta_key=report['meta_key'],
+        trg_args=_create(XetraTargetConfig, report['target'], f'{section}.target'))
+
+
+def _check_universe(source: XetraSourceConfig):
+    """
+    Helper function for load_config() checking the allow-lists of the source section,
+    every allow-list is a non-empty list of strings on one of the source columns
+    """
+    for field, column in [('src_isins', source.src_col_isin),
+                          ('src_mnemonics', source.src_col_mnemonic),
+                          ('src_security_types', source.src_col_security_type)]:
+        values = getattr(source, field)
+        if values is None:
+            continue
+        if not isinstance(values, list) or not values or not all(
+                isinstance(value, str) for value in values):
+            raise WrongConfigException(
+                f'The key {field} in section source must be a non-empty list of strings.')
+        if column not in source.src_columns:
+            raise WrongConfigException(
+                f'The key {field} in section source filters the column {column!r}, '
+                f'which is not in src_columns.')
+    return source
+
+
+def _create(config_class, values: dict, section: str):
+    """
+    Helper function for load_config() creating a NamedTuple configuration class,
+    all fields without default are required and unknown keys are rejected
+    """
+    values = _check_mapping(values, section)
+    unknown = sorted(set(values) - set(config_class._fields))
+    if unknown:
+        raise WrongConfigException(f'The section {section} has the unknown keys {unknown}.')
+    _check_keys(values, [field for field in config_class._fields
+                         if field not in config_class._field_defaults], section)
+    return config_class(**values)
+
+
+def _check_keys(values: dict, keys: list, section: str):
+    """
+    Helper function for load_config() checking that all required keys of a section are given
+    """
+    missing = [key for key in keys if key not in values]
+    if missing:
+        raise WrongConfigException(f'The section {section} misses the keys {missing}.')
+
+
+def _check_mapping(values, section: str):
+    """
+    Helper function for load_config() checking that a section is a mapping
+    """
+    if not isinstance(values, dict):
+        raise WrongConfigException(f'The section {section} must be a mapping.')
+    return values
@@ -24,3 +24,188 @@ class MetaProcessFormat(Enum):
     META_SOURCE_DATE_COL = 'source_date'
     META_PROCESS_COL = 'datetime_of_processing'
     META_FILE_FORMAT = 'csv'
+    META_UPDATE_RETRIES = 8
+    META_UPDATE_BACKOFF = 0.05
+
+
+class IntermediateFormat(Enum):
+    """
+    Formation for IntermediateStore class
+    """
+
+    MANIFEST_FILE = 'manifest.json'
+    MANIFEST_DAYS_KEY = 'days'
+    DAY_FILE_FORMAT = 'parquet'
+
+
+class DayCacheFormat(Enum):
+    """
+    Formation for DayCache class
+    """
+
+    DAY_FILE_FORMAT = 'arrow'
+    COMPACT_SUFFIX = '_compact'
+
+
+class ListingFormat(Enum):
+    """
+    Formation for ListingManifest class
+    """
+
+    MANIFEST_DATES_KEY = 'dates'
+    LISTED_AT_KEY = 'listed_at'
+    CLOSED_KEY = 'closed'
+    OBJECTS_KEY = 'objects'
+    # Today and yesterday are listed live, older dates are closed
+    OPEN_DAYS = 2
+
+
+class LoadManifestFormat(Enum):
+    """
+    Formation for LoadManifest class
+    """
+
+    OUTPUTS_KEY = 'outputs'
+    HASHES_KEY = 'hashes'
+    TARGET_KEY = 'key'
+    WRITTEN_AT_KEY = 'written_at'
+    # Partition name of outputs written as one file
+    SINGLE_PARTITION = 'all'
+
+
+class CompactionFormat(Enum):
+    """
+    Formation for XetraReportCompaction class
+    """
+
+    FILE_FORMAT = 'parquet'
+    MONTHLY_BUCKET_FORMAT = '%Y-%m'
+    SOURCES_KEY = 'sources'
+    BUCKETS_KEY = 'buckets'
+    TARGET_KEY = 'key'
+    ROWS_KEY = 'rows'
+    UPDATED_AT_KEY = 'updated_at'
+
+
+class SpillFormat(Enum):
+    """
+    Formation for SpillStore class
+    """
+
+    PARTITION_DIR = 'partition'
+    FILE_FORMAT = 'parquet'
+    BUDGET_FRACTION = 0.5
+
+
+class PlanFormat(Enum):
+    """
+    Formation for XetraRunPlanner class
+    """
+
+    # A header-only Xetra source file has 136 bytes, a header with one row about 240
+    HEADER_ONLY_MAX_BYTES = 200
+    META_GETS = 2
+
+
+class ShardFormat(Enum):
+    """
+    Formation for the sharded runs of XetraShardedRun class
+    """
+
+    SHARD_DIR = 'shards'
+    PART_FORMAT = 'parquet'
+    DELTA_FORMAT = 'json'
+    DELTA_DATES_KEY = 'dates'
+    DELTA_ROWS_KEY = 'rows'
+
+
+class PartialAggregateFormat(Enum):
+    """
+    Formation for the partial aggregates per ISIN and day
+    """
+
+    FIRST_TIME_COL = 'first_time'
+    LAST_TIME_COL = 'last_time'
+    REPORT_DECIMALS = 2
+
+
+class SummaryFormat(Enum):
+    """
+    Formation for the cached partial aggregates per source file
+    """
+
+    FILE_FORMAT = 'parquet'
+    OP_PRICE_COL = 'op_price'
+    CLOS_PRICE_COL = 'clos_price'
+    MIN_PRICE_COL = 'min_price'
+    MAX_PRICE_COL = 'max_price'
+    TRADED_VOL_COL = 'traded_vol'
+
+
+class CompactSchemaFormat(Enum):
+    """
+    Formation for the compact in-memory schema of the Xetra source data
+    """
+
+    DATE_FORMAT = '%Y-%m-%d'
+    TIME_LENGTH = 5
+    PRICE_DECIMALS = 4
+
+
+class FilteredReadFormat(Enum):
+    """
+    Formation for reading csv files in chunks that are filtered while parsing
+    """
+
+    CHUNK_ROWS = 100000
+    BLOCK_SIZE = 1 << 22
+
+
+class BatchWriteFormat(Enum):
+    """
+    Formation for writing many partitions of an output at once
+    """
+
+    COMMIT_MARKER = '_SUCCESS'
+    PARTS_KEY = 'parts'
+    ROWS_KEY = 'rows'
+
+
+class StorageBackends(Enum):
+    """
+    Storage backends the Xetra ETL job can read from and write to
+    """
+
+    S3 = 's3'
+    LOCAL = 'local'
+
+
+class ConfigFormat(Enum):
+    """
+    Formation for the configuration file of the Xetra ETL job
+    """
+
+    REQUIRED_SECTIONS = ('logging', 'source', 'target', 'meta')
+    LOCAL_STORAGE_KEYS = ('src_root', 'trg_root')
+    S3_KEYS = ('access_key', 'secret_key', 'src_endpoint_url', 'src_bucket',
+               'trg_endpoint_url', 'trg_bucket')
+
+
+class ETLEngines(Enum):
+    """
+    Engines the XetraETL transformations can run on
+    """
+
+    PANDAS = 'pandas'
+    ARROW = 'arrow'
+    POLARS = 'polars'
+
+
+class XetraReports(Enum):
+    """
+    Reports the Xetra ETL job can create
+    """
+
+    REPORT1 = 'report1'
+    INTRADAY_BARS = 'intraday_bars'
+    ROLLING_WINDOWS = 'rolling_windows'
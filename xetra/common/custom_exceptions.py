@@ -16,3 +16,58 @@ class WrongMetaFileException(Exception):
     Exception that can be raised when the meta file format is not correct
 
     """
+
+
+class WrongEngineException(Exception):
+    """
+    WrongEngineException class
+
+    Exception that can be raised when the configured transformation engine is not supported
+    """
+
+
+class WrongReportException(Exception):
+    """
+    WrongReportException class
+
+    Exception that can be raised when a configured report is not supported
+    """
+
+
+class WrongShardException(Exception):
+    """
+    WrongShardException class
+
+    Exception that can be raised when a shard index is out of range or when shards
+    of a sharded run are missing at the finalize step
+    """
+
+
+class ConcurrentUpdateException(Exception):
+    """
+    ConcurrentUpdateException class
+
+    Exception that can be raised when a conditional write fails because the object
+    was changed by another run since it was read
+    """
+
+
+class PartialWriteException(Exception):
+    """
+    PartialWriteException class
+
+    Exception that can be raised when some parts of a batched write failed,
+    the errors are kept by target key in failures
+    """
+
+    def __init__(self, failures: dict):
+        super().__init__(f'Writing {len(failures)} parts failed: {sorted(failures)}')
+        self.failures = failures
+
+
+class WrongConfigException(Exception):
+    """
+    WrongConfigException class
+
+    Exception that can be raised when the configuration file of the job is invalid
+    """
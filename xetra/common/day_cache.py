@@ -0,0 +1,100 @@
+"""
+Methods for caching extracted source days locally as Arrow IPC files
+"""
+import hashlib
+import logging
+import os
+
+import pyarrow as pa
+
+from xetra.common.constants import DayCacheFormat
+from xetra.common.spill import SpillStore
+
+
+class DayCache():
+    """
+    Class for caching the extracted data of closed source days as uncompressed Arrow IPC
+    (Feather) files, which are opened memory-mapped without parsing or copying
+
+    The files are kept across runs in a sub directory per namespace, e.g. per engine
+    and source columns, as the extracted data of the engines differ in their types.
+    """
+
+    def __init__(self, cache_dir: str, namespace: str):
+        """
+        Constructor for DayCache
+
+        Params:
+            cache_dir (str): local directory holding the cached days of all namespaces
+            namespace (str): name of the layout of the cached data
+        """
+        self._logger = logging.getLogger(__name__)
+        self.cache_dir = os.path.join(cache_dir, namespace)
+
+    @staticmethod
+    def create_namespace(engine: str, compact: bool, columns: list, universe: str = ''):
+        """
+        Creating the namespace of the extracted data of an engine
+
+        Params:
+            engine (str): engine of the transformations
+            compact (bool): True if the data is in the compact schema
+            columns (list): source columns
+            universe (str): fingerprint of the source allow-lists, '' for all rows
+
+        Returns:
+            namespace (str): name of the layout of the cached data
+        """
+        columns_hash = hashlib.sha1('|'.join(
+            list(columns) + ([universe] if universe else [])).encode('utf-8')).hexdigest()[:8]
+        suffix = DayCacheFormat.COMPACT_SUFFIX.value if compact else ''
+        return f'{engine}{suffix}_{columns_hash}'
+
+    def has_day(self, date: str):
+        """
+        Checking if the data of a day is cached
+
+        Params:
+            date (str): source date
+
+        Returns:
+            True if the day is cached
+        """
+        return os.path.isfile(self._day_path(date))
+
+    def read_day(self, date: str):
+        """
+        Opening the cached data of a day memory-mapped, the buffers of the returned
+        table point into the mapped file
+
+        Params:
+            date (str): source date
+
+        Returns:
+            table (pa.Table): data of the day
+        """
+        self._logger.info('Reading cached day %s', date)
+        with pa.memory_map(self._day_path(date)) as mapped_file:
+            return pa.ipc.open_file(mapped_file).read_all()
+
+    def write_day(self, date: str, data_frame):
+        """
+        Caching the data of a day
+
+        Params:
+            date (str): source date
+            data_frame (pd.DataFrame | pa.Table | pl.DataFrame): data of the day
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        table = SpillStore.to_table(data_frame)
+        tmp_path = f'{self._day_path(date)}.tmp'
+        with pa.OSFile(tmp_path, 'wb') as out_file:
+            with pa.ipc.new_file(out_file, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp_path, self._day_path(date))
+
+    def _day_path(self, date: str):
+        """
+        Helper function returning the local path of the file of a day
+        """
+        return os.path.join(self.cache_dir, f'{date}.{DayCacheFormat.DAY_FILE_FORMAT.value}')
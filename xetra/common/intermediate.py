@@ -0,0 +1,166 @@
+"""
+Methods for persisting extracted source data locally between runs
+"""
+import hashlib
+import json
+import logging
+import os
+import shutil
+
+import pandas as pd
+import pyarrow as pa
+from pyarrow import parquet as pq
+
+from xetra.common.constants import IntermediateFormat
+
+
+class IntermediateStore():
+    """
+    Class for persisting the extracted source data of each day as local parquet files
+    together with a run manifest, so a failed run can be resumed
+    """
+
+    def __init__(self, base_dir: str, run_id: str):
+        """
+        Constructor for IntermediateStore
+
+        Params:
+            base_dir (str): local directory holding the intermediate files of all runs
+            run_id (str): identifier of the run, used as sub directory of base_dir
+        """
+        self._logger = logging.getLogger(__name__)
+        self.run_dir = os.path.join(base_dir, run_id)
+        self._manifest_path = os.path.join(
+            self.run_dir, IntermediateFormat.MANIFEST_FILE.value)
+        self.manifest = self._read_manifest()
+
+    @staticmethod
+    def create_run_id(meta_key: str, first_date: str, universe: str = ''):
+        """
+        Creating a run id that is stable across retries of the same run,
+        also if the retry extends the date list to a later day
+
+        Params:
+            meta_key (str): key of the meta file on the target
+            first_date (str): first date that is extracted from the source
+            universe (str): fingerprint of the source allow-lists, '' for all rows
+
+        Returns:
+            run_id (str): identifier of the run
+        """
+        run_key = '|'.join([meta_key, first_date] + ([universe] if universe else []))
+        return hashlib.sha1(run_key.encode('utf-8')).hexdigest()[:16]
+
+    def has_day(self, date: str):
+        """
+        Checking if the data of a day is already persisted
+
+        Params:
+            date (str): source date
+
+        Returns:
+            True if the day is in the run manifest
+        """
+        return date in self.manifest[IntermediateFormat.MANIFEST_DAYS_KEY.value]
+
+    def day_keys(self, date: str):
+        """
+        Returning the source keys that are persisted for a day
+
+        Params:
+            date (str): source date
+
+        Returns:
+            keys (list): source keys of the day that are already persisted
+        """
+        return self.manifest[IntermediateFormat.MANIFEST_DAYS_KEY.value][date]['keys']
+
+    def is_complete(self, date: str):
+        """
+        Checking if a persisted day was already closed when it was persisted
+
+        Params:
+            date (str): source date
+
+        Returns:
+            True if no more source files can be published for the persisted day
+        """
+        return self.manifest[IntermediateFormat.MANIFEST_DAYS_KEY.value][date].get(
+            'complete', False)
+
+    def read_day(self, date: str, as_table: bool = False):
+        """
+        Reading the persisted data of a day
+
+        Params:
+            date (str): source date
+            as_table (bool): returns an Arrow table instead of a Pandas DataFrame
+
+        Returns:
+            data_frame (pd.DataFrame | pa.Table): data of the day
+        """
+        day = self.manifest[IntermediateFormat.MANIFEST_DAYS_KEY.value][date]
+        if not day['rows']:
+            return pa.table({}) if as_table else pd.DataFrame()
+        self._logger.info('Reading intermediate file of %s', date)
+        if as_table:
+            return pq.read_table(self._day_path(date))
+        return pd.read_parquet(self._day_path(date))
+
+    def write_day(self, date: str, data_frame, keys: list, complete: bool = True):
+        """
+        Persisting the data of a day and registering it in the run manifest
+
+        Params:
+            date (str): source date
+            data_frame (pd.DataFrame | pa.Table | pl.DataFrame): data of the day
+            keys (list): source keys the data was read from
+            complete (bool): False if more source files can be published for the day
+        """
+        os.makedirs(self.run_dir, exist_ok=True)
+        if hasattr(data_frame, 'to_arrow'):
+            # Polars DataFrame
+            data_frame = data_frame.to_arrow()
+        if len(data_frame):
+            tmp_path = f'{self._day_path(date)}.tmp'
+            if isinstance(data_frame, pa.Table):
+                pq.write_table(data_frame, tmp_path)
+            else:
+                data_frame.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, self._day_path(date))
+        self.manifest[IntermediateFormat.MANIFEST_DAYS_KEY.value][date] = {
+            'keys': list(keys), 'rows': len(data_frame), 'complete': complete}
+        self._write_manifest()
+
+    def clear(self):
+        """
+        Removing all intermediate files of the run
+        """
+        if os.path.isdir(self.run_dir):
+            shutil.rmtree(self.run_dir)
+        self.manifest = {IntermediateFormat.MANIFEST_DAYS_KEY.value: {}}
+
+    def _day_path(self, date: str):
+        """
+        Helper function returning the local path of the file of a day
+        """
+        return os.path.join(
+            self.run_dir, f'{date}.{IntermediateFormat.DAY_FILE_FORMAT.value}')
+
+    def _read_manifest(self):
+        """
+        Helper function reading the run manifest, if there is none an empty one is returned
+        """
+        if not os.path.isfile(self._manifest_path):
+            return {IntermediateFormat.MANIFEST_DAYS_KEY.value: {}}
+        with open(self._manifest_path, encoding='utf-8') as manifest_file:
+            return json.load(manifest_file)
+
+    def _write_manifest(self):
+        """
+        Helper function writing the run manifest atomically
+        """
+        tmp_path = f'{self._manifest_path}.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as manifest_file:
+            json.dump(self.manifest, manifest_file)
+        os.replace(tmp_path, self._manifest_path)
@@ -0,0 +1,122 @@
+"""
+Methods for caching the listing of the source dates in a manifest
+"""
+from datetime import datetime, timedelta
+import json
+import logging
+
+from xetra.common.constants import ListingFormat, MetaProcessFormat
+from xetra.common.storage import StorageConnector
+
+
+class ListingManifest():
+    """
+    Class for serving the source listing of a date from a manifest of keys, sizes and
+    ETags, so the immutable past dates are listed only once
+
+    Dates older than yesterday are closed and served from the manifest once they were
+    listed as closed. Today and yesterday are listed live unless their listing is
+    younger than refresh_seconds.
+    """
+
+    def __init__(self, s3_bucket_src: StorageConnector, s3_bucket_manifest: StorageConnector,
+                 manifest_key: str, refresh_seconds: int = 0):
+        """
+        Constructor for ListingManifest
+
+        Params:
+            s3_bucket_src (StorageConnector): connection to the listed source storage
+            s3_bucket_manifest (StorageConnector): connection to the storage of the manifest
+            manifest_key (str): key of the manifest file
+            refresh_seconds (int): age in seconds up to which the listing of today and
+                                   yesterday is served from the manifest
+        """
+        self._logger = logging.getLogger(__name__)
+        self.s3_bucket_src = s3_bucket_src
+        self.s3_bucket_manifest = s3_bucket_manifest
+        self.manifest_key = manifest_key
+        self.refresh_seconds = refresh_seconds
+        self.manifest = self._read_manifest()
+        self._changed = False
+
+    def list_objects(self, date: str):
+        """
+        Returning the source objects of a date, from the manifest if possible
+
+        Params:
+            date (str): source date
+
+        Returns:
+            objects (dict): dictionary with the keys 'size' and 'etag' by source key
+        """
+        entry = self.manifest[ListingFormat.MANIFEST_DATES_KEY.value].get(date)
+        if entry and self._is_fresh(date, entry):
+            return entry[ListingFormat.OBJECTS_KEY.value]
+        objects = self.s3_bucket_src.list_objects_in_prefix(date)
+        self.manifest[ListingFormat.MANIFEST_DATES_KEY.value][date] = {
+            ListingFormat.LISTED_AT_KEY.value: datetime.today().strftime(
+                MetaProcessFormat.META_PROCESS_DATE_FORMAT.value),
+            ListingFormat.CLOSED_KEY.value: self.is_closed(date),
+            ListingFormat.OBJECTS_KEY.value: objects,
+        }
+        self._changed = True
+        return objects
+
+    def list_files(self, date: str):
+        """
+        Returning the source keys of a date, from the manifest if possible
+
+        Params:
+            date (str): source date
+
+        Returns:
+            files (list): sorted source keys of the date
+        """
+        return sorted(self.list_objects(date))
+
+    def save(self):
+        """
+        Writing the manifest to its storage if a date was listed live
+        """
+        if self._changed:
+            self.s3_bucket_manifest.write_object(
+                json.dumps(self.manifest), self.manifest_key)
+            self._changed = False
+
+    @staticmethod
+    def is_closed(date: str):
+        """
+        Checking if no more source files are published for a date
+
+        Params:
+            date (str): source date
+
+        Returns:
+            True if the date is older than yesterday
+        """
+        first_open_date = (datetime.today().date() - timedelta(
+            days=ListingFormat.OPEN_DAYS.value - 1)).strftime(
+                MetaProcessFormat.META_DATE_FORMAT.value)
+        return date < first_open_date
+
+    def _is_fresh(self, date: str, entry: dict):
+        """
+        Helper function checking if the listing of a date in the manifest can be served
+        """
+        if entry[ListingFormat.CLOSED_KEY.value]:
+            return True
+        if self.is_closed(date):
+            # Listed while it was open, the last files may be missing
+            return False
+        listed_at = datetime.strptime(entry[ListingFormat.LISTED_AT_KEY.value],
+                                      MetaProcessFormat.META_PROCESS_DATE_FORMAT.value)
+        return (datetime.today() - listed_at).total_seconds() < self.refresh_seconds
+
+    def _read_manifest(self):
+        """
+        Helper function reading the manifest, if there is none an empty one is returned
+        """
+        try:
+            return json.loads(self.s3_bucket_manifest.read_object(self.manifest_key))
+        except self.s3_bucket_manifest.key_not_found_exception:
+            return {ListingFormat.MANIFEST_DATES_KEY.value: {}}
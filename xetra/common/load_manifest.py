@@ -0,0 +1,90 @@
+"""
+Methods for skipping the load of unchanged outputs by their content hash
+"""
+from datetime import datetime
+import hashlib
+import json
+import logging
+
+import pandas as pd
+
+from xetra.common.constants import LoadManifestFormat, MetaProcessFormat
+from xetra.common.storage import StorageConnector
+
+
+class LoadManifest():
+    """
+    Class for keeping the content hashes of the partitions of the last written outputs
+    in a manifest, so an output whose partitions are unchanged is not written again
+    """
+
+    def __init__(self, s3_bucket: StorageConnector, manifest_key: str):
+        """
+        Constructor for LoadManifest
+
+        Params:
+            s3_bucket (StorageConnector): connection to the storage of the manifest
+            manifest_key (str): key of the manifest file
+        """
+        self._logger = logging.getLogger(__name__)
+        self.s3_bucket = s3_bucket
+        self.manifest_key = manifest_key
+        self.manifest = self._read_manifest()
+
+    @staticmethod
+    def content_hash(data_frame: pd.DataFrame):
+        """
+        Computing the hash of the content of a Pandas DataFrame, independent of its index
+
+        Params:
+            data_frame (pd.DataFrame): partition of an output
+
+        Returns:
+            content_hash (str): SHA-256 hex digest of the columns, types and values
+        """
+        content_hash = hashlib.sha256(json.dumps(
+            [[str(column), str(dtype)] for column, dtype in data_frame.dtypes.items()]
+        ).encode('utf-8'))
+        content_hash.update(pd.util.hash_pandas_object(
+            data_frame, index=False).to_numpy().tobytes())
+        return content_hash.hexdigest()
+
+    def is_unchanged(self, output: str, hashes: dict):
+        """
+        Checking if the partitions of an output equal the last written ones
+
+        Params:
+            output (str): name of the output, e.g. the target key prefix
+            hashes (dict): content hash by partition name
+
+        Returns:
+            True if the output was written before with the same partitions
+        """
+        entry = self.manifest[LoadManifestFormat.OUTPUTS_KEY.value].get(output)
+        return bool(entry) and entry[LoadManifestFormat.HASHES_KEY.value] == hashes
+
+    def record(self, output: str, hashes: dict, target_key: str):
+        """
+        Saving the content hashes of a written output to the manifest
+
+        Params:
+            output (str): name of the output, e.g. the target key prefix
+            hashes (dict): content hash by partition name
+            target_key (str): key or prefix the output was written to
+        """
+        self.manifest[LoadManifestFormat.OUTPUTS_KEY.value][output] = {
+            LoadManifestFormat.HASHES_KEY.value: hashes,
+            LoadManifestFormat.TARGET_KEY.value: target_key,
+            LoadManifestFormat.WRITTEN_AT_KEY.value: datetime.today().strftime(
+                MetaProcessFormat.META_PROCESS_DATE_FORMAT.value),
+        }
+        self.s3_bucket.write_object(json.dumps(self.manifest), self.manifest_key)
+
+    def _read_manifest(self):
+        """
+        Helper function reading the manifest, if there is none an empty one is returned
+        """
+        try:
+            return json.loads(self.s3_bucket.read_object(self.manifest_key))
+        except self.s3_bucket.key_not_found_exception:
+            return {LoadManifestFormat.OUTPUTS_KEY.value: {}}
@@ -0,0 +1,240 @@
+"""Connector and methods accessing a local directory"""
+import fcntl
+import mmap
+import os
+
+import pyarrow as pa
+from pyarrow import csv as pa_csv
+
+from xetra.common.custom_exceptions import ConcurrentUpdateException
+from xetra.common.storage import StorageConnector
+
+
+class LocalStorageConnector(StorageConnector):
+    """
+    Class for interacting with a local directory mirroring a bucket,
+    the keys are paths relative to the root directory
+    """
+
+    def __init__(self, root_dir: str):
+        """
+        Constructor for LocalStorageConnector
+
+        Params:
+            root_dir (str): local directory holding the objects
+        """
+        super().__init__(os.path.abspath(root_dir))
+        self.root_dir = os.path.abspath(root_dir)
+
+    @property
+    def key_not_found_exception(self):
+        """
+        Exception class raised by read_object when the key does not exist
+        """
+        return FileNotFoundError
+
+    def list_files_in_prefix(self, prefix: str):
+        """Listing all files with a prefix in the local directory
+
+        Params:
+            prefix (str): prefix of the keys that should be filtererd with
+
+        Returns:
+            files (lst): list of all file names containing the prefix in the key
+        """
+        with self.metrics.s3_call('LIST'):
+            # Only walking the deepest directory that is fully part of the prefix
+            start_dir = os.path.join(self.root_dir, os.path.dirname(prefix))
+            files = []
+            for dir_path, _, file_names in os.walk(start_dir):
+                rel_dir = os.path.relpath(dir_path, self.root_dir).replace(os.sep, '/')
+                files.extend(
+                    key for key in (
+                        file_name if rel_dir == '.' else f'{rel_dir}/{file_name}'
+                        for file_name in file_names)
+                    if key.startswith(prefix) and not key.endswith(('.tmp', '.lock')))
+        return sorted(files)
+
+    def list_objects_in_prefix(self, prefix: str):
+        """Listing all files with a prefix in the local directory together with their
+        size and ETag
+
+        Params:
+            prefix (str): prefix of the keys that should be filtererd with
+
+        Returns:
+            objects (dict): dictionary with the keys 'size' and 'etag' by file name
+                            containing the prefix in the key
+        """
+        objects = {}
+        for key in self.list_files_in_prefix(prefix):
+            stat_result = os.stat(self._path(key))
+            objects[key] = {'size': stat_result.st_size, 'etag': self._etag(stat_result)}
+        return objects
+
+    def read_object(self, key: str):
+        """Reading the content of an object from the local directory
+
+        Params:
+            key (str): key of the object that should be read
+
+        Returns:
+            body (bytes): content of the object
+        """
+        with self.metrics.s3_call('GET') as call:
+            with open(self._path(key), 'rb') as in_file:
+                body = in_file.read()
+            call.nbytes = len(body)
+        return body
+
+    def read_csv_to_df(
+            self, key: str, encoding: str = 'utf-8', sep: str = ',', row_filter=None,
+            line_filter=None):
+        """Reading a csv file memory-mapped from the local directory, files with a line
+        filter are read like in StorageConnector
+
+        Params:
+            key (str): key of the file that should be read
+            encoding (str): encoding of the data inside the file
+            sep (str): seperator of teh csv file
+            row_filter (callable): function filtering each parsed chunk of the file,
+                                   None keeps all rows
+            line_filter (callable): function removing lines of the file before it is
+                                    parsed, None keeps all lines
+
+        Returns:
+            data_frame (DataFrame): Pandas DataFrame containing the csv file
+        """
+        path = self._path(key)
+        if os.path.getsize(path) == 0 or line_filter is not None:
+            # Empty files can not be memory-mapped, filtered lines are copied anyway
+            return super().read_csv_to_df(key, encoding, sep, row_filter, line_filter)
+        self._logger.info('Reading file %s/%s', self.location, key)
+        with self.metrics.s3_call('GET') as call:
+            with open(path, 'rb') as in_file, mmap.mmap(
+                    in_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+                call.nbytes = len(mapped_file)
+                data_frame = self._parse_csv(mapped_file, row_filter, sep=sep,
+                                             encoding=encoding)
+        return data_frame
+
+    def read_csv_to_table(self, key: str, convert_options: pa_csv.ConvertOptions = None,
+                          row_filter=None, line_filter=None):
+        """Reading a csv file memory-mapped from the local directory into an Arrow table,
+        files with a line filter are read like in StorageConnector
+
+        Params:
+            key (str): key of the file that should be read
+            convert_options (pa_csv.ConvertOptions): column selection and types
+            row_filter (callable): function filtering each parsed record batch of the file,
+                                   None keeps all rows
+            line_filter (callable): function removing lines of the file before it is
+                                    parsed, None keeps all lines
+
+        Returns:
+            table (pa.Table): Arrow table containing the csv file
+        """
+        path = self._path(key)
+        if os.path.getsize(path) == 0 or line_filter is not None:
+            # Empty files can not be memory-mapped, filtered lines are copied anyway
+            return super().read_csv_to_table(key, convert_options, row_filter, line_filter)
+        self._logger.info('Reading file %s/%s', self.location, key)
+        with self.metrics.s3_call('GET') as call:
+            with pa.memory_map(path) as mapped_file:
+                call.nbytes = mapped_file.size()
+                table = self._parse_csv_table(mapped_file, convert_options, row_filter)
+        return table
+
+    def write_object(self, body, key: str):
+        """Writing the content of an object atomically to the local directory
+
+        Params:
+            body (bytes | str): content of the object
+            key (str): target key of the object
+        """
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        with self.metrics.s3_call('PUT') as call:
+            with open(f'{path}.tmp', 'wb') as out_file:
+                out_file.write(body)
+            os.replace(f'{path}.tmp', path)
+            call.nbytes = len(body)
+        return True
+
+    def read_object_with_etag(self, key: str):
+        """Reading the content of an object from the local directory together with its
+        ETag, which changes with every write of the object
+
+        Params:
+            key (str): key of the object that should be read
+
+        Returns:
+            body (bytes): content of the object
+            etag (str): ETag of the object
+        """
+        with self.metrics.s3_call('GET') as call:
+            with open(self._path(key), 'rb') as in_file:
+                etag = self._etag(os.fstat(in_file.fileno()))
+                body = in_file.read()
+            call.nbytes = len(body)
+        return body, etag
+
+    def write_object_if_match(self, body, key: str, etag: str):
+        """Writing the content of an object to the local directory while holding a lock
+        file, raises ConcurrentUpdateException if the object was changed since it was read
+
+        Params:
+            body (bytes | str): content of the object
+            key (str): target key of the object
+            etag (str): ETag of the object when it was read, None if it did not exist
+        """
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(f'{path}.lock', 'wb') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                current_etag = self._etag(os.stat(path))
+            except FileNotFoundError:
+                current_etag = None
+            if current_etag != etag:
+                raise ConcurrentUpdateException
+            return self.write_object(body, key)
+
+    def delete_objects_in_prefix(self, prefix: str):
+        """Deleting all objects with a prefix from the local directory
+
+        Params:
+            prefix (str): prefix of the keys of the objects that should be deleted
+        """
+        for key in self.list_files_in_prefix(prefix):
+            with self.metrics.s3_call('DELETE'):
+                os.remove(self._path(key))
+        return True
+
+    def exists(self, key: str):
+        """Checking if an object exists in the local directory
+
+        Params:
+            key (str): key of the object
+
+        Returns:
+            True if the object exists
+        """
+        return os.path.isfile(self._path(key))
+
+    @staticmethod
+    def _etag(stat_result: os.stat_result):
+        """
+        Helper function returning the ETag of a file from its inode, modification time
+        and size, every write replaces the file and creates a new inode
+        """
+        return (f'"{stat_result.st_ino:x}-{stat_result.st_mtime_ns:x}-'
+                f'{stat_result.st_size:x}"')
+
+    def _path(self, key: str):
+        """
+        Helper function returning the local path of a key
+        """
+        return os.path.join(self.root_dir, *key.split('/'))
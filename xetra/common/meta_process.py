@@ -4,11 +4,15 @@ Methods for processing the meta file
 
 import collections
 from datetime import datetime, timedelta
+import logging
+import random
+import time
+
 import pandas as pd
 
 from xetra.common.constants import MetaProcessFormat
-from xetra.common.custom_exceptions import WrongMetaFileException
-from xetra.common.s3 import S3BucketConnector
+from xetra.common.custom_exceptions import ConcurrentUpdateException, WrongMetaFileException
+from xetra.common.storage import StorageConnector
 
 
 class MetaProcess():
@@ -17,13 +21,17 @@ class MetaProcess():
     """
     @staticmethod
     def update_meta_file(extract_date_list: list, meta_key: str,
-                         s3_bucket_meta: S3BucketConnector):
+                         s3_bucket_meta: StorageConnector):
         """Updating the meta file with the processed Xetra dates and todays date as procesed date
 
+        The meta file is written with a conditional write on the ETag it was read with.
+        If another run updated the meta file in the meantime, the update is retried with
+        a randomized backoff on the new meta file, so no run loses the dates of another.
+
         Params:
             extract_date_list (list): list of dates that are extracted from the source
             meta_key (str): key of the meta file on the S3 bucket
-            s3_bucket_meta (S3BucketConnector): S3BucketConnector for the bucket with the meta file
+            s3_bucket_meta (StorageConnector): StorageConnector for the bucket with the meta file
         """
         # Creating an empty DataFrame using the meta file column names
         df_new = pd.DataFrame(columns=[
@@ -34,25 +42,33 @@ class MetaProcess():
         # Filling the processed column
         df_new[MetaProcessFormat.META_PROCESS_COL.value] = datetime.today().strftime(
             MetaProcessFormat.META_PROCESS_DATE_FORMAT.value)
-        try:
-            # If meta file exists -> union DataFrame of old and new meta data
-            # created
-            df_old = s3_bucket_meta.read_csv_to_df(meta_key)
-            if collections.Counter(
-                    df_old.columns) != collections.Counter(df_new.columns):
-                raise WrongMetaFileException
-            df_all = pd.concat([df_old, df_new])
-        except s3_bucket_meta.session.client('s3').exceptions.NoSuchKey:
-            # No meta file exists -> only the new data is used
-            df_all = df_new
-        # Writing to S3
-        s3_bucket_meta.write_df_to_s3(
-            df_all, meta_key, MetaProcessFormat.META_FILE_FORMAT.value)
-        return True
+        for attempt in range(MetaProcessFormat.META_UPDATE_RETRIES.value):
+            try:
+                # If meta file exists -> union DataFrame of old and new meta data
+                # created
+                df_old, etag = s3_bucket_meta.read_csv_to_df_with_etag(meta_key)
+                if collections.Counter(
+                        df_old.columns) != collections.Counter(df_new.columns):
+                    raise WrongMetaFileException
+                df_all = pd.concat([df_old, df_new])
+            except s3_bucket_meta.key_not_found_exception:
+                # No meta file exists -> only the new data is used
+                df_all, etag = df_new, None
+            try:
+                # Writing to S3 if the meta file was not changed by another run
+                s3_bucket_meta.write_df_to_s3_if_match(
+                    df_all, meta_key, MetaProcessFormat.META_FILE_FORMAT.value, etag)
+                return True
+            except ConcurrentUpdateException:
+                logging.getLogger(__name__).warning(
+                    'The meta file %s was updated by another run, retrying', meta_key)
+                time.sleep(random.uniform(
+                    0, MetaProcessFormat.META_UPDATE_BACKOFF.value * 2 ** attempt))
+        raise ConcurrentUpdateException
 
     @staticmethod
     def return_date_list(first_date: str, meta_key: str,
-                         s3_bucket_meta: S3BucketConnector):
+                         s3_bucket_meta: StorageConnector):
         """
         Creating a list of datees based on the input first_date
         and the already processed dates in the meta file
@@ -60,7 +76,7 @@ class MetaProcess():
         Params:
             first_date (str): the earliest date Xetra data should be processed
             meta_key (str): key of the meta file on S3 buckets
-            s3_bucket_meta (S3BucketConnector): S3BucketConnector for the bucket with the meta file
+            s3_bucket_meta (StorageConnector): StorageConnector for the bucket with the meta file
 
         Returns:
             return_min_date (str): first date that should be processed
@@ -93,7 +109,7 @@ class MetaProcess():
                 return_dates = []
                 return_min_date = datetime(2200, 1, 1).date().strftime(
                     MetaProcessFormat.META_DATE_FORMAT.value)
-        except s3_bucket_meta.session.client('s3').exceptions.NoSuchKey:
+        except s3_bucket_meta.key_not_found_exception:
             # No meta file found -> creating a date list from first_date - 1
             # day until today
             return_min_date = first_date
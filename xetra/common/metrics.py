@@ -0,0 +1,142 @@
+"""Instrumentation of the ETL runs"""
+import threading
+import time
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+
+class _NullRecord():
+    """
+    Record that is used when the instrumentation is disabled, does nothing
+    """
+    nbytes = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def __setattr__(self, name, value):
+        pass
+
+
+_NULL_RECORD = _NullRecord()
+# Records of concurrent S3 calls, e.g. of batched writes, update the same totals
+_RECORD_LOCK = threading.Lock()
+
+
+class _TimedRecord():
+    """
+    Record measuring the wall and CPU time of a stage or S3 call
+    """
+
+    def __init__(self, target: dict):
+        self._target = target
+        self._wall_start = 0.0
+        self._cpu_start = 0.0
+        self.nbytes = 0
+
+    def __enter__(self):
+        self._wall_start = time.perf_counter()
+        self._cpu_start = time.process_time()
+        return self
+
+    def __exit__(self, *exc_info):
+        wall_s = time.perf_counter() - self._wall_start
+        cpu_s = time.process_time() - self._cpu_start
+        with _RECORD_LOCK:
+            self._target['count'] = self._target.get('count', 0) + 1
+            self._target['wall_s'] = self._target.get('wall_s', 0.0) + wall_s
+            self._target['cpu_s'] = self._target.get('cpu_s', 0.0) + cpu_s
+            self._target['bytes'] = self._target.get('bytes', 0) + self.nbytes
+            self._target['peak_rss_mb'] = RunMetrics.peak_rss_mb()
+        return False
+
+
+class RunMetrics():
+    """
+    Class collecting wall and CPU time per stage and per S3 operation,
+    transferred bytes, object counts, row counts and the peak memory of a run
+    """
+
+    def __init__(self, enabled: bool = False):
+        """
+        Constructor for RunMetrics
+
+        Params:
+            enabled (bool): if False nothing is measured and the overhead is a method call
+        """
+        self.enabled = enabled
+        self.stages = {}
+        self.s3_calls = {}
+        self.rows = {}
+        self._started = time.time()
+
+    def stage(self, name: str):
+        """
+        Measuring a stage of the run
+
+        Params:
+            name (str): name of the stage
+
+        Returns:
+            record (context manager): measures the time spent inside the with block
+        """
+        if not self.enabled:
+            return _NULL_RECORD
+        return _TimedRecord(self.stages.setdefault(name, {}))
+
+    def s3_call(self, operation: str):
+        """
+        Measuring a S3 call, the transferred bytes can be set on the returned record
+
+        Params:
+            operation (str): S3 operation, e.g. GET, PUT or LIST
+
+        Returns:
+            record (context manager): measures the time spent inside the with block
+        """
+        if not self.enabled:
+            return _NULL_RECORD
+        return _TimedRecord(self.s3_calls.setdefault(operation, {}))
+
+    def add_rows(self, stage: str, rows_in: int, rows_out: int):
+        """
+        Registering the rows going into and coming out of a stage
+
+        Params:
+            stage (str): name of the stage
+            rows_in (int): number of input rows
+            rows_out (int): number of output rows
+        """
+        if self.enabled:
+            self.rows[stage] = {'rows_in': rows_in, 'rows_out': rows_out}
+
+    def report(self):
+        """
+        Creating the run report
+
+        Returns:
+            report (dict): JSON serializable run report
+        """
+        return {
+            'started_at': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(self._started)),
+            'wall_s': time.time() - self._started,
+            'stages': self.stages,
+            's3_calls': self.s3_calls,
+            'rows': self.rows,
+            'peak_rss_mb': self.peak_rss_mb(),
+        }
+
+    @staticmethod
+    def peak_rss_mb():
+        """
+        Returning the peak resident memory of the process in MB, None if unknown
+        """
+        if resource is None:
+            return None
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
@@ -1,19 +1,14 @@
 """Connector and methods accessing S3"""
-from io import StringIO, BytesIO
-
 import os
-import logging
-
-
-import pandas as pd
 
 import boto3
+from botocore.exceptions import ClientError
 
-from xetra.common.constants import S3FileTypes
-from xetra.common.custom_exceptions import WrongFormatException
+from xetra.common.custom_exceptions import ConcurrentUpdateException
+from xetra.common.storage import StorageConnector
 
 
-class S3BucketConnector():
+class S3BucketConnector(StorageConnector):
     """
     Class for interacting with S3 buckets
     """
@@ -29,15 +24,24 @@ class S3BucketConnector():
             endpoint_url (str): endpoint url to S3 from AWS account
             bucket (str): S3 bucket name from AWS account
         """
-        self._logger = logging.getLogger(__name__)
+        super().__init__(f'{endpoint_url}/{bucket}')
         self._endpoint_url = endpoint_url
         self.session = boto3.Session(aws_access_key_id=os.environ[access_key],
                                      aws_secret_access_key=os.environ[secret_key])
         self._s3 = self.session.resource(
             service_name='s3', endpoint_url=endpoint_url)
         self._bucket = self._s3.Bucket(bucket)
+        # Unlike the resource, the low-level client can be shared by threads, e.g. by
+        # the concurrent uploads of write_dfs_to_s3
+        self._client = self._s3.meta.client
+
+    @property
+    def key_not_found_exception(self):
+        """
+        Exception class raised by read_object when the key does not exist
+        """
+        return self._s3.meta.client.exceptions.NoSuchKey
 
-   
     def list_files_in_prefix(self, prefix: str):
         """Listing all files with a prefix on the S3 Bucket
 
@@ -47,69 +51,113 @@ class S3BucketConnector():
         Returns:
             files (lst): list of all file names containing the prefix in the key
         """
-        files = [obj.key for obj in self._bucket.objects.filter(Prefix=prefix)]
+        with self.metrics.s3_call('LIST'):
+            files = [obj.key for obj in self._bucket.objects.filter(Prefix=prefix)]
         return files
 
-
-    def read_csv_to_df(
-            self, key: str, encoding: str = 'utf-8', sep: str = ','):
-        """Reading a csv file from the S3 bucket and returning a dataframe
+    def list_objects_in_prefix(self, prefix: str):
+        """Listing all files with a prefix on the S3 Bucket together with their size and ETag
 
         Params:
-            key (str): key of the file that should be read
-            encoding (str): encoding of the data inside the file
-            sep (str): seperator of teh csv file
+            prefix (str): prefix on the S3 bucket that should be filtererd with
 
         Returns:
-            data_frame (DataFrame): Pandas DataFrame containing the csv file
+            objects (dict): dictionary with the keys 'size' and 'etag' by file name
+                            containing the prefix in the key
         """
-        self._logger.info('Reading file %s/%s/%s',
-                          self._endpoint_url, self._bucket.name, key)
-        csv_obj = self._bucket.Object(key=key).get().get(
-            'Body').read().decode(encoding)
-        data = StringIO(csv_obj)
-        data_frame = pd.read_csv(data, sep=sep)
+        with self.metrics.s3_call('LIST'):
+            objects = {obj.key: {'size': obj.size, 'etag': obj.e_tag}
+                       for obj in self._bucket.objects.filter(Prefix=prefix)}
+        return objects
 
-        return data_frame
+    def read_object(self, key: str):
+        """Reading the content of an object from the S3 bucket
 
+        Params:
+            key (str): key of the object that should be read
 
-    def write_df_to_s3(self, data_frame: pd.DataFrame,
-                       key: str, file_format: str):
+        Returns:
+            body (bytes): content of the object
         """
-        Writing a Pandas DataFrame to S3 supported formats: .csv, .parquet
+        with self.metrics.s3_call('GET') as call:
+            body = self._bucket.Object(key=key).get().get('Body').read()
+            call.nbytes = len(body)
+        return body
+
+    def write_object(self, body, key: str):
+        """Writing the content of an object to the S3 bucket
 
         Params:
-            data_frame (pd.DataFrame): Pandas DataFrame that should be written to S3
-            key (str): taget ky of the saved file
-            file_format (str) format of the saved filed
+            body (bytes | str): content of the object
+            key (str): target key of the object
+        """
+        with self.metrics.s3_call('PUT') as call:
+            self._client.put_object(Bucket=self._bucket.name, Body=body, Key=key)
+            call.nbytes = len(body)
+        return True
+
+    def read_object_with_etag(self, key: str):
+        """Reading the content of an object from the S3 bucket together with its ETag
 
+        Params:
+            key (str): key of the object that should be read
+
+        Returns:
+            body (bytes): content of the object
+            etag (str): ETag of the object
         """
-        if data_frame.empty:
-            self._logger.info(
-                'The dataframe is empty! No such file will be written!')
-            return None
-        if file_format == S3FileTypes.CSV.value:
-            out_buffer = StringIO()
-            data_frame.to_csv(out_buffer, index=False)
-            return self.__put_object(out_buffer, key)
-        if file_format == S3FileTypes.PARQUET.value:
-            out_buffer = BytesIO()
-            data_frame.to_parquet(out_buffer, index=False)
-            return self.__put_object(out_buffer, key)
-        self._logger.info(
-            'The file format %s is not supported to be written to S3!', file_format)
-        raise WrongFormatException
-
-    
-    def __put_object(self, out_buffer: StringIO or BytesIO, key: str):
+        with self.metrics.s3_call('GET') as call:
+            response = self._bucket.Object(key=key).get()
+            body = response.get('Body').read()
+            call.nbytes = len(body)
+        return body, response.get('ETag')
+
+    def write_object_if_match(self, body, key: str, etag: str):
+        """Writing the content of an object to the S3 bucket with a conditional PUT,
+        raises ConcurrentUpdateException if the object was changed since it was read
+
+        Params:
+            body (bytes | str): content of the object
+            key (str): target key of the object
+            etag (str): ETag of the object when it was read, None if it did not exist
+        """
+        condition = {'IfMatch': etag} if etag else {'IfNoneMatch': '*'}
+        with self.metrics.s3_call('PUT') as call:
+            try:
+                self._client.put_object(Bucket=self._bucket.name, Body=body, Key=key,
+                                        **condition)
+            except ClientError as error:
+                if error.response['Error']['Code'] in (
+                        'PreconditionFailed', 'ConditionalRequestConflict'):
+                    raise ConcurrentUpdateException from error
+                raise
+            call.nbytes = len(body)
+        return True
+
+    def delete_objects_in_prefix(self, prefix: str):
+        """Deleting all objects with a prefix from the S3 bucket
+
+        Params:
+            prefix (str): prefix of the keys of the objects that should be deleted
         """
-        Helper function for self.write_df_to_s3()
+        with self.metrics.s3_call('DELETE'):
+            self._bucket.objects.filter(Prefix=prefix).delete()
+        return True
+
+    def exists(self, key: str):
+        """Checking if an object exists on the S3 bucket
 
         Params:
-            out_buffer (StringIO | BytesIO):
-            key (str): target key of saved file
+            key (str): key of the object
+
+        Returns:
+            True if the object exists
         """
-        self._logger.info('Writing file to %s/%s/%s',
-                          self._endpoint_url, self._bucket.name, key)
-        self._bucket.put_object(Body=out_buffer.getvalue(), Key=key)
+        with self.metrics.s3_call('HEAD'):
+            try:
+                self._bucket.Object(key=key).load()
+            except ClientError as error:
+                if error.response['Error']['Code'] in ('404', 'NoSuchKey', 'NotFound'):
+                    return False
+                raise
         return True
@@ -0,0 +1,132 @@
+"""
+Methods for spilling source data partitioned by key hash to local files
+"""
+import logging
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from pyarrow import parquet as pq
+
+from xetra.common.constants import SpillFormat
+
+
+class SpillStore():
+    """
+    Class for writing rows to local parquet files partitioned by the hash of a key column,
+    so all rows of a key value can be processed together without the other partitions
+    """
+
+    def __init__(self, key_column: str, partitions: int, spill_dir: str = None):
+        """
+        Constructor for SpillStore
+
+        Params:
+            key_column (str): column the rows are partitioned by
+            partitions (int): number of partitions
+            spill_dir (str): local directory for the spill files,
+                             None creates a temporary directory
+        """
+        self._logger = logging.getLogger(__name__)
+        self.key_column = key_column
+        self.partitions = partitions
+        if spill_dir:
+            os.makedirs(spill_dir, exist_ok=True)
+        self.spill_dir = tempfile.mkdtemp(prefix='xetra_spill_', dir=spill_dir)
+        self.spills = 0
+        self.rows = 0
+
+    @staticmethod
+    def nbytes(data_frame):
+        """
+        Returning the memory used by a Pandas DataFrame, Arrow table or Polars DataFrame
+
+        Params:
+            data_frame (pd.DataFrame | pa.Table | pl.DataFrame): data
+
+        Returns:
+            nbytes (int): memory used by the data in bytes
+        """
+        if isinstance(data_frame, pd.DataFrame):
+            return int(data_frame.memory_usage(deep=True).sum())
+        if hasattr(data_frame, 'estimated_size'):
+            # Polars DataFrame
+            return int(data_frame.estimated_size())
+        return data_frame.nbytes
+
+    @staticmethod
+    def to_table(data_frame):
+        """
+        Converting a Pandas DataFrame, Arrow table or Polars DataFrame into an Arrow table
+
+        Params:
+            data_frame (pd.DataFrame | pa.Table | pl.DataFrame): data
+
+        Returns:
+            table (pa.Table): data as Arrow table
+        """
+        if isinstance(data_frame, pd.DataFrame):
+            return pa.Table.from_pandas(data_frame, preserve_index=False)
+        if hasattr(data_frame, 'to_arrow'):
+            # Polars DataFrame
+            return data_frame.to_arrow()
+        return data_frame
+
+    def append(self, data_frame):
+        """
+        Writing rows to the spill files of their partitions
+
+        Params:
+            data_frame (pd.DataFrame | pa.Table | pl.DataFrame): rows containing the key column
+        """
+        table = self.to_table(data_frame)
+        if not table.num_rows:
+            return
+        self._logger.info('Spilling %s rows to %s', table.num_rows, self.spill_dir)
+        keys = table.column(self.key_column).cast(pa.string()).to_numpy(zero_copy_only=False)
+        partition_ids = pd.util.hash_array(keys.astype(object)) % self.partitions
+        # Stable sort keeps the order of the rows inside each partition
+        order = np.argsort(partition_ids, kind='stable')
+        bounds = np.searchsorted(partition_ids[order], np.arange(self.partitions + 1))
+        for partition_id in range(self.partitions):
+            if bounds[partition_id] == bounds[partition_id + 1]:
+                continue
+            partition_dir = self._partition_dir(partition_id)
+            os.makedirs(partition_dir, exist_ok=True)
+            pq.write_table(
+                table.take(order[bounds[partition_id]:bounds[partition_id + 1]]),
+                os.path.join(partition_dir,
+                             f'{self.spills:06d}.{SpillFormat.FILE_FORMAT.value}'))
+        self.spills += 1
+        self.rows += table.num_rows
+
+    def read_partitions(self):
+        """
+        Reading the spilled rows partition by partition
+
+        Returns:
+            partitions (generator): list of Arrow tables of every non-empty partition,
+                                    one per spill, in the order they were appended
+        """
+        for partition_id in range(self.partitions):
+            partition_dir = self._partition_dir(partition_id)
+            if not os.path.isdir(partition_dir):
+                continue
+            yield [pq.read_table(os.path.join(partition_dir, file_name))
+                   for file_name in sorted(os.listdir(partition_dir))]
+
+    def clear(self):
+        """
+        Removing all spill files
+        """
+        shutil.rmtree(self.spill_dir, ignore_errors=True)
+
+    def _partition_dir(self, partition_id: int):
+        """
+        Helper function returning the local directory of a partition
+        """
+        return os.path.join(
+            self.spill_dir, f'{SpillFormat.PARTITION_DIR.value}={partition_id}')
@@ -0,0 +1,387 @@
+"""Interface for the storages the ETL job reads from and writes to"""
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO, BytesIO
+
+import json
+import logging
+
+import pandas as pd
+import pyarrow as pa
+from pyarrow import csv as pa_csv
+from pyarrow import parquet as pq
+
+from xetra.common.constants import BatchWriteFormat, FilteredReadFormat, S3FileTypes
+from xetra.common.custom_exceptions import PartialWriteException, WrongFormatException
+from xetra.common.metrics import RunMetrics
+
+
+class StorageConnector(ABC):
+    """
+    Abstract class for storages holding objects under string keys
+    """
+
+    def __init__(self, location: str):
+        """
+        Constructor for StorageConnector
+
+        Params:
+            location (str): location of the storage used in the log messages
+        """
+        self._logger = logging.getLogger(__name__)
+        self.location = location
+        self.metrics = RunMetrics()
+
+    @property
+    @abstractmethod
+    def key_not_found_exception(self):
+        """
+        Exception class raised by read_object when the key does not exist
+        """
+
+    @abstractmethod
+    def list_files_in_prefix(self, prefix: str):
+        """Listing all files with a prefix on the storage
+
+        Params:
+            prefix (str): prefix on the storage that should be filtererd with
+
+        Returns:
+            files (lst): list of all file names containing the prefix in the key
+        """
+
+    @abstractmethod
+    def list_objects_in_prefix(self, prefix: str):
+        """Listing all files with a prefix on the storage together with their size and
+        ETag, without reading the files
+
+        Params:
+            prefix (str): prefix on the storage that should be filtererd with
+
+        Returns:
+            objects (dict): dictionary with the keys 'size' and 'etag' by file name
+                            containing the prefix in the key
+        """
+
+    def list_file_sizes_in_prefix(self, prefix: str):
+        """Listing all files with a prefix on the storage together with their sizes,
+        without reading the files
+
+        Params:
+            prefix (str): prefix on the storage that should be filtererd with
+
+        Returns:
+            sizes (dict): size in bytes by file name containing the prefix in the key
+        """
+        return {key: details['size']
+                for key, details in self.list_objects_in_prefix(prefix).items()}
+
+    @abstractmethod
+    def read_object(self, key: str):
+        """Reading the content of an object
+
+        Params:
+            key (str): key of the object that should be read
+
+        Returns:
+            body (bytes): content of the object
+        """
+
+    @abstractmethod
+    def write_object(self, body, key: str):
+        """Writing the content of an object
+
+        Params:
+            body (bytes | str): content of the object
+            key (str): target key of the object
+        """
+
+    @abstractmethod
+    def read_object_with_etag(self, key: str):
+        """Reading the content of an object together with its ETag
+
+        Params:
+            key (str): key of the object that should be read
+
+        Returns:
+            body (bytes): content of the object
+            etag (str): ETag of the object
+        """
+
+    @abstractmethod
+    def write_object_if_match(self, body, key: str, etag: str):
+        """Writing the content of an object only if it was not changed since it was read,
+        raises ConcurrentUpdateException otherwise
+
+        Params:
+            body (bytes | str): content of the object
+            key (str): target key of the object
+            etag (str): ETag of the object when it was read, None if it did not exist
+        """
+
+    @abstractmethod
+    def delete_objects_in_prefix(self, prefix: str):
+        """Deleting all objects with a prefix
+
+        Params:
+            prefix (str): prefix of the keys of the objects that should be deleted
+        """
+
+    @abstractmethod
+    def exists(self, key: str):
+        """Checking if an object exists
+
+        Params:
+            key (str): key of the object
+
+        Returns:
+            True if the object exists
+        """
+
+    def read_csv_to_df(
+            self, key: str, encoding: str = 'utf-8', sep: str = ',', row_filter=None,
+            line_filter=None):
+        """Reading a csv file from the storage and returning a dataframe
+
+        Params:
+            key (str): key of the file that should be read
+            encoding (str): encoding of the data inside the file
+            sep (str): seperator of teh csv file
+            row_filter (callable): function filtering each parsed chunk of the file,
+                                   None keeps all rows
+            line_filter (callable): function removing lines of the file before it is
+                                    parsed, None keeps all lines
+
+        Returns:
+            data_frame (DataFrame): Pandas DataFrame containing the csv file
+        """
+        self._logger.info('Reading file %s/%s', self.location, key)
+        body = self.read_object(key)
+        if line_filter is not None:
+            body = line_filter(body, sep)
+        data = StringIO(body.decode(encoding))
+        data_frame = self._parse_csv(data, row_filter, sep=sep)
+
+        return data_frame
+
+    @staticmethod
+    def _parse_csv(data, row_filter=None, **kwargs):
+        """
+        Helper function parsing a csv file, with a row filter the file is parsed in chunks
+        and only the filtered rows of each chunk are kept
+
+        Params:
+            data: file-like object with the csv file
+            row_filter (callable): function filtering a Pandas DataFrame, None keeps all rows
+            kwargs: arguments of pd.read_csv
+
+        Returns:
+            data_frame (DataFrame): Pandas DataFrame containing the filtered csv file
+        """
+        if row_filter is None:
+            return pd.read_csv(data, **kwargs)
+        chunks = [row_filter(chunk) for chunk in pd.read_csv(
+            data, chunksize=FilteredReadFormat.CHUNK_ROWS.value, **kwargs)]
+        return pd.concat(chunks, ignore_index=True)
+
+    def read_csv_to_df_with_etag(
+            self, key: str, encoding: str = 'utf-8', sep: str = ','):
+        """Reading a csv file from the storage together with its ETag, e.g. for
+        self.write_df_to_s3_if_match()
+
+        Params:
+            key (str): key of the file that should be read
+            encoding (str): encoding of the data inside the file
+            sep (str): seperator of teh csv file
+
+        Returns:
+            data_frame (DataFrame): Pandas DataFrame containing the csv file
+            etag (str): ETag of the file
+        """
+        self._logger.info('Reading file %s/%s', self.location, key)
+        body, etag = self.read_object_with_etag(key)
+        data_frame = pd.read_csv(StringIO(body.decode(encoding)), sep=sep)
+        return data_frame, etag
+
+    def read_csv_to_table(self, key: str, convert_options: pa_csv.ConvertOptions = None,
+                          row_filter=None, line_filter=None):
+        """Reading a csv file from the storage and returning an Arrow table
+
+        Params:
+            key (str): key of the file that should be read
+            convert_options (pa_csv.ConvertOptions): column selection and types
+            row_filter (callable): function filtering each parsed record batch of the file,
+                                   None keeps all rows
+            line_filter (callable): function removing lines of the file before it is
+                                    parsed, None keeps all lines
+
+        Returns:
+            table (pa.Table): Arrow table containing the csv file
+        """
+        self._logger.info('Reading file %s/%s', self.location, key)
+        body = self.read_object(key)
+        if line_filter is not None:
+            body = line_filter(body, ',')
+        return self._parse_csv_table(pa.BufferReader(body), convert_options, row_filter)
+
+    @staticmethod
+    def _parse_csv_table(source, convert_options: pa_csv.ConvertOptions = None,
+                         row_filter=None):
+        """
+        Helper function parsing a csv file into an Arrow table, with a row filter the file
+        is streamed in record batches and only the filtered rows of each batch are kept
+
+        Params:
+            source: Arrow readable file with the csv file
+            convert_options (pa_csv.ConvertOptions): column selection and types
+            row_filter (callable): function filtering an Arrow record batch,
+                                   None keeps all rows
+
+        Returns:
+            table (pa.Table): Arrow table containing the filtered csv file
+        """
+        if row_filter is None:
+            return pa_csv.read_csv(source, convert_options=convert_options)
+        reader = pa_csv.open_csv(
+            source, convert_options=convert_options,
+            read_options=pa_csv.ReadOptions(block_size=FilteredReadFormat.BLOCK_SIZE.value))
+        return pa.Table.from_batches([row_filter(batch) for batch in reader],
+                                     schema=reader.schema)
+
+    def write_df_to_s3(self, data_frame: pd.DataFrame,
+                       key: str, file_format: str):
+        """
+        Writing a Pandas DataFrame to the storage, supported formats: .csv, .parquet
+
+        Params:
+            data_frame (pd.DataFrame): Pandas DataFrame that should be written
+            key (str): taget ky of the saved file
+            file_format (str) format of the saved filed
+
+        """
+        if data_frame.empty:
+            self._logger.info(
+                'The dataframe is empty! No such file will be written!')
+            return None
+        return self._put_object(self._df_to_buffer(data_frame, file_format), key)
+
+    def write_dfs_to_s3(self, parts: dict, file_format: str, commit_key: str = None,
+                        max_workers: int = 8):
+        """
+        Writing many Pandas DataFrames, e.g. the partitions of an output, the parts are
+        serialized and uploaded concurrently by a bounded pool of threads
+
+        All parts are attempted, the commit marker listing the written keys is written
+        only after all of them succeeded, so readers can check the marker before
+        reading the parts.
+
+        Params:
+            parts (dict): Pandas DataFrames by target key, empty ones are not written
+            file_format (str) format of the saved files
+            commit_key (str): key of the commit marker, None writes no marker
+            max_workers (int): maximum number of parts serialized and uploaded at once
+
+        Returns:
+            keys (list): keys of the written parts
+
+        Raises PartialWriteException with the errors by key of the failed parts.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {key: executor.submit(self.write_df_to_s3, data_frame, key, file_format)
+                       for key, data_frame in parts.items()}
+        failures = {key: future.exception() for key, future in futures.items()
+                    if future.exception() is not None}
+        if failures:
+            for key, error in failures.items():
+                self._logger.error('Writing file %s/%s failed: %r', self.location, key, error)
+            raise PartialWriteException(failures)
+        keys = sorted(key for key, future in futures.items() if future.result())
+        if commit_key:
+            self.write_json_to_s3({
+                BatchWriteFormat.PARTS_KEY.value: keys,
+                BatchWriteFormat.ROWS_KEY.value: int(sum(
+                    len(data_frame) for data_frame in parts.values())),
+            }, commit_key)
+        return keys
+
+    def write_df_to_s3_if_match(self, data_frame: pd.DataFrame, key: str,
+                                file_format: str, etag: str):
+        """
+        Writing a Pandas DataFrame to the storage only if the file was not changed since
+        it was read, raises ConcurrentUpdateException otherwise
+
+        Params:
+            data_frame (pd.DataFrame): Pandas DataFrame that should be written
+            key (str): taget ky of the saved file
+            file_format (str) format of the saved filed
+            etag (str): ETag of the file when it was read, None if it did not exist
+        """
+        if data_frame.empty:
+            self._logger.info(
+                'The dataframe is empty! No such file will be written!')
+            return None
+        out_buffer = self._df_to_buffer(data_frame, file_format)
+        self._logger.info('Writing file to %s/%s', self.location, key)
+        return self.write_object_if_match(out_buffer.getvalue(), key, etag)
+
+    def _df_to_buffer(self, data_frame: pd.DataFrame, file_format: str):
+        """
+        Helper function serializing a Pandas DataFrame, supported formats: .csv, .parquet
+        """
+        if file_format == S3FileTypes.CSV.value:
+            out_buffer = StringIO()
+            data_frame.to_csv(out_buffer, index=False)
+            return out_buffer
+        if file_format == S3FileTypes.PARQUET.value:
+            out_buffer = BytesIO()
+            data_frame.to_parquet(out_buffer, index=False)
+            return out_buffer
+        self._logger.info(
+            'The file format %s is not supported to be written to S3!', file_format)
+        raise WrongFormatException
+
+    def write_table_to_s3(self, table: pa.Table, key: str, file_format: str):
+        """
+        Writing an Arrow table to the storage, supported formats: .csv, .parquet
+
+        Params:
+            table (pa.Table): Arrow table that should be written
+            key (str): taget ky of the saved file
+            file_format (str) format of the saved filed
+        """
+        if table.num_rows == 0:
+            self._logger.info(
+                'The dataframe is empty! No such file will be written!')
+            return None
+        out_stream = pa.BufferOutputStream()
+        if file_format == S3FileTypes.CSV.value:
+            pa_csv.write_csv(table, out_stream)
+            return self._put_object(BytesIO(out_stream.getvalue().to_pybytes()), key)
+        if file_format == S3FileTypes.PARQUET.value:
+            pq.write_table(table, out_stream)
+            return self._put_object(BytesIO(out_stream.getvalue().to_pybytes()), key)
+        self._logger.info(
+            'The file format %s is not supported to be written to S3!', file_format)
+        raise WrongFormatException
+
+    def write_json_to_s3(self, data: dict, key: str):
+        """
+        Writing a JSON serializable dictionary to the storage
+
+        Params:
+            data (dict): dictionary that should be written
+            key (str): target key of the saved file
+        """
+        return self._put_object(StringIO(json.dumps(data, indent=2)), key)
+
+    def _put_object(self, out_buffer: StringIO or BytesIO, key: str):
+        """
+        Helper function for self.write_df_to_s3()
+
+        Params:
+            out_buffer (StringIO | BytesIO):
+            key (str): target key of saved file
+        """
+        self._logger.info('Writing file to %s/%s', self.location, key)
+        self.write_object(out_buffer.getvalue(), key)
+        return True
@@ -0,0 +1,130 @@
+""" Partial aggregates per ISIN and day for the Xetra reports"""
+import numpy as np
+import pandas as pd
+
+from xetra.common.constants import PartialAggregateFormat
+
+
+class XetraPartialAggregates():
+    """
+    Class for creating, merging and finalizing partial aggregates per ISIN and day
+
+    A partial aggregate holds the opening price with its time, the closing price with
+    its time, the minimum and maximum price and the traded volume. Partial aggregates
+    of any split of the source data can be merged into the aggregates of the whole data.
+    """
+
+    @staticmethod
+    def from_source(data_frame: pd.DataFrame, src_args, trg_args):
+        """
+        Creating the partial aggregates of Xetra source data
+
+        Params:
+            data_frame (pd.DataFrame): Pandas DataFrame with Xetra source data
+            src_args (XetraSourceConfig): NamedTuple class with source configuration data
+            trg_args (XetraTargetConfig): NamedTuple class with target configuration data
+
+        Returns:
+            data_frame (pd.DataFrame): partial aggregates per ISIN and day
+        """
+        data_frame = data_frame.loc[:, src_args.src_columns].dropna()
+        data_frame = data_frame.sort_values(by=[src_args.src_col_time], kind='stable')
+        return data_frame.groupby([
+            src_args.src_col_isin,
+            src_args.src_col_date], as_index=False).agg(**{
+                PartialAggregateFormat.FIRST_TIME_COL.value: (src_args.src_col_time, 'first'),
+                trg_args.trg_col_op_price: (src_args.src_col_start_price, 'first'),
+                PartialAggregateFormat.LAST_TIME_COL.value: (src_args.src_col_time, 'last'),
+                trg_args.trg_col_clos_price: (src_args.src_col_end_price, 'last'),
+                trg_args.trg_col_min_price: (src_args.src_col_min_price, 'min'),
+                trg_args.trg_col_max_price: (src_args.src_col_max_price, 'max'),
+                trg_args.trg_col_daily_trad_vol: (src_args.src_col_traded_vol, 'sum'),
+            })
+
+    @staticmethod
+    def merge(partials: list, src_args, trg_args):
+        """
+        Merging several partial aggregates into one
+
+        Params:
+            partials (list): list of Pandas DataFrames with partial aggregates
+            src_args (XetraSourceConfig): NamedTuple class with source configuration data
+            trg_args (XetraTargetConfig): NamedTuple class with target configuration data
+
+        Returns:
+            data_frame (pd.DataFrame): merged partial aggregates per ISIN and day
+        """
+        partials = [partial for partial in partials if not partial.empty]
+        if not partials:
+            return pd.DataFrame()
+        data_frame = pd.concat(partials, ignore_index=True)
+        keys = [src_args.src_col_isin, src_args.src_col_date]
+        first_time = PartialAggregateFormat.FIRST_TIME_COL.value
+        last_time = PartialAggregateFormat.LAST_TIME_COL.value
+        # Opening price of the earliest and closing price of the latest partial
+        data_frame_first = data_frame.sort_values(by=[first_time], kind='stable').groupby(
+            keys)[[first_time, trg_args.trg_col_op_price]].first()
+        data_frame_last = data_frame.sort_values(by=[last_time], kind='stable').groupby(
+            keys)[[last_time, trg_args.trg_col_clos_price]].last()
+        data_frame_rest = data_frame.groupby(keys).agg({
+            trg_args.trg_col_min_price: 'min',
+            trg_args.trg_col_max_price: 'max',
+            trg_args.trg_col_daily_trad_vol: 'sum',
+        })
+        return pd.concat([data_frame_first, data_frame_last, data_frame_rest],
+                         axis=1).reset_index()
+
+    @staticmethod
+    def to_report1(data_frame: pd.DataFrame, src_args, trg_args, extract_date: str):
+        """
+        Creating report 1 from the aggregates per ISIN and day
+
+        Params:
+            data_frame (pd.DataFrame): aggregates per ISIN and day, sorted by ISIN and day
+            src_args (XetraSourceConfig): NamedTuple class with source configuration data
+            trg_args (XetraTargetConfig): NamedTuple class with target configuration data
+            extract_date (str): first date that is part of the report
+
+        Returns:
+            data_frame (pd.DataFrame): report 1
+        """
+        data_frame = data_frame.loc[:, [
+            src_args.src_col_isin,
+            src_args.src_col_date,
+            trg_args.trg_col_op_price,
+            trg_args.trg_col_clos_price,
+            trg_args.trg_col_min_price,
+            trg_args.trg_col_max_price,
+            trg_args.trg_col_daily_trad_vol]]
+        # % Change of current day's closing price compared to the previous trading day's closing price
+        data_frame[trg_args.trg_col_ch_prev_clos] = XetraPartialAggregates.change_prev_close(
+            data_frame[src_args.src_col_isin].to_numpy(),
+            data_frame[trg_args.trg_col_op_price].to_numpy())
+        # Rounding to 2 decimal places
+        data_frame = data_frame.round(decimals=PartialAggregateFormat.REPORT_DECIMALS.value)
+        # Removing the day before extract_date
+        return data_frame[data_frame[src_args.src_col_date] >=
+                          extract_date].reset_index(drop=True)
+
+    @staticmethod
+    def change_prev_close(isins: np.ndarray, op_prices: np.ndarray):
+        """
+        Computing the % change to the previous trading day of aggregates sorted by ISIN
+        and day, comparing each row with the row before it
+
+        The first row of every ISIN has no previous trading day and gets NaN.
+
+        Params:
+            isins (np.ndarray): ISINs of the aggregates, sorted
+            op_prices (np.ndarray): opening prices of the aggregates
+
+        Returns:
+            change (np.ndarray): % change to the previous trading day, float64
+        """
+        op_prices = np.asarray(op_prices, dtype=np.float64)
+        prev_prices = np.empty_like(op_prices)
+        prev_prices[:1] = np.nan
+        prev_prices[1:] = op_prices[:-1]
+        # Rows starting a new ISIN have no previous trading day
+        prev_prices[1:][isins[1:] != isins[:-1]] = np.nan
+        return (op_prices - prev_prices) / prev_prices * 100
@@ -0,0 +1,158 @@
+""" Arrow-native Xetra ETL Component"""
+import pyarrow as pa
+import pyarrow.compute as pc
+from pyarrow import csv as pa_csv
+
+from xetra.common.constants import PartialAggregateFormat
+from xetra.transformations.xetra_aggregations import XetraPartialAggregates
+from xetra.transformations.xetra_transformations import XetraETL
+from xetra.transformations.xetra_universe import XetraUniverse
+
+
+class XetraArrowETL(XetraETL):
+    """
+    Reads the Xetra data with the pyarrow csv reader, transforms it with Arrow compute
+    functions and writes the Arrow table to the target without converting to Pandas
+    """
+
+    def _convert_options(self):
+        """
+        Helper function returning the column projection and types of the source files
+        """
+        column_types = {column: pa.string() for column in self.src_args.src_columns}
+        column_types.update({
+            self.src_args.src_col_start_price: pa.float64(),
+            self.src_args.src_col_end_price: pa.float64(),
+            self.src_args.src_col_min_price: pa.float64(),
+            self.src_args.src_col_max_price: pa.float64(),
+            self.src_args.src_col_traded_vol: pa.int64(),
+        })
+        return pa_csv.ConvertOptions(column_types=column_types,
+                                     include_columns=self.src_args.src_columns,
+                                     strings_can_be_null=True)
+
+    def _read_source(self, key: str):
+        """
+        Helper function for self._extract_day() reading one source file
+
+        Params:
+            key (str): key of the source file
+
+        Returns:
+            table (pa.Table): Arrow table with the data of the file
+        """
+        return self.s3_bucket_src.read_csv_to_table(
+            key, self._convert_options(),
+            **XetraUniverse.csv_filters(self.universe, as_table=True))
+
+    def _read_intermediate(self, date: str):
+        """
+        Helper function for self._extract_day() reading the intermediate file of a day
+
+        Params:
+            date (str): source date
+
+        Returns:
+            table (pa.Table): Arrow table with the data of the day
+        """
+        return self.intermediate.read_day(date, as_table=True)
+
+    @staticmethod
+    def _from_table(table: pa.Table):
+        """
+        Helper function converting an Arrow table, e.g. read from the spill files
+
+        Params:
+            table (pa.Table): Arrow table
+
+        Returns:
+            table (pa.Table): the unchanged Arrow table
+        """
+        return table
+
+    @staticmethod
+    def concat(data_frames: list):
+        """
+        Concatenating the non-empty extracted data of several days or files
+
+        Params:
+            data_frames (list): list of Arrow tables
+
+        Returns:
+            table (pa.Table): concatenated Arrow table
+        """
+        tables = [table for table in data_frames if table.num_rows]
+        if not tables:
+            return pa.table({})
+        return pa.concat_tables(tables).combine_chunks()
+
+    def transform_report1(self, data_frame: pa.Table):
+        """
+        Applies the necessary transformations to create report 1 with Arrow compute functions
+
+        Params:
+            data_frame (pa.Table): Arrow table as input
+
+        Returns:
+            table (pa.Table): transformed Arrow table, identical to the Pandas result
+        """
+        if data_frame.num_rows == 0:
+            self._logger.info(
+                'The dataframe is empty. No transformations will be applied!')
+            return data_frame
+        self._logger.info(
+            'Applying transformations to Xetra source data for report 1 started...')
+        src_args, trg_args = self.src_args, self.trg_args
+        # Filtering necessary source columns and removing rows with missing values
+        table = data_frame.select(src_args.src_columns).drop_null()
+        # Sorting by time so first and last of each group are the opening and closing rows
+        table = table.take(pc.sort_indices(
+            table, sort_keys=[(src_args.src_col_time, 'ascending')]))
+        # Aggregating per ISIN and day in input order
+        table = table.group_by(
+            [src_args.src_col_isin, src_args.src_col_date], use_threads=False).aggregate([
+                (src_args.src_col_start_price, 'first'),
+                (src_args.src_col_end_price, 'last'),
+                (src_args.src_col_min_price, 'min'),
+                (src_args.src_col_max_price, 'max'),
+                (src_args.src_col_traded_vol, 'sum'),
+            ])
+        table = pa.table({
+            src_args.src_col_isin: table[src_args.src_col_isin],
+            src_args.src_col_date: table[src_args.src_col_date],
+            trg_args.trg_col_op_price: table[f'{src_args.src_col_start_price}_first'],
+            trg_args.trg_col_clos_price: table[f'{src_args.src_col_end_price}_last'],
+            trg_args.trg_col_min_price: table[f'{src_args.src_col_min_price}_min'],
+            trg_args.trg_col_max_price: table[f'{src_args.src_col_max_price}_max'],
+            trg_args.trg_col_daily_trad_vol: table[f'{src_args.src_col_traded_vol}_sum'],
+        })
+        table = table.take(pc.sort_indices(table, sort_keys=[
+            (src_args.src_col_isin, 'ascending'), (src_args.src_col_date, 'ascending')]))
+        # % Change of current day's closing price compared to the previous trading day's closing price
+        change = XetraPartialAggregates.change_prev_close(
+            table[src_args.src_col_isin].to_numpy(),
+            table[trg_args.trg_col_op_price].to_numpy())
+        table = table.append_column(
+            trg_args.trg_col_ch_prev_clos, pa.array(change, from_pandas=True))
+        # Rounding to 2 decimal places
+        for index, field in enumerate(table.schema):
+            if pa.types.is_floating(field.type):
+                table = table.set_column(index, field.name, pc.round(
+                    table[field.name], PartialAggregateFormat.REPORT_DECIMALS.value))
+        # Removing the day before extract_date
+        table = table.filter(pc.greater_equal(
+            table[src_args.src_col_date], pa.scalar(self.extract_date)))
+        self._logger.info(
+            'Applying transformations to Xetra source data finished...')
+        return table
+
+    def _write_target(self, data_frame: pa.Table, target_key: str):
+        """
+        Helper function for self.load() writing the report to the target
+
+        Params:
+            data_frame (pa.Table): Arrow table to write
+            target_key (str): key of the target file
+        """
+        return self.s3_bucket_trg.write_table_to_s3(
+            data_frame, target_key, self.trg_args.trg_format)
@@ -0,0 +1,103 @@
+""" Intraday OHLCV bars of several resolutions for the Xetra reports"""
+import numpy as np
+import pandas as pd
+
+from xetra.common.custom_exceptions import WrongFormatException
+from xetra.transformations.xetra_compact import XetraCompactSchema
+
+
+class XetraIntradayBars():
+    """
+    Class for creating intraday open, high, low, close and volume bars per ISIN and day
+
+    The source rows are sorted once by ISIN, day and time. The bars of the finest
+    resolution are reduced from the sorted rows, every coarser resolution is reduced
+    from the bars of the finest resolution it is a multiple of, which keeps the order.
+    """
+
+    @staticmethod
+    def from_source(data_frame: pd.DataFrame, src_args, trg_args):
+        """
+        Creating the intraday bars of all resolutions in trg_args.trg_bar_resolutions
+
+        Params:
+            data_frame (pd.DataFrame): Pandas DataFrame with Xetra source data
+            src_args (XetraSourceConfig): NamedTuple class with source configuration data
+            trg_args (XetraTargetConfig): NamedTuple class with target configuration data
+
+        Returns:
+            data_frame (pd.DataFrame): bars per resolution, ISIN, day and bar start time
+        """
+        data_frame = XetraCompactSchema.compact(data_frame, src_args)
+        if data_frame.empty:
+            return pd.DataFrame()
+        if data_frame[src_args.src_col_time].dtype != np.int16:
+            raise WrongFormatException
+        isin = data_frame[src_args.src_col_isin].astype('category')
+        # Sorting once by ISIN, day and time, ties keep the order of the source rows
+        order = np.lexsort((data_frame[src_args.src_col_time].to_numpy(),
+                            data_frame[src_args.src_col_date].to_numpy(),
+                            isin.cat.codes.to_numpy()))
+        rows = {
+            'isin': isin.cat.codes.to_numpy()[order],
+            'date': data_frame[src_args.src_col_date].to_numpy()[order],
+            'minute': data_frame[src_args.src_col_time].to_numpy()[order],
+            'open': data_frame[src_args.src_col_start_price].to_numpy()[order],
+            'high': data_frame[src_args.src_col_max_price].to_numpy()[order],
+            'low': data_frame[src_args.src_col_min_price].to_numpy()[order],
+            'close': data_frame[src_args.src_col_end_price].to_numpy()[order],
+            'volume': data_frame[src_args.src_col_traded_vol].to_numpy()[order],
+        }
+        bars = {}
+        for resolution in sorted(set(trg_args.trg_bar_resolutions)):
+            finer = [finer_resolution for finer_resolution in bars
+                     if resolution % finer_resolution == 0]
+            base = bars[max(finer)] if finer else rows
+            bars[resolution] = XetraIntradayBars._reduce(base, resolution)
+        data_frames = []
+        for resolution, bar in bars.items():
+            data_frames.append(pd.DataFrame({
+                trg_args.trg_col_bar_resolution: np.full(len(bar['isin']), resolution),
+                src_args.src_col_isin: pd.Categorical.from_codes(
+                    bar['isin'], isin.cat.categories),
+                src_args.src_col_date: bar['date'],
+                src_args.src_col_time: bar['minute'],
+                trg_args.trg_col_op_price: bar['open'],
+                trg_args.trg_col_max_price: bar['high'],
+                trg_args.trg_col_min_price: bar['low'],
+                trg_args.trg_col_clos_price: bar['close'],
+                trg_args.trg_col_bar_volume: bar['volume'],
+            }))
+        return XetraCompactSchema.restore(pd.concat(data_frames, ignore_index=True), src_args)
+
+    @staticmethod
+    def _reduce(rows: dict, resolution: int):
+        """
+        Helper function reducing rows sorted by ISIN, day and minute into bars
+
+        Params:
+            rows (dict): numpy arrays of the sorted rows or bars of a finer resolution
+            resolution (int): resolution of the bars in minutes
+
+        Returns:
+            bars (dict): numpy arrays of the bars, sorted by ISIN, day and bar start
+        """
+        minute = rows['minute'] // resolution * resolution
+        new_bar = np.ones(len(minute), dtype=bool)
+        new_bar[1:] = ((rows['isin'][1:] != rows['isin'][:-1])
+                       | (rows['date'][1:] != rows['date'][:-1])
+                       | (minute[1:] != minute[:-1]))
+        starts = np.flatnonzero(new_bar)
+        if not len(starts):
+            return {key: values[:0] for key, values in rows.items()}
+        ends = np.append(starts[1:], len(minute)) - 1
+        return {
+            'isin': rows['isin'][starts],
+            'date': rows['date'][starts],
+            'minute': minute[starts],
+            'open': rows['open'][starts],
+            'high': np.maximum.reduceat(rows['high'], starts),
+            'low': np.minimum.reduceat(rows['low'], starts),
+            'close': rows['close'][ends],
+            'volume': np.add.reduceat(rows['volume'], starts),
+        }
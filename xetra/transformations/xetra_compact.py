@@ -0,0 +1,199 @@
+""" Compact in-memory schema for the Xetra source data"""
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+from xetra.common.constants import CompactSchemaFormat
+
+
+class XetraCompactSchema():
+    """
+    Class for converting the Xetra source data into a compact schema and back
+
+    In the compact schema the time is stored as minutes since midnight (int16), the date
+    as days since 1970-01-01 (int32), the remaining string columns as categoricals and the
+    prices as float32 where the float64 values can be restored exactly from the prices
+    with at most CompactSchemaFormat.PRICE_DECIMALS decimals.
+    """
+
+    @staticmethod
+    def compact(data_frame: pd.DataFrame, src_args):
+        """
+        Converting Xetra source data into the compact schema
+
+        Only the source columns are kept and rows with missing values are removed,
+        as all transformations drop them anyway. Columns that are already compact
+        are kept as they are.
+
+        Params:
+            data_frame (pd.DataFrame): Pandas DataFrame with Xetra source data
+            src_args (XetraSourceConfig): NamedTuple class with source configuration data
+
+        Returns:
+            data_frame (pd.DataFrame): Pandas DataFrame in the compact schema
+        """
+        data_frame = data_frame.loc[:, src_args.src_columns].dropna()
+        if data_frame.empty:
+            return data_frame.reset_index(drop=True)
+        columns = {}
+        for column in data_frame.columns:
+            series = data_frame[column]
+            if series.dtype not in (object, np.float64):
+                # Already compact or no compact type available
+                pass
+            elif column == src_args.src_col_time:
+                series = XetraCompactSchema._compact_time(series)
+            elif column == src_args.src_col_date:
+                series = XetraCompactSchema._compact_date(series)
+            elif column in XetraCompactSchema._price_columns(src_args):
+                series = XetraCompactSchema._compact_price(series)
+            elif series.dtype == object:
+                series = series.astype('category')
+            columns[column] = series
+        return pd.DataFrame(columns).reset_index(drop=True)
+
+    @staticmethod
+    def concat(data_frames: list):
+        """
+        Concatenating Pandas DataFrames keeping the compact column types
+
+        Categorical columns get the union of all categories, columns that are compact
+        in only some of the DataFrames are restored before concatenating.
+
+        Params:
+            data_frames (list): list of non-empty Pandas DataFrames
+
+        Returns:
+            data_frame (pd.DataFrame): concatenated Pandas DataFrame
+        """
+        if len(data_frames) > 1:
+            for column in data_frames[0].columns:
+                dtypes = {str(data_frame[column].dtype) for data_frame in data_frames}
+                if dtypes == {'category'}:
+                    categories = union_categoricals(
+                        [data_frame[column] for data_frame in data_frames],
+                        sort_categories=True).categories
+                    data_frames = [data_frame.assign(**{
+                        column: data_frame[column].cat.set_categories(categories)})
+                        for data_frame in data_frames]
+                elif len(dtypes) > 1 and dtypes & {'float32', 'int16', 'int32'}:
+                    data_frames = [data_frame.assign(**{
+                        column: XetraCompactSchema._restore_column(data_frame[column])})
+                        for data_frame in data_frames]
+        return pd.concat(data_frames, ignore_index=True)
+
+    @staticmethod
+    def restore(data_frame: pd.DataFrame, src_args):
+        """
+        Restoring the original types of the key and price columns, e.g. after aggregating
+
+        Columns that are not in the compact schema are returned unchanged.
+
+        Params:
+            data_frame (pd.DataFrame): Pandas DataFrame in the compact schema
+            src_args (XetraSourceConfig): NamedTuple class with source configuration data
+
+        Returns:
+            data_frame (pd.DataFrame): Pandas DataFrame with the original column types
+        """
+        for column in data_frame.columns:
+            series = data_frame[column]
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                data_frame[column] = series.astype(object)
+            elif column == src_args.src_col_date and series.dtype == np.int32:
+                data_frame[column] = XetraCompactSchema._restore_date(series)
+            elif column == src_args.src_col_time and series.dtype == np.int16:
+                data_frame[column] = XetraCompactSchema._restore_time(series)
+            elif series.dtype == np.float32:
+                data_frame[column] = XetraCompactSchema._restore_price(series)
+        return data_frame
+
+    @staticmethod
+    def _price_columns(src_args):
+        """
+        Helper function returning the price columns of the source data
+        """
+        return {src_args.src_col_start_price, src_args.src_col_end_price,
+                src_args.src_col_min_price, src_args.src_col_max_price}
+
+    @staticmethod
+    def _compact_time(series: pd.Series):
+        """
+        Helper function converting HH:MM strings into minutes since midnight,
+        other formats are kept as they are
+        """
+        codes, uniques = pd.factorize(series)
+        uniques = pd.Series(uniques, dtype=object)
+        if not uniques.str.fullmatch(r'\d\d:\d\d').all():
+            return series
+        minutes = (uniques.str.slice(0, 2).astype(np.int16) * 60
+                   + uniques.str.slice(3, 5).astype(np.int16)).to_numpy(dtype=np.int16)
+        return pd.Series(minutes[codes], index=series.index)
+
+    @staticmethod
+    def _compact_date(series: pd.Series):
+        """
+        Helper function converting date strings into days since 1970-01-01
+        """
+        codes, uniques = pd.factorize(series)
+        days = pd.to_datetime(
+            uniques, format=CompactSchemaFormat.DATE_FORMAT.value).to_numpy(
+                dtype='datetime64[D]').astype(np.int32)
+        return pd.Series(days[codes], index=series.index)
+
+    @staticmethod
+    def _compact_price(series: pd.Series):
+        """
+        Helper function converting prices into float32 if they can be restored exactly
+        """
+        compact = series.astype(np.float32)
+        if XetraCompactSchema._restore_price(compact).equals(series.astype(np.float64)):
+            return compact
+        return series
+
+    @staticmethod
+    def _restore_column(series: pd.Series):
+        """
+        Helper function restoring a compact column by its type
+        """
+        if series.dtype == np.int16:
+            return XetraCompactSchema._restore_time(series)
+        if series.dtype == np.int32:
+            return XetraCompactSchema._restore_date(series)
+        if series.dtype == np.float32:
+            return XetraCompactSchema._restore_price(series)
+        return series
+
+    @staticmethod
+    def _restore_time(series: pd.Series):
+        """
+        Helper function converting minutes since midnight into HH:MM strings
+        """
+        codes, uniques = pd.factorize(series)
+        labels = np.array([f'{minute // 60:02d}:{minute % 60:02d}' for minute in uniques],
+                          dtype=object)
+        return pd.Series(labels[codes], index=series.index)
+
+    @staticmethod
+    def _restore_date(series: pd.Series):
+        """
+        Helper function converting days since 1970-01-01 into date strings
+        """
+        codes, uniques = pd.factorize(series)
+        labels = np.datetime_as_string(
+            np.asarray(uniques).astype('datetime64[D]')).astype(object)
+        return pd.Series(labels[codes], index=series.index)
+
+    @staticmethod
+    def _restore_price(series: pd.Series):
+        """
+        Helper function converting float32 prices into the original float64 prices,
+        each price is restored as the value with the fewest decimals mapping to it
+        """
+        values = series.to_numpy(dtype=np.float32)
+        wide = values.astype(np.float64)
+        restored = np.round(wide, CompactSchemaFormat.PRICE_DECIMALS.value)
+        for decimals in range(CompactSchemaFormat.PRICE_DECIMALS.value - 1, -1, -1):
+            candidate = np.round(wide, decimals)
+            restored = np.where(candidate.astype(np.float32) == values, candidate, restored)
+        return pd.Series(restored, index=series.index, name=series.name)
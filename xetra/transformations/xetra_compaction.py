@@ -0,0 +1,158 @@
+""" Compaction of the report files written by the runs of a report"""
+from datetime import datetime
+from io import BytesIO
+import json
+import logging
+
+import pandas as pd
+
+from xetra.common.config import XetraCompactionConfig, XetraSourceConfig, XetraTargetConfig
+from xetra.common.constants import CompactionFormat, MetaProcessFormat, S3FileTypes
+from xetra.common.storage import StorageConnector
+
+
+class XetraReportCompaction():
+    """
+    Class for merging the report files of all runs into one parquet file per time bucket,
+    sorted by ISIN and date and with one row per ISIN and date taken from the newest run
+
+    The compaction is incremental: the manifest lists the compacted report files, only
+    new report files are read and only the time buckets they contain are rewritten.
+    Report files are merged in the order of their run timestamps.
+    """
+
+    def __init__(self, s3_bucket_trg: StorageConnector, src_args: XetraSourceConfig,
+                 trg_args: XetraTargetConfig, compaction_args: XetraCompactionConfig):
+        """
+        Constructor for XetraReportCompaction
+
+        Params:
+            s3_bucket_trg (StorageConnector): connection to target storage
+            src_args (XetraSourceConfig): NamedTuple class with source configuration data
+            trg_args (XetraTargetConfig): NamedTuple class with target configuration data
+                                          of the compacted report
+            compaction_args (XetraCompactionConfig): NamedTuple class with compaction
+                                                     configuration data
+        """
+        self._logger = logging.getLogger(__name__)
+        self.s3_bucket_trg = s3_bucket_trg
+        self.src_args = src_args
+        self.trg_args = trg_args
+        self.compaction_args = compaction_args
+        self.manifest = self._read_manifest()
+
+    def list_reports(self):
+        """
+        Listing the report files that are not compacted yet
+
+        Returns:
+            keys (list): keys of the new report files, oldest run first
+        """
+        compacted = set(self.manifest[CompactionFormat.SOURCES_KEY.value])
+        reports = []
+        for key in self.s3_bucket_trg.list_files_in_prefix(self.trg_args.trg_key):
+            run_timestamp = self._run_timestamp(key)
+            if run_timestamp and key not in compacted:
+                reports.append((run_timestamp, key))
+        return [key for _, key in sorted(reports)]
+
+    def compact(self):
+        """
+        Merging the new report files into the compacted files of their time buckets
+        and updating the manifest
+
+        Returns:
+            buckets (dict): number of rows by rewritten time bucket
+        """
+        keys = self.list_reports()
+        if not keys:
+            self._logger.info('No new Xetra report files to compact.')
+            return {}
+        self._logger.info('Compacting %s Xetra report files started...', len(keys))
+        data_frames = [data_frame for data_frame in map(self._read_report, keys)
+                       if not data_frame.empty]
+        buckets = {}
+        if data_frames:
+            data_frame = pd.concat(data_frames, ignore_index=True)
+            bucket_col = pd.to_datetime(data_frame[self.src_args.src_col_date]).dt.strftime(
+                self.compaction_args.bucket_format)
+            for bucket, new_rows in data_frame.groupby(bucket_col, sort=True):
+                buckets[bucket] = self._compact_bucket(bucket, new_rows)
+        # The manifest is written last, a failed compaction is repeated on the next run
+        self.manifest[CompactionFormat.SOURCES_KEY.value].extend(keys)
+        self.s3_bucket_trg.write_object(
+            json.dumps(self.manifest), self.compaction_args.manifest_key)
+        self._logger.info('Compacting Xetra report files finished, buckets %s rewritten.',
+                          sorted(buckets))
+        return buckets
+
+    def _compact_bucket(self, bucket: str, new_rows: pd.DataFrame):
+        """
+        Helper function for self.compact() merging the new rows of a time bucket into
+        its compacted file
+
+        Params:
+            bucket (str): time bucket
+            new_rows (pd.DataFrame): rows of the new report files, oldest run first
+
+        Returns:
+            rows (int): number of rows of the compacted file
+        """
+        key_cols = [self.src_args.src_col_isin, self.src_args.src_col_date]
+        compacted_key = (f'{self.compaction_args.compact_prefix}{bucket}.'
+                         f'{CompactionFormat.FILE_FORMAT.value}')
+        data_frames = [new_rows]
+        entry = self.manifest[CompactionFormat.BUCKETS_KEY.value].get(bucket)
+        if entry:
+            # The compacted rows are older than the rows of all new report files
+            data_frames.insert(0, pd.read_parquet(BytesIO(
+                self.s3_bucket_trg.read_object(entry[CompactionFormat.TARGET_KEY.value]))))
+        data_frame = pd.concat(data_frames, ignore_index=True).drop_duplicates(
+            subset=key_cols, keep='last').sort_values(by=key_cols, ignore_index=True)
+        self.s3_bucket_trg.write_df_to_s3(
+            data_frame, compacted_key, CompactionFormat.FILE_FORMAT.value)
+        self.manifest[CompactionFormat.BUCKETS_KEY.value][bucket] = {
+            CompactionFormat.TARGET_KEY.value: compacted_key,
+            CompactionFormat.ROWS_KEY.value: len(data_frame),
+            CompactionFormat.UPDATED_AT_KEY.value: datetime.today().strftime(
+                MetaProcessFormat.META_PROCESS_DATE_FORMAT.value),
+        }
+        return len(data_frame)
+
+    def _run_timestamp(self, key: str):
+        """
+        Helper function returning the run timestamp of a report file key,
+        None for other files below the target key, e.g. run reports
+
+        Params:
+            key (str): key below self.trg_args.trg_key
+
+        Returns:
+            run_timestamp (datetime): start of the run that wrote the report file
+        """
+        if not key.endswith(self.trg_args.trg_format):
+            return None
+        try:
+            return datetime.strptime(
+                key[len(self.trg_args.trg_key):-len(self.trg_args.trg_format)],
+                self.trg_args.trg_key_date_format)
+        except ValueError:
+            return None
+
+    def _read_report(self, key: str):
+        """
+        Helper function reading a report file in the target format
+        """
+        if self.trg_args.trg_format == S3FileTypes.CSV.value:
+            return self.s3_bucket_trg.read_csv_to_df(key)
+        return pd.read_parquet(BytesIO(self.s3_bucket_trg.read_object(key)))
+
+    def _read_manifest(self):
+        """
+        Helper function reading the manifest, if there is none an empty one is returned
+        """
+        try:
+            return json.loads(self.s3_bucket_trg.read_object(self.compaction_args.manifest_key))
+        except self.s3_bucket_trg.key_not_found_exception:
+            return {CompactionFormat.SOURCES_KEY.value: [],
+                    CompactionFormat.BUCKETS_KEY.value: {}}
@@ -0,0 +1,45 @@
+""" Selection of the engine the Xetra ETL job runs on"""
+import importlib
+import logging
+
+from xetra.common.config import XetraRunConfig, XetraSourceConfig, XetraTargetConfig
+from xetra.common.constants import ETLEngines
+from xetra.common.custom_exceptions import WrongEngineException
+from xetra.common.storage import StorageConnector
+
+# Module and XetraETL class of each engine, imported when the engine is used
+ETL_ENGINES = {
+    ETLEngines.PANDAS.value: ('xetra.transformations.xetra_transformations', 'XetraETL'),
+    ETLEngines.ARROW.value: ('xetra.transformations.xetra_arrow', 'XetraArrowETL'),
+    ETLEngines.POLARS.value: ('xetra.transformations.xetra_polars', 'XetraPolarsETL'),
+}
+
+
+def create_xetra_etl(s3_bucket_src: StorageConnector,
+                     s3_bucket_trg: StorageConnector,
+                     meta_key: str,
+                     src_args: XetraSourceConfig,
+                     trg_args: XetraTargetConfig,
+                     run_args: XetraRunConfig = XetraRunConfig()):
+    """
+    Creating the XetraETL instance of the engine configured in run_args
+
+    Params:
+        s3_bucket_src (StorageConnector): connection to source storage
+        s3_bucket_trg (StorageConnector): connection to target storage
+        meta_key (str): key of meta file
+        src_args (XetraSourceConfig): NamedTuple class with source configuration data
+        trg_args (XetraTargetConfig): NamedTuple class with target configuration data
+        run_args (XetraRunConfig): NamedTuple class with run configuration data
+
+    Returns:
+        xetra_etl (XetraETL): instance of the XetraETL class of the engine
+    """
+    if run_args.engine not in ETL_ENGINES:
+        logging.getLogger(__name__).info(
+            'The engine %s is not supported!', run_args.engine)
+        raise WrongEngineException
+    module_name, class_name = ETL_ENGINES[run_args.engine]
+    etl_class = getattr(importlib.import_module(module_name), class_name)
+    return etl_class(
+        s3_bucket_src, s3_bucket_trg, meta_key, src_args, trg_args, run_args)
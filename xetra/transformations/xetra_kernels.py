@@ -0,0 +1,129 @@
+""" JIT-compiled kernels for the Xetra transformations"""
+from functools import lru_cache
+import importlib.util
+
+import numpy as np
+import pandas as pd
+
+
+def _ohlcv_scan(isin_codes, date_codes, start_prices, end_prices,
+                min_prices, max_prices, volumes):
+    """
+    Aggregating rows sorted by ISIN, day and time per ISIN and day in one linear scan
+
+    Returns the first row of every ISIN and day with its opening, closing, minimum and
+    maximum price and traded volume.
+    """
+    row_count = len(isin_codes)
+    group_count = 0
+    for row in range(row_count):
+        if (row == 0 or isin_codes[row] != isin_codes[row - 1]
+                or date_codes[row] != date_codes[row - 1]):
+            group_count += 1
+    first_rows = np.empty(group_count, np.int64)
+    op_prices = np.empty(group_count, start_prices.dtype)
+    clos_prices = np.empty(group_count, end_prices.dtype)
+    day_min_prices = np.empty(group_count, min_prices.dtype)
+    day_max_prices = np.empty(group_count, max_prices.dtype)
+    day_volumes = np.zeros(group_count, volumes.dtype)
+    group = -1
+    for row in range(row_count):
+        if (row == 0 or isin_codes[row] != isin_codes[row - 1]
+                or date_codes[row] != date_codes[row - 1]):
+            group += 1
+            first_rows[group] = row
+            op_prices[group] = start_prices[row]
+            day_min_prices[group] = min_prices[row]
+            day_max_prices[group] = max_prices[row]
+        else:
+            day_min_prices[group] = min(day_min_prices[group], min_prices[row])
+            day_max_prices[group] = max(day_max_prices[group], max_prices[row])
+        clos_prices[group] = end_prices[row]
+        day_volumes[group] += volumes[row]
+    return first_rows, op_prices, clos_prices, day_min_prices, day_max_prices, day_volumes
+
+
+@lru_cache(maxsize=None)
+def _ohlcv_scan_jit():
+    """
+    Compiling _ohlcv_scan on first use, numba is only imported if the kernel is used
+    """
+    import numba
+    return numba.njit(nogil=True)(_ohlcv_scan)
+
+
+class XetraOHLCVKernel():
+    """
+    Class for aggregating Xetra source data per ISIN and day with a numba-compiled
+    linear scan instead of a pandas groupby
+
+    The source rows are sorted once by ISIN, day and time (stable, like the pandas
+    transformations) and scanned as NumPy arrays. The kernel is only available if
+    numba is installed.
+    """
+
+    @staticmethod
+    def available():
+        """
+        Checking if numba is installed
+
+        Returns:
+            True if the kernel can be used
+        """
+        return importlib.util.find_spec('numba') is not None
+
+    @staticmethod
+    def aggregate(data_frame: pd.DataFrame, src_args, trg_args):
+        """
+        Aggregating Xetra source data per ISIN and day
+
+        Params:
+            data_frame (pd.DataFrame): Xetra source data without missing values and with
+                                       numeric prices and volumes, in the original
+                                       or the compact schema
+            src_args (XetraSourceConfig): NamedTuple class with source configuration data
+            trg_args (XetraTargetConfig): NamedTuple class with target configuration data
+
+        Returns:
+            data_frame (pd.DataFrame): opening price, closing price, minimum price,
+                                       maximum price and traded volume per ISIN and day
+                                       in the types of the source data, sorted by ISIN
+                                       and day
+        """
+        isin_codes = XetraOHLCVKernel._sorted_codes(data_frame[src_args.src_col_isin])
+        date_codes = XetraOHLCVKernel._sorted_codes(data_frame[src_args.src_col_date])
+        time_codes = pd.factorize(data_frame[src_args.src_col_time], sort=True)[0]
+        # np.lexsort is stable, rows with the same time keep their order
+        order = np.lexsort((time_codes, date_codes, isin_codes))
+        volumes = data_frame[src_args.src_col_traded_vol].to_numpy()
+        if volumes.dtype.kind in 'iu':
+            # Summing like pandas without overflowing small integer types
+            volumes = volumes.astype(np.int64)
+        first_rows, op_prices, clos_prices, min_prices, max_prices, volumes = _ohlcv_scan_jit()(
+            isin_codes[order], date_codes[order],
+            *(data_frame[column].to_numpy()[order] for column in [
+                src_args.src_col_start_price, src_args.src_col_end_price,
+                src_args.src_col_min_price, src_args.src_col_max_price]),
+            volumes[order])
+        # Keeping the key types, e.g. of the compact schema
+        keys = data_frame.iloc[order[first_rows]]
+        return pd.DataFrame({
+            src_args.src_col_isin: keys[src_args.src_col_isin].to_numpy(),
+            src_args.src_col_date: keys[src_args.src_col_date].to_numpy(),
+            trg_args.trg_col_op_price: op_prices,
+            trg_args.trg_col_clos_price: clos_prices,
+            trg_args.trg_col_min_price: min_prices,
+            trg_args.trg_col_max_price: max_prices,
+            trg_args.trg_col_daily_trad_vol: volumes,
+        })
+
+    @staticmethod
+    def _sorted_codes(series: pd.Series):
+        """
+        Helper function returning integer codes in the sort order of the values,
+        categories of the compact schema are ranked by their values, not their order
+        """
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            ranks = np.argsort(np.argsort(series.cat.categories.to_numpy(), kind='stable'))
+            return ranks[series.cat.codes.to_numpy()]
+        return pd.factorize(series, sort=True)[0]
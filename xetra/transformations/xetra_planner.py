@@ -0,0 +1,69 @@
+""" Dry-run planner estimating the cost of a Xetra ETL run"""
+import logging
+
+from xetra.common.constants import PlanFormat
+
+
+class XetraRunPlanner():
+    """
+    Class for planning a run of report 1 without downloading any source file
+
+    The dates come from the meta file like in the run itself, the objects and bytes
+    from a listing of the source storage that only reads the object metadata.
+    """
+
+    def __init__(self, xetra_etl):
+        """
+        Constructor for XetraRunPlanner
+
+        Params:
+            xetra_etl (XetraETL): XetraETL instance of the planned run
+        """
+        self._logger = logging.getLogger(__name__)
+        self.xetra_etl = xetra_etl
+
+    def plan(self):
+        """
+        Creating the plan of the run
+
+        Header-only objects are source files of at most PlanFormat.HEADER_ONLY_MAX_BYTES
+        bytes, they hold no trades and can be skipped.
+
+        Returns:
+            plan (dict): JSON serializable plan with the dates, objects, bytes and
+                         expected requests of the run
+        """
+        xetra_etl = self.xetra_etl
+        days, header_only = {}, []
+        for date in xetra_etl.extract_date_list:
+            if xetra_etl.listing:
+                sizes = {key: details['size']
+                         for key, details in xetra_etl.listing.list_objects(date).items()}
+            else:
+                sizes = xetra_etl.s3_bucket_src.list_file_sizes_in_prefix(date)
+            days[date] = {'objects': len(sizes), 'bytes': sum(sizes.values())}
+            header_only.extend(key for key, size in sizes.items()
+                               if size <= PlanFormat.HEADER_ONLY_MAX_BYTES.value)
+        objects = sum(day['objects'] for day in days.values())
+        run_args = xetra_etl.run_args
+        plan = {
+            'extract_date': xetra_etl.extract_date,
+            'dates': list(xetra_etl.extract_date_list),
+            'report_dates': list(xetra_etl.meta_update_list),
+            'days': days,
+            'objects': objects,
+            'bytes': sum(day['bytes'] for day in days.values()),
+            'header_only_objects': header_only,
+            'requests': {
+                'LIST': len(xetra_etl.extract_date_list),
+                'GET': objects + PlanFormat.META_GETS.value,
+                # Report, meta file and run report
+                'PUT': (int(objects > len(header_only))
+                        + int(bool(xetra_etl.meta_update_list))
+                        + int(run_args.run_report and run_args.run_report_to_target)),
+            },
+        }
+        self._logger.info('Xetra run plan: %s dates, %s objects, %s bytes, %s header-only '
+                          'objects', len(plan['dates']), plan['objects'], plan['bytes'],
+                          len(header_only))
+        return plan
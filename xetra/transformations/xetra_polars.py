@@ -0,0 +1,162 @@
+""" Polars lazy-query Xetra ETL Component"""
+from io import BytesIO
+
+try:
+    import polars as pl
+except ImportError:  # pragma: no cover - polars is an optional dependency
+    pl = None
+
+from xetra.common.constants import PartialAggregateFormat
+from xetra.transformations.xetra_transformations import XetraETL
+
+
+class XetraPolarsETL(XetraETL):
+    """
+    Reads the Xetra data into Polars and runs the report transformations
+    as one optimized, multi-threaded lazy query over all extracted files
+    """
+
+    def __init__(self, *args, **kwargs):
+        """
+        Class constructor for XetraPolarsETL, takes the arguments of XetraETL
+        """
+        if pl is None:
+            raise ImportError('The polars engine requires the polars package to be installed.')
+        super().__init__(*args, **kwargs)
+
+    def _schema_overrides(self):
+        """
+        Helper function returning the types of the source columns
+        """
+        schema = {column: pl.Utf8 for column in self.src_args.src_columns}
+        schema.update({
+            self.src_args.src_col_start_price: pl.Float64,
+            self.src_args.src_col_end_price: pl.Float64,
+            self.src_args.src_col_min_price: pl.Float64,
+            self.src_args.src_col_max_price: pl.Float64,
+            self.src_args.src_col_traded_vol: pl.Int64,
+        })
+        return schema
+
+    def _read_source(self, key: str):
+        """
+        Helper function for self._extract_day() reading one source file
+
+        Params:
+            key (str): key of the source file
+
+        Returns:
+            data_frame (pl.DataFrame): Polars DataFrame with the data of the file
+        """
+        self._logger.info('Reading file %s/%s', self.s3_bucket_src.location, key)
+        body = self.s3_bucket_src.read_object(key)
+        if self.universe:
+            body = self.universe.filter_lines(body)
+        data_frame = pl.read_csv(BytesIO(body), columns=self.src_args.src_columns,
+                                 schema_overrides=self._schema_overrides())
+        if self.universe:
+            data_frame = data_frame.filter(
+                [pl.col(column).is_in(values)
+                 for column, values in self.universe.allowed.items()])
+        return data_frame
+
+    def _read_intermediate(self, date: str):
+        """
+        Helper function for self._extract_day() reading the intermediate file of a day
+
+        Params:
+            date (str): source date
+
+        Returns:
+            data_frame (pl.DataFrame): Polars DataFrame with the data of the day
+        """
+        return pl.from_arrow(self.intermediate.read_day(date, as_table=True))
+
+    @staticmethod
+    def _from_table(table):
+        """
+        Helper function converting an Arrow table, e.g. read from the spill files
+
+        Params:
+            table (pa.Table): Arrow table
+
+        Returns:
+            data_frame (pl.DataFrame): Polars DataFrame with the data of the table
+        """
+        return pl.from_arrow(table)
+
+    @staticmethod
+    def concat(data_frames: list):
+        """
+        Concatenating the non-empty extracted data of several days or files
+
+        Params:
+            data_frames (list): list of Polars DataFrames
+
+        Returns:
+            data_frame (pl.DataFrame): concatenated Polars DataFrame
+        """
+        data_frames = [data_frame for data_frame in data_frames if data_frame.height]
+        if not data_frames:
+            return pl.DataFrame()
+        return pl.concat(data_frames, how='vertical_relaxed', rechunk=False)
+
+    def transform_report1(self, data_frame: 'pl.DataFrame'):
+        """
+        Applies the necessary transformations to create report 1 as one lazy query
+
+        Params:
+            data_frame (pl.DataFrame): Polars DataFrame as input
+
+        Returns:
+            data_frame (pl.DataFrame): transformed Polars DataFrame
+        """
+        if data_frame.is_empty():
+            self._logger.info(
+                'The dataframe is empty. No transformations will be applied!')
+            return data_frame
+        self._logger.info(
+            'Applying transformations to Xetra source data for report 1 started...')
+        src_args, trg_args = self.src_args, self.trg_args
+        prev_price = pl.col(trg_args.trg_col_op_price).shift(1).over(src_args.src_col_isin)
+        data_frame = (
+            data_frame.lazy()
+            # Filtering necessary source columns and removing rows with missing values
+            .select(src_args.src_columns)
+            .drop_nulls()
+            # Aggregating per ISIN and day -> opening price, closing price, min
+            # price, max price, traded volume
+            .group_by([src_args.src_col_isin, src_args.src_col_date]).agg(
+                pl.col(src_args.src_col_start_price).sort_by(
+                    src_args.src_col_time, maintain_order=True).first()
+                .alias(trg_args.trg_col_op_price),
+                pl.col(src_args.src_col_end_price).sort_by(
+                    src_args.src_col_time, maintain_order=True).last()
+                .alias(trg_args.trg_col_clos_price),
+                pl.col(src_args.src_col_min_price).min().alias(trg_args.trg_col_min_price),
+                pl.col(src_args.src_col_max_price).max().alias(trg_args.trg_col_max_price),
+                pl.col(src_args.src_col_traded_vol).sum().alias(trg_args.trg_col_daily_trad_vol))
+            .sort([src_args.src_col_isin, src_args.src_col_date])
+            # % Change of current day's closing price compared to the previous trading day's closing price
+            .with_columns(((pl.col(trg_args.trg_col_op_price) - prev_price) / prev_price * 100)
+                          .alias(trg_args.trg_col_ch_prev_clos))
+            # Rounding to 2 decimal places
+            .with_columns(pl.col(pl.Float64).round(PartialAggregateFormat.REPORT_DECIMALS.value))
+            # Removing the day before extract_date
+            .filter(pl.col(src_args.src_col_date) >= self.extract_date)
+            .collect()
+        )
+        self._logger.info(
+            'Applying transformations to Xetra source data finished...')
+        return data_frame
+
+    def _write_target(self, data_frame: 'pl.DataFrame', target_key: str):
+        """
+        Helper function for self.load() writing the report to the target
+
+        Params:
+            data_frame (pl.DataFrame): Polars DataFrame to write
+            target_key (str): key of the target file
+        """
+        return self.s3_bucket_trg.write_table_to_s3(
+            data_frame.to_arrow(), target_key, self.trg_args.trg_format)
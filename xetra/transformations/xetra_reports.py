@@ -0,0 +1,133 @@
+""" Running several Xetra reports on a single shared extract"""
+from datetime import datetime
+import json
+import logging
+from typing import NamedTuple
+
+from xetra.common.config import XetraReportConfig, XetraRunConfig, XetraSourceConfig
+from xetra.common.constants import XetraReports
+from xetra.common.custom_exceptions import WrongReportException
+from xetra.common.intermediate import IntermediateStore
+from xetra.common.metrics import RunMetrics
+from xetra.common.storage import StorageConnector
+from xetra.transformations.xetra_engines import create_xetra_etl
+from xetra.transformations.xetra_universe import XetraUniverse
+
+
+class XetraReportMethods(NamedTuple):
+    """
+    Class for the XetraETL methods creating a report
+
+    Params:
+        transform (str): name of the method transforming the extracted data
+        load (str): name of the method writing the report and updating the meta file
+    """
+    transform: str
+    load: str
+
+
+# XetraETL methods creating each report
+REPORT_METHODS = {
+    XetraReports.REPORT1.value: XetraReportMethods('transform_report1', 'load'),
+    XetraReports.INTRADAY_BARS.value: XetraReportMethods(
+        'transform_intraday_bars', 'load_partitioned'),
+    XetraReports.ROLLING_WINDOWS.value: XetraReportMethods(
+        'transform_rolling_windows', 'load_rolling_windows'),
+}
+
+
+class XetraReportJob():
+    """
+    Extracts the source days needed by all configured reports once
+    and creates, writes and tracks each report with its own target and meta file
+    """
+
+    def __init__(self, s3_bucket_src: StorageConnector,
+                 s3_bucket_trg: StorageConnector,
+                 src_args: XetraSourceConfig,
+                 report_configs: list,
+                 run_args: XetraRunConfig = XetraRunConfig()):
+        """
+        Constructor for XetraReportJob
+
+        Params:
+            s3_bucket_src (StorageConnector): connection to source storage
+            s3_bucket_trg (StorageConnector): connection to target storage
+            src_args (XetraSourceConfig): NamedTuple class with source configuration data
+            report_configs (list): list of XetraReportConfig of the reports
+            run_args (XetraRunConfig): NamedTuple class with run configuration data
+        """
+        self._logger = logging.getLogger(__name__)
+        for report_config in report_configs:
+            if report_config.report not in REPORT_METHODS:
+                self._logger.info('The report %s is not supported!', report_config.report)
+                raise WrongReportException
+        self.report_configs = report_configs
+        self.run_args = run_args
+        # One XetraETL instance per report, reading its own meta file
+        self.etls = [create_xetra_etl(s3_bucket_src, s3_bucket_trg, report_config.meta_key,
+                                      src_args, report_config.trg_args, run_args)
+                     for report_config in report_configs]
+        self.extract_date_list = sorted(
+            {date for xetra_etl in self.etls for date in xetra_etl.extract_date_list})
+        # Sharing the metrics and the intermediate files of the extract
+        self.metrics = RunMetrics(run_args.run_report)
+        s3_bucket_src.metrics = self.metrics
+        s3_bucket_trg.metrics = self.metrics
+        self.intermediate = None
+        if run_args.intermediate_dir:
+            self.intermediate = IntermediateStore(
+                run_args.intermediate_dir,
+                IntermediateStore.create_run_id(
+                    '|'.join(report_config.meta_key for report_config in report_configs),
+                    self.extract_date_list[0] if self.extract_date_list else '',
+                    XetraUniverse.fingerprint_of(XetraUniverse.from_config(src_args))))
+        for xetra_etl in self.etls:
+            xetra_etl.metrics = self.metrics
+            xetra_etl.intermediate = self.intermediate
+
+    def run(self):
+        """
+        Extract once, transform and load each configured report
+        """
+        run_timestamps = [datetime.today().strftime(xetra_etl.trg_args.trg_key_date_format)
+                          for xetra_etl in self.etls]
+        # Extraction of the days of all reports
+        with self.metrics.stage('extract'):
+            days = self.etls[0].extract_days(self.extract_date_list) if self.etls else {}
+        self.metrics.add_rows('extract', 0, sum(len(day) for day in days.values()))
+        for report_config, xetra_etl in zip(self.report_configs, self.etls):
+            self._logger.info('Creating Xetra report %s started...', report_config.name)
+            data_frame = xetra_etl.extract_from_days(days)
+            # Transformation
+            rows_in = len(data_frame)
+            report_methods = REPORT_METHODS[report_config.report]
+            transform = getattr(xetra_etl, report_methods.transform)
+            with self.metrics.stage(f'transform_{report_config.name}'):
+                data_frame = transform(data_frame)
+            self.metrics.add_rows(f'transform_{report_config.name}', rows_in, len(data_frame))
+            # Load
+            with self.metrics.stage(f'load_{report_config.name}'):
+                getattr(xetra_etl, report_methods.load)(data_frame)
+            self.metrics.add_rows(f'load_{report_config.name}', len(data_frame), len(data_frame))
+        # Removing the intermediate files of the finished run
+        if self.intermediate:
+            self.intermediate.clear()
+        if self.metrics.enabled:
+            self._write_run_report(run_timestamps)
+        return True
+
+    def _write_run_report(self, run_timestamps: list):
+        """
+        Helper function for self.run() logging and optionally saving the run report
+        next to the target file of each report
+
+        Params:
+            run_timestamps (list): start of the run in the target key date format of each report
+        """
+        run_report = self.metrics.report()
+        self._logger.info('Xetra run report: %s', json.dumps(run_report))
+        if self.run_args.run_report_to_target:
+            for xetra_etl, run_timestamp in zip(self.etls, run_timestamps):
+                xetra_etl.s3_bucket_trg.write_json_to_s3(
+                    run_report, f'{xetra_etl.trg_args.trg_key}{run_timestamp}_run_report.json')
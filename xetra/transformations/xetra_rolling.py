@@ -0,0 +1,173 @@
+""" Incremental rolling-window analytics of the closing prices per ISIN"""
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+
+from xetra.common.constants import PartialAggregateFormat
+
+
+class XetraRollingState():
+    """
+    Class holding the last closing prices of every ISIN in a ring buffer
+
+    A daily update appends the new closing prices and computes the moving averages and
+    the volatilities of the configured windows from the buffers only, so its cost does
+    not grow with the length of the history. The state is persisted as npz file.
+    """
+
+    def __init__(self, capacity: int, isins=None, closes=None, counts=None, last_dates=None):
+        """
+        Constructor for XetraRollingState
+
+        Params:
+            capacity (int): number of closing prices kept per ISIN
+            isins (np.ndarray): ISINs of the state
+            closes (np.ndarray): ring buffers of the closing prices, one row per ISIN
+            counts (np.ndarray): number of closing prices appended per ISIN
+            last_dates (np.ndarray): date of the last appended closing price per ISIN
+        """
+        self.capacity = capacity
+        self.isins = np.array([] if isins is None else isins, dtype=str)
+        self.closes = np.full((0, capacity), np.nan) if closes is None else closes
+        self.counts = np.zeros(0, dtype=np.int64) if counts is None else counts
+        self.last_dates = np.array([] if last_dates is None else last_dates, dtype='U10')
+        self._index = {isin: index for index, isin in enumerate(self.isins)}
+        if self.closes.shape[1] < capacity:
+            self._resize(capacity)
+
+    @classmethod
+    def from_bytes(cls, body: bytes, capacity: int):
+        """
+        Creating the state from the content of a npz file
+
+        Params:
+            body (bytes): content of the npz file written by self.to_bytes()
+            capacity (int): minimal number of closing prices kept per ISIN
+
+        Returns:
+            state (XetraRollingState): the persisted state
+        """
+        with np.load(BytesIO(body), allow_pickle=False) as state_file:
+            return cls(max(capacity, state_file['closes'].shape[1]),
+                       state_file['isins'], state_file['closes'],
+                       state_file['counts'], state_file['last_dates'])
+
+    def to_bytes(self):
+        """
+        Writing the state into the content of a npz file
+
+        Returns:
+            body (bytes): content of the npz file
+        """
+        out_buffer = BytesIO()
+        np.savez_compressed(out_buffer, isins=self.isins, closes=self.closes,
+                            counts=self.counts, last_dates=self.last_dates)
+        return out_buffer.getvalue()
+
+    def update(self, data_frame: pd.DataFrame, src_args, trg_args):
+        """
+        Appending the closing prices of report 1 and creating the rolling-window report
+
+        Days that are not later than the last appended day of an ISIN are skipped,
+        so running the same days again does not change the state.
+
+        Params:
+            data_frame (pd.DataFrame): report 1 with one row per ISIN and day
+            src_args (XetraSourceConfig): NamedTuple class with source configuration data
+            trg_args (XetraTargetConfig): NamedTuple class with target configuration data
+
+        Returns:
+            data_frame (pd.DataFrame): closing price, moving averages and volatilities
+                                       per ISIN and day of the appended days
+        """
+        if self.capacity < max(trg_args.trg_rolling_windows) + 1:
+            self._resize(max(trg_args.trg_rolling_windows) + 1)
+        data_frames = []
+        if len(data_frame):
+            for date, data_frame_day in data_frame.groupby(src_args.src_col_date, sort=True):
+                data_frames.append(self._update_day(
+                    date, data_frame_day[src_args.src_col_isin].to_numpy(dtype=str),
+                    data_frame_day[trg_args.trg_col_clos_price].to_numpy(dtype=np.float64),
+                    src_args, trg_args))
+        columns = [src_args.src_col_isin, src_args.src_col_date, trg_args.trg_col_clos_price]
+        for window in trg_args.trg_rolling_windows:
+            columns += [f'{trg_args.trg_col_moving_avg}_{window}',
+                        f'{trg_args.trg_col_volatility}_{window}']
+        if not data_frames:
+            return pd.DataFrame(columns=columns)
+        data_frame = pd.concat(data_frames, ignore_index=True).loc[:, columns]
+        data_frame = data_frame.sort_values(
+            by=[src_args.src_col_isin, src_args.src_col_date], ignore_index=True)
+        return data_frame.round(decimals=PartialAggregateFormat.REPORT_DECIMALS.value)
+
+    def _update_day(self, date: str, isins: np.ndarray, closes: np.ndarray,
+                    src_args, trg_args):
+        """
+        Helper function for self.update() appending the closing prices of one day
+
+        Params:
+            date (str): date of the closing prices
+            isins (np.ndarray): ISINs traded on the day
+            closes (np.ndarray): closing prices of the ISINs
+            src_args (XetraSourceConfig): NamedTuple class with source configuration data
+            trg_args (XetraTargetConfig): NamedTuple class with target configuration data
+
+        Returns:
+            data_frame (pd.DataFrame): rolling-window values of the day
+        """
+        self._add_isins(isins)
+        rows = np.array([self._index[isin] for isin in isins], dtype=np.int64)
+        fresh = self.last_dates[rows] < date
+        rows, isins, closes = rows[fresh], isins[fresh], closes[fresh]
+        # Appending to the ring buffers
+        self.closes[rows, self.counts[rows] % self.capacity] = closes
+        self.counts[rows] += 1
+        self.last_dates[rows] = date
+        # Last closing prices per ISIN, newest first
+        lags = (self.counts[rows, None] - 1 - np.arange(self.capacity)) % self.capacity
+        history = self.closes[rows[:, None], lags]
+        available = np.minimum(self.counts[rows], self.capacity)
+        data = {src_args.src_col_isin: isins.astype(object),
+                src_args.src_col_date: date,
+                trg_args.trg_col_clos_price: closes}
+        for window in trg_args.trg_rolling_windows:
+            moving_avg = history[:, :window].mean(axis=1)
+            moving_avg[available < window] = np.nan
+            data[f'{trg_args.trg_col_moving_avg}_{window}'] = moving_avg
+            # Volatility as standard deviation of the daily returns in %
+            with np.errstate(divide='ignore', invalid='ignore'):
+                returns = (history[:, :window] / history[:, 1:window + 1] - 1) * 100
+                volatility = returns.std(axis=1, ddof=1)
+            volatility[available < window + 1] = np.nan
+            data[f'{trg_args.trg_col_volatility}_{window}'] = volatility
+        return pd.DataFrame(data)
+
+    def _add_isins(self, isins: np.ndarray):
+        """
+        Helper function adding the unknown ISINs with empty ring buffers
+        """
+        new_isins = [isin for isin in dict.fromkeys(isins) if isin not in self._index]
+        if not new_isins:
+            return
+        self._index.update({isin: len(self.isins) + index
+                            for index, isin in enumerate(new_isins)})
+        self.isins = np.concatenate([self.isins, np.array(new_isins, dtype=str)])
+        self.closes = np.vstack([self.closes, np.full((len(new_isins), self.capacity), np.nan)])
+        self.counts = np.concatenate([self.counts, np.zeros(len(new_isins), dtype=np.int64)])
+        self.last_dates = np.concatenate(
+            [self.last_dates, np.array([''] * len(new_isins), dtype='U10')])
+
+    def _resize(self, capacity: int):
+        """
+        Helper function enlarging the ring buffers, e.g. after adding a longer window
+        """
+        available = np.minimum(self.counts, self.closes.shape[1])
+        closes = np.full((len(self.isins), capacity), np.nan)
+        for row, count in enumerate(self.counts):
+            # Oldest first in the new buffer, continuing at position available[row]
+            lags = (count - 1 - np.arange(available[row])[::-1]) % self.closes.shape[1]
+            closes[row, :available[row]] = self.closes[row, lags]
+        self.closes = closes
+        self.counts = available.astype(np.int64)
+        self.capacity = capacity
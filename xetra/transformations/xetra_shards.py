@@ -0,0 +1,167 @@
+""" Sharded runs of report 1 across several processes or nodes"""
+import hashlib
+import json
+import logging
+from io import BytesIO
+
+import pandas as pd
+
+from xetra.common.constants import ShardFormat
+from xetra.common.custom_exceptions import WrongShardException
+from xetra.common.intermediate import IntermediateStore
+from xetra.transformations.xetra_aggregations import XetraPartialAggregates
+from xetra.transformations.xetra_compact import XetraCompactSchema
+from xetra.transformations.xetra_universe import XetraUniverse
+
+
+class XetraShardedRun():
+    """
+    Class for splitting the run of report 1 into shards of contiguous date ranges
+
+    Every shard extracts its dates and writes the partial aggregates per ISIN and day
+    as its own part together with a meta delta listing its dates. The finalize step
+    merges the parts, computes the % change to the previous trading day across the
+    shard borders, writes report 1 and updates the meta file with all meta deltas.
+    All shards and the finalize step have to be started on the same day with the same
+    meta file, so they agree on the dates of the run.
+    """
+
+    def __init__(self, xetra_etl, shard_count: int):
+        """
+        Constructor for XetraShardedRun
+
+        Params:
+            xetra_etl (XetraETL): XetraETL instance of the run, any engine
+            shard_count (int): number of shards of the run
+        """
+        self._logger = logging.getLogger(__name__)
+        if shard_count < 1:
+            self._logger.info('The shard count %s is not supported!', shard_count)
+            raise WrongShardException
+        self.xetra_etl = xetra_etl
+        self.shard_count = shard_count
+        # The parts of a run are only valid for exactly its dates
+        universe = XetraUniverse.fingerprint_of(xetra_etl.universe)
+        run_key = '|'.join([xetra_etl.meta_key] + list(xetra_etl.extract_date_list)
+                           + ([universe] if universe else []))
+        run_id = hashlib.sha1(run_key.encode('utf-8')).hexdigest()[:16]
+        self.shard_prefix = (f'{xetra_etl.trg_args.trg_key}'
+                             f'{ShardFormat.SHARD_DIR.value}/{run_id}/')
+        # The intermediate files of each shard are kept in a sub directory of the run
+        self.intermediate_dir = xetra_etl.intermediate.run_dir if xetra_etl.intermediate else None
+
+    def shard_dates(self, shard_index: int):
+        """
+        Returning the source dates extracted by a shard
+
+        The report dates are split into shard_count contiguous ranges, the first shard
+        also extracts the day before extract_date.
+
+        Params:
+            shard_index (int): index of the shard, 0 <= shard_index < shard_count
+
+        Returns:
+            dates (list): source dates of the shard
+        """
+        self._check_index(shard_index)
+        report_dates = self.xetra_etl.meta_update_list
+        dates = report_dates[shard_index * len(report_dates) // self.shard_count:
+                             (shard_index + 1) * len(report_dates) // self.shard_count]
+        if shard_index == 0:
+            dates = [date for date in self.xetra_etl.extract_date_list
+                     if date < self.xetra_etl.extract_date] + dates
+        return dates
+
+    def run_shard(self, shard_index: int):
+        """
+        Extracting the dates of a shard and writing its part and meta delta
+
+        The meta delta is written last and marks the shard as finished, the intermediate
+        files of the shard are removed afterwards.
+
+        Params:
+            shard_index (int): index of the shard, 0 <= shard_index < shard_count
+        """
+        xetra_etl = self.xetra_etl
+        dates = self.shard_dates(shard_index)
+        if self.intermediate_dir:
+            xetra_etl.intermediate = IntermediateStore(
+                self.intermediate_dir, f'shard-{shard_index:04d}-of-{self.shard_count:04d}')
+        days = xetra_etl.extract_days(dates)
+        data_frame = xetra_etl.concat([days[date] for date in dates])
+        if not isinstance(data_frame, pd.DataFrame):
+            data_frame = data_frame.to_pandas()
+        data_frame = XetraCompactSchema.restore(data_frame, xetra_etl.src_args)
+        if data_frame.empty:
+            partial = pd.DataFrame()
+        else:
+            partial = XetraPartialAggregates.from_source(
+                data_frame, xetra_etl.src_args, xetra_etl.trg_args)
+        xetra_etl.s3_bucket_trg.write_df_to_s3(
+            partial, self._part_key(shard_index), ShardFormat.PART_FORMAT.value)
+        xetra_etl.s3_bucket_trg.write_json_to_s3({
+            ShardFormat.DELTA_DATES_KEY.value: [
+                date for date in dates if date >= xetra_etl.extract_date],
+            ShardFormat.DELTA_ROWS_KEY.value: len(partial),
+        }, self._delta_key(shard_index))
+        # Removing the intermediate files of the finished shard
+        if xetra_etl.intermediate:
+            xetra_etl.intermediate.clear()
+        self._logger.info('Xetra shard %s of %s successfully written.',
+                          shard_index, self.shard_count)
+        return True
+
+    def finalize(self):
+        """
+        Merging the parts of all shards into report 1 and updating the meta file,
+        the parts and meta deltas of the shards are deleted afterwards
+
+        Raises WrongShardException if a shard has not finished yet.
+        """
+        xetra_etl = self.xetra_etl
+        deltas, missing = [], []
+        for shard_index in range(self.shard_count):
+            try:
+                deltas.append(json.loads(xetra_etl.s3_bucket_trg.read_object(
+                    self._delta_key(shard_index))))
+            except xetra_etl.s3_bucket_trg.key_not_found_exception:
+                missing.append(shard_index)
+        if missing:
+            self._logger.info('The shards %s of %s are missing!', missing, self.shard_count)
+            raise WrongShardException
+        partials = [
+            pd.read_parquet(BytesIO(xetra_etl.s3_bucket_trg.read_object(
+                self._part_key(shard_index))))
+            for shard_index, delta in enumerate(deltas)
+            if delta[ShardFormat.DELTA_ROWS_KEY.value]]
+        # % Change to the previous trading day across the shard borders
+        data_frame = xetra_etl.transform_report1_from_partials(partials)
+        # Merging the meta deltas of all shards
+        xetra_etl.meta_update_list = sorted(
+            {date for delta in deltas for date in delta[ShardFormat.DELTA_DATES_KEY.value]})
+        result = xetra_etl.load(data_frame)
+        xetra_etl.s3_bucket_trg.delete_objects_in_prefix(self.shard_prefix)
+        return result
+
+    def _check_index(self, shard_index: int):
+        """
+        Helper function raising WrongShardException for shard indexes out of range
+        """
+        if not 0 <= shard_index < self.shard_count:
+            self._logger.info('The shard index %s is not supported for %s shards!',
+                              shard_index, self.shard_count)
+            raise WrongShardException
+
+    def _part_key(self, shard_index: int):
+        """
+        Helper function returning the key of the part of a shard
+        """
+        return (f'{self.shard_prefix}part-{shard_index:04d}-of-{self.shard_count:04d}.'
+                f'{ShardFormat.PART_FORMAT.value}')
+
+    def _delta_key(self, shard_index: int):
+        """
+        Helper function returning the key of the meta delta of a shard
+        """
+        return (f'{self.shard_prefix}meta-{shard_index:04d}-of-{self.shard_count:04d}.'
+                f'{ShardFormat.DELTA_FORMAT.value}')
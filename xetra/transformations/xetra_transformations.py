@@ -1,69 +1,31 @@
 """ Xetra ETL Component"""
 from datetime import datetime
+import hashlib
+from io import BytesIO
+import json
 import logging
 
-
-from typing import NamedTuple
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from xetra.common.constants import (BatchWriteFormat, ETLEngines, LoadManifestFormat,
+                                    MetaProcessFormat, S3FileTypes, SpillFormat,
+                                    SummaryFormat)
+from xetra.common.config import XetraRunConfig, XetraSourceConfig, XetraTargetConfig
+from xetra.common.day_cache import DayCache
+from xetra.common.intermediate import IntermediateStore
+from xetra.common.listing import ListingManifest
+from xetra.common.load_manifest import LoadManifest
 from xetra.common.meta_process import MetaProcess
-from xetra.common.s3 import S3BucketConnector
-
-
-class XetraSourceConfig(NamedTuple):
-    """
-    Class for source configuration data
-
-    Params:
-        src_first_extract_date (str): determines the date for extracting the source
-        src_columns (list): source column names
-        src_col_date (str): column name for date in source
-        src_col_isin (str): column name for isin source
-        src_col_time (str): column name for time in source
-        src_col_start_price (str): column name for starting price in source
-        src_col_min_price (str): column name for minimum price in source
-        src_col_max_price (str): column name for maximum price in source
-        src_col_trade_vol (str): column name for traded volumn in source
-    """
-
-    src_first_extract_date: str
-    src_columns: list
-    src_col_date: str
-    src_col_isin: str
-    src_col_time: str
-    src_col_start_price: str
-    src_col_end_price: str
-    src_col_min_price: str
-    src_col_max_price: str
-    src_col_traded_vol: str
-
-
-class XetraTargetConfig(NamedTuple):
-    """
-    Class for target configuration data
-
-    Params:
-        trg_col_isin (str): column name for isin in target
-        trg_col_date (str): column name for date in target
-        trg_col_op_price (str): column name for opening price in target
-        trg_col_clos_price (str): column name for closing price in target
-        trg_col_min_price (str): column name for minimum price in target
-        trg_col_max_price (str): column name for maximum price in target
-        trg_daily_traded_volume (str): column names for daily traded volume in target
-        trg_key (str): basic key for target file
-        trg_key_date_format (str): date format of the target file key
-        trg_format (str): file format of the target file
-    """
-    trg_col_isin: str
-    trg_col_date: str
-    trg_col_op_price: str
-    trg_col_clos_price: str
-    trg_col_min_price: str
-    trg_col_max_price: str
-    trg_col_daily_trad_vol: str
-    trg_col_ch_prev_clos: str
-    trg_key: str
-    trg_key_date_format: str
-    trg_format: str
+from xetra.common.metrics import RunMetrics
+from xetra.common.spill import SpillStore
+from xetra.common.storage import StorageConnector
+from xetra.transformations.xetra_aggregations import XetraPartialAggregates
+from xetra.transformations.xetra_bars import XetraIntradayBars
+from xetra.transformations.xetra_compact import XetraCompactSchema
+from xetra.transformations.xetra_kernels import XetraOHLCVKernel
+from xetra.transformations.xetra_rolling import XetraRollingState
+from xetra.transformations.xetra_universe import XetraUniverse
 
 
 class XetraETL():
@@ -71,20 +33,22 @@ class XetraETL():
     Reads the Xetra data, transforms and wrties the transformed to target
     """
 
-    def __init__(self, s3_bucket_src: S3BucketConnector,
-                 s3_bucket_trg: S3BucketConnector,
+    def __init__(self, s3_bucket_src: StorageConnector,
+                 s3_bucket_trg: StorageConnector,
                  meta_key: str,
                  src_args: XetraSourceConfig,
-                 trg_args: XetraTargetConfig):
+                 trg_args: XetraTargetConfig,
+                 run_args: XetraRunConfig = XetraRunConfig()):
         """
         Class constructor for XetraTransformer
 
         Params:
-            s3_bucket_src (S3BucketConnector): connection to source S3 bucket
-            s3_bucket_trg (S3BucketConnector): connection to target S3 bucket
+            s3_bucket_src (StorageConnector): connection to source storage
+            s3_bucket_trg (StorageConnector): connection to target storage
             meta_key (str): used as self.meta_key -> key of meta file
             src_args (XetraSourceConfig): NamedTuple class with source configuration data
             trg_args (XetraTargetConfig): NamedTuple class with target configuration data
+            run_args (XetraRunConfig): NamedTuple class with run configuration data
         """
         self._logger = logging.getLogger(__name__)
         self.s3_bucket_src = s3_bucket_src
@@ -92,10 +56,42 @@ class XetraETL():
         self.meta_key = meta_key
         self.src_args = src_args
         self.trg_args = trg_args
+        self.run_args = run_args
+        self.metrics = RunMetrics(self.run_args.run_report)
+        self.s3_bucket_src.metrics = self.metrics
+        self.s3_bucket_trg.metrics = self.metrics
         self.extract_date, self.extract_date_list = MetaProcess.return_date_list(
             self.src_args.src_first_extract_date, self.meta_key, self.s3_bucket_trg)
         self.meta_update_list = [
             date for date in self.extract_date_list if date >= self.extract_date]
+        self.rolling_state = None
+        self.universe = XetraUniverse.from_config(self.src_args)
+        self.listing = None
+        if self.run_args.listing_manifest_key:
+            self.listing = ListingManifest(
+                self.s3_bucket_src, self.s3_bucket_trg,
+                self.run_args.listing_manifest_key, self.run_args.listing_refresh_s)
+        self.day_cache = None
+        if self.run_args.day_cache_dir:
+            self.day_cache = DayCache(self.run_args.day_cache_dir, DayCache.create_namespace(
+                self.run_args.engine,
+                self.run_args.compact_schema and self.run_args.engine == ETLEngines.PANDAS.value,
+                self.src_args.src_columns, XetraUniverse.fingerprint_of(self.universe)))
+        self._ohlcv_kernel = self.run_args.ohlcv_kernel and XetraOHLCVKernel.available()
+        if self.run_args.ohlcv_kernel and not self._ohlcv_kernel:
+            self._logger.warning(
+                'numba is not installed, report 1 is aggregated with pandas.')
+        self.load_manifest = None
+        if self.run_args.load_manifest_key:
+            self.load_manifest = LoadManifest(
+                self.s3_bucket_trg, self.run_args.load_manifest_key)
+        self.intermediate = None
+        if self.run_args.intermediate_dir:
+            self.intermediate = IntermediateStore(
+                self.run_args.intermediate_dir,
+                IntermediateStore.create_run_id(
+                    self.meta_key, self.extract_date_list[0] if self.extract_date_list else '',
+                    XetraUniverse.fingerprint_of(self.universe)))
 
     def extract(self):
         """
@@ -104,18 +100,145 @@ class XetraETL():
         Returns:
             data_frame (pd.DataFrame): Pandas DataFrame with the extracted data
         """
+        return self.extract_from_days(self.extract_days(self.extract_date_list))
+
+    def extract_days(self, date_list: list):
+        """
+        Read the source data of several days, e.g. to be shared by several reports
+
+        Params:
+            date_list (list): list of source dates
+
+        Returns:
+            days (dict): data of each day by source date
+        """
         self._logger.info('Extracting Xetra source files started...')
-        files = [
-            key for date in self.extract_date_list
-            for key in self.s3_bucket_src.list_files_in_prefix(date)]
-        if not files:
-            data_frame = pd.DataFrame()
-        else:
-            data_frame = pd.concat([self.s3_bucket_src.read_csv_to_df(
-                file) for file in files], ignore_index=True)
+        days = {date: self._extract_day(date) for date in date_list}
+        if self.listing:
+            self.listing.save()
         self._logger.info('Extracting Xetra source files finished')
+        return days
+
+    def extract_from_days(self, days: dict):
+        """
+        Concatenates the already extracted data of the days in self.extract_date_list
+
+        Params:
+            days (dict): data of each day by source date, e.g. returned by self.extract_days()
+
+        Returns:
+            data_frame (pd.DataFrame): Pandas DataFrame with the extracted data
+        """
+        return self.concat([days[date] for date in self.extract_date_list])
+
+    def _extract_day(self, date: str):
+        """
+        Helper function for self.extract() reading the source data of one day
+
+        Days in the day cache are opened memory-mapped, days that are already persisted
+        by a previous, failed run are reused, for days that were not closed yet when
+        they were persisted only the newly published files are read.
+
+        Params:
+            date (str): source date
+
+        Returns:
+            data_frame (pd.DataFrame): Pandas DataFrame with the data of the day
+        """
+        if self.day_cache and self.day_cache.has_day(date):
+            return self._from_table(self.day_cache.read_day(date))
+        today = datetime.today().strftime(MetaProcessFormat.META_DATE_FORMAT.value)
+        data_frames, done_keys = [], []
+        if self.intermediate and self.intermediate.has_day(date):
+            data_frames.append(self._read_intermediate(date))
+            if self.intermediate.is_complete(date):
+                return data_frames[0]
+            done_keys = self.intermediate.day_keys(date)
+        files = [key for key in self._list_source(date) if key not in done_keys]
+        data_frames.extend(self._read_source(file) for file in files)
+        data_frame = self.concat(data_frames)
+        if self.intermediate and (files or not self.intermediate.has_day(date)):
+            self.intermediate.write_day(date, data_frame, list(done_keys) + files,
+                                        complete=date < today)
+        if self.day_cache and ListingManifest.is_closed(date):
+            # Only closed days are immutable
+            self.day_cache.write_day(date, data_frame)
         return data_frame
 
+    def _list_source(self, date: str):
+        """
+        Helper function for self._extract_day() listing the source files of one day,
+        from the listing manifest if configured
+
+        Params:
+            date (str): source date
+
+        Returns:
+            files (list): keys of the source files of the day
+        """
+        if self.listing:
+            return self.listing.list_files(date)
+        return self.s3_bucket_src.list_files_in_prefix(date)
+
+    def _read_source(self, key: str):
+        """
+        Helper function for self._extract_day() reading one source file
+
+        Params:
+            key (str): key of the source file
+
+        Returns:
+            data_frame (pd.DataFrame): Pandas DataFrame with the data of the file
+        """
+        data_frame = self.s3_bucket_src.read_csv_to_df(
+            key, **XetraUniverse.csv_filters(self.universe))
+        if self.run_args.compact_schema:
+            data_frame = XetraCompactSchema.compact(data_frame, self.src_args)
+        return data_frame
+
+    def _read_intermediate(self, date: str):
+        """
+        Helper function for self._extract_day() reading the intermediate file of a day
+
+        Params:
+            date (str): source date
+
+        Returns:
+            data_frame (pd.DataFrame): Pandas DataFrame with the data of the day
+        """
+        data_frame = self.intermediate.read_day(date)
+        if self.run_args.compact_schema:
+            data_frame = XetraCompactSchema.compact(data_frame, self.src_args)
+        return data_frame
+
+    @staticmethod
+    def _from_table(table: pa.Table):
+        """
+        Helper function converting an Arrow table, e.g. read from the spill files
+
+        Params:
+            table (pa.Table): Arrow table
+
+        Returns:
+            data_frame (pd.DataFrame): Pandas DataFrame with the data of the table
+        """
+        return table.to_pandas()
+
+    @staticmethod
+    def concat(data_frames: list):
+        """
+        Concatenating the non-empty extracted data of several days or files
+
+        Params:
+            data_frames (list): list of Pandas DataFrames
+
+        Returns:
+            data_frame (pd.DataFrame): concatenated Pandas DataFrame
+        """
+        data_frames = [data_frame for data_frame in data_frames if not data_frame.empty]
+        if not data_frames:
+            return pd.DataFrame()
+        return XetraCompactSchema.concat(data_frames)
 
     def transform_report1(self, data_frame: pd.DataFrame):
         """
@@ -137,45 +260,275 @@ class XetraETL():
         data_frame = data_frame.loc[:, self.src_args.src_columns]
         # Removing rows with missing values
         data_frame.dropna(inplace=True)
-        # Calculating opening price per ISIN and day
-        data_frame[self.trg_args.trg_col_op_price] = data_frame.sort_values(by=[self.src_args.src_col_time]).groupby([
-            self.src_args.src_col_isin,
-            self.src_args.src_col_date])[self.src_args.src_col_start_price].transform('first')
-        # Calculating closing price per ISIN and day
-        data_frame[self.trg_args.trg_col_clos_price] = data_frame.sort_values(by=[self.src_args.src_col_time]).groupby([
-            self.src_args.src_col_isin,
-            self.src_args.src_col_date])[self.src_args.src_col_end_price].transform('last')
-        # Renaming columns
-        data_frame.rename(columns={
-            self.src_args.src_col_min_price: self.trg_args.trg_col_min_price,
-            self.src_args.src_col_max_price: self.trg_args.trg_col_max_price,
-            self.src_args.src_col_traded_vol: self.trg_args.trg_col_daily_trad_vol,
-        }, inplace=True)
-        # Aggregating per ISIN and day -> opening price, closing price, min
-        # price, max price, traded volume
-        data_frame = data_frame.groupby([
-            self.src_args.src_col_isin,
-            self.src_args.src_col_date], as_index=False).agg({
-                self.trg_args.trg_col_op_price: 'min',
-                self.trg_args.trg_col_clos_price: 'max',
-                self.trg_args.trg_col_min_price: 'min',
-                self.trg_args.trg_col_max_price: 'max',
-                self.trg_args.trg_col_daily_trad_vol: 'sum',
-            })
-        # % Change of current day's closing price compared to the previous trading day's closing price
-        data_frame[self.trg_args.trg_col_ch_prev_clos] = data_frame.sort_values(
-            by=[self.src_args.src_col_date]).groupby([self.src_args.src_col_isin])[self.trg_args.trg_col_op_price].shift(1)
-        data_frame[self.trg_args.trg_col_ch_prev_clos] = (
-            data_frame[self.trg_args.trg_col_op_price] - data_frame[self.trg_args.trg_col_ch_prev_clos]) / data_frame[self.trg_args.trg_col_ch_prev_clos] * 100
-        # Rounding to 2 decimal places
-        data_frame = data_frame.round(decimals=2)
-        # Removing the day before extract_date
-        data_frame = data_frame[data_frame.Date >=
-                                self.extract_date].reset_index(drop=True)
+        if self._ohlcv_kernel:
+            # Aggregating per ISIN and day in one linear scan of the sorted source data
+            data_frame = XetraOHLCVKernel.aggregate(data_frame, self.src_args, self.trg_args)
+        else:
+            # Calculating opening price per ISIN and day
+            data_frame[self.trg_args.trg_col_op_price] = data_frame.sort_values(by=[self.src_args.src_col_time], kind='stable').groupby([
+                self.src_args.src_col_isin,
+                self.src_args.src_col_date], observed=True)[self.src_args.src_col_start_price].transform('first')
+            # Calculating closing price per ISIN and day
+            data_frame[self.trg_args.trg_col_clos_price] = data_frame.sort_values(by=[self.src_args.src_col_time], kind='stable').groupby([
+                self.src_args.src_col_isin,
+                self.src_args.src_col_date], observed=True)[self.src_args.src_col_end_price].transform('last')
+            # Renaming columns
+            data_frame.rename(columns={
+                self.src_args.src_col_min_price: self.trg_args.trg_col_min_price,
+                self.src_args.src_col_max_price: self.trg_args.trg_col_max_price,
+                self.src_args.src_col_traded_vol: self.trg_args.trg_col_daily_trad_vol,
+            }, inplace=True)
+            # Aggregating per ISIN and day -> opening price, closing price, min
+            # price, max price, traded volume
+            data_frame = data_frame.groupby([
+                self.src_args.src_col_isin,
+                self.src_args.src_col_date], as_index=False, observed=True).agg({
+                    self.trg_args.trg_col_op_price: 'min',
+                    self.trg_args.trg_col_clos_price: 'max',
+                    self.trg_args.trg_col_min_price: 'min',
+                    self.trg_args.trg_col_max_price: 'max',
+                    self.trg_args.trg_col_daily_trad_vol: 'sum',
+                })
+        # groupby returns categorical keys of the compact schema in the order of their
+        # categories, the kernel and the groupby of the other keys sort by ISIN and day
+        unsorted = not self._ohlcv_kernel and any(
+            isinstance(data_frame[column].dtype, pd.CategoricalDtype)
+            for column in [self.src_args.src_col_isin, self.src_args.src_col_date])
+        # Restoring the key and price types of the compact schema
+        data_frame = XetraCompactSchema.restore(data_frame, self.src_args)
+        if unsorted:
+            data_frame = data_frame.sort_values(
+                by=[self.src_args.src_col_isin, self.src_args.src_col_date], ignore_index=True)
+        # % Change to the previous trading day, rounding and removing the day before extract_date
+        data_frame = XetraPartialAggregates.to_report1(
+            data_frame, self.src_args, self.trg_args, self.extract_date)
         self._logger.info(
             'Applying transformations to Xetra source data finished...')
         return data_frame
 
+    def extract_transform_report1(self):
+        """
+        Extract and transform to create report 1 within the memory budget
+        self.run_args.max_memory_mb
+
+        The extracted days are kept in memory until they use about half of the budget,
+        from then on they are spilled to local files partitioned by ISIN and report 1 is
+        created partition by partition. The result is identical to the in-memory run.
+
+        Returns:
+            data_frame = transformed pandas dataframe
+        """
+        budget = self.run_args.max_memory_mb * 2 ** 20 * SpillFormat.BUDGET_FRACTION.value
+        spill_store, data_frames, buffered, rows = None, [], 0, 0
+        # Extraction, spilling once the budget is nearly reached
+        self._logger.info('Extracting Xetra source files started...')
+        with self.metrics.stage('extract'):
+            for date in self.extract_date_list:
+                data_frames.append(self._extract_day(date))
+                buffered += SpillStore.nbytes(data_frames[-1])
+                rows += len(data_frames[-1])
+                if buffered > budget:
+                    if spill_store is None:
+                        spill_store = SpillStore(self.src_args.src_col_isin,
+                                                 self.run_args.spill_partitions,
+                                                 self.run_args.spill_dir)
+                    for data_frame in data_frames:
+                        spill_store.append(data_frame)
+                    data_frames, buffered = [], 0
+            if self.listing:
+                self.listing.save()
+        self._logger.info('Extracting Xetra source files finished')
+        self.metrics.add_rows('extract', 0, rows)
+        # Transformation
+        with self.metrics.stage('transform_report1'):
+            if spill_store is None:
+                data_frame = self.transform_report1(self.concat(data_frames))
+            else:
+                for data_frame in data_frames:
+                    spill_store.append(data_frame)
+                data_frame = self._transform_report1_spilled(spill_store)
+        self.metrics.add_rows('transform_report1', rows, len(data_frame))
+        return data_frame
+
+    def _transform_report1_spilled(self, spill_store: SpillStore):
+        """
+        Helper function for self.extract_transform_report1() creating report 1
+        partition by partition from the spill files
+
+        Params:
+            spill_store (SpillStore): spill files partitioned by ISIN
+
+        Returns:
+            data_frame = transformed pandas dataframe
+        """
+        reports = []
+        try:
+            for partition in spill_store.read_partitions():
+                # All rows of an ISIN are in the same partition
+                report = self.transform_report1(
+                    self.concat([self._from_table(table) for table in partition]))
+                if len(report):
+                    reports.append(SpillStore.to_table(report))
+        finally:
+            spill_store.clear()
+        if not reports:
+            return self.transform_report1(self.concat([]))
+        table = pa.concat_tables(reports)
+        table = table.take(pc.sort_indices(table, sort_keys=[
+            (self.src_args.src_col_isin, 'ascending'),
+            (self.src_args.src_col_date, 'ascending')]))
+        return self._from_table(table)
+
+    def extract_summaries(self):
+        """
+        Read the partial aggregates per ISIN and day of every source file of
+        self.extract_date_list from the summary cache below self.run_args.summary_prefix
+
+        Summaries are cached by the ETag of the source file, so a source file is read
+        only once. Missing summaries are created from the source file and cached.
+
+        Returns:
+            partials (list): Pandas DataFrames with the partial aggregates per source file
+        """
+        self._logger.info('Extracting Xetra source file summaries started...')
+        partials = []
+        for date in self.extract_date_list:
+            if self.listing:
+                objects = self.listing.list_objects(date)
+            else:
+                objects = self.s3_bucket_src.list_objects_in_prefix(date)
+            partials.extend(self._read_summary(key, details['etag'])
+                            for key, details in sorted(objects.items()))
+        if self.listing:
+            self.listing.save()
+        self._logger.info('Extracting Xetra source file summaries finished')
+        return partials
+
+    def _read_summary(self, key: str, etag: str):
+        """
+        Helper function for self.extract_summaries() returning the summary of a source
+        file, creating and caching it if missing
+
+        Params:
+            key (str): key of the source file
+            etag (str): ETag of the source file
+
+        Returns:
+            data_frame (pd.DataFrame): partial aggregates per ISIN and day of the file
+        """
+        # The summary depends on the content of the file and the source configuration
+        fingerprint = hashlib.sha1('|'.join(
+            str(value) for field, value in self.src_args._asdict().items()
+            if field != 'src_first_extract_date').encode('utf-8')).hexdigest()[:8]
+        summary_key = (f'{self.run_args.summary_prefix}{etag.strip(chr(34))}_{fingerprint}.'
+                       f'{SummaryFormat.FILE_FORMAT.value}')
+        summary_columns = {
+            self.trg_args.trg_col_op_price: SummaryFormat.OP_PRICE_COL.value,
+            self.trg_args.trg_col_clos_price: SummaryFormat.CLOS_PRICE_COL.value,
+            self.trg_args.trg_col_min_price: SummaryFormat.MIN_PRICE_COL.value,
+            self.trg_args.trg_col_max_price: SummaryFormat.MAX_PRICE_COL.value,
+            self.trg_args.trg_col_daily_trad_vol: SummaryFormat.TRADED_VOL_COL.value,
+        }
+        try:
+            data_frame = pd.read_parquet(BytesIO(self.s3_bucket_trg.read_object(summary_key)))
+            return data_frame.rename(
+                columns={value: key for key, value in summary_columns.items()})
+        except self.s3_bucket_trg.key_not_found_exception:
+            pass
+        data_frame = self.s3_bucket_src.read_csv_to_df(
+            key, **XetraUniverse.csv_filters(self.universe))
+        if data_frame.empty:
+            data_frame = pd.DataFrame(columns=self.src_args.src_columns)
+        data_frame = XetraPartialAggregates.from_source(data_frame, self.src_args, self.trg_args)
+        # Writing the summary also if it is empty, e.g. for header-only files
+        out_buffer = BytesIO()
+        data_frame.rename(columns=summary_columns).to_parquet(out_buffer, index=False)
+        self.s3_bucket_trg.write_object(out_buffer.getvalue(), summary_key)
+        return data_frame
+
+    def transform_report1_from_partials(self, partials: list):
+        """
+        Creates report 1 from partial aggregates per ISIN and day, e.g. of the source
+        files or of the shards of a run
+
+        Params:
+            partials (list): Pandas DataFrames with partial aggregates
+
+        Returns:
+            data_frame = transformed dataframe of the engine
+        """
+        data_frame = XetraPartialAggregates.merge(partials, self.src_args, self.trg_args)
+        if data_frame.empty:
+            return self.transform_report1(self.concat([]))
+        self._logger.info(
+            'Applying transformations to Xetra partial aggregates for report 1 started...')
+        data_frame = data_frame.sort_values(
+            by=[self.src_args.src_col_isin, self.src_args.src_col_date], ignore_index=True)
+        # % Change to the previous trading day, rounding and removing the day before extract_date
+        data_frame = XetraPartialAggregates.to_report1(
+            data_frame, self.src_args, self.trg_args, self.extract_date)
+        self._logger.info(
+            'Applying transformations to Xetra source data finished...')
+        return self._from_table(SpillStore.to_table(data_frame))
+
+    def transform_intraday_bars(self, data_frame: pd.DataFrame):
+        """
+        Applies the necessary transformations to create the intraday bars report
+
+        Params:
+            data_frame (pd.DataFrame): Pandas DataFrame as input
+
+        Returns:
+            data_frame = bars of all configured resolutions per ISIN and day
+        """
+        if not len(data_frame):
+            self._logger.info(
+                'The dataframe is empty. No transformations will be applied!')
+            return pd.DataFrame()
+        self._logger.info(
+            'Applying transformations to Xetra source data for the intraday bars started...')
+        if not isinstance(data_frame, pd.DataFrame):
+            # Arrow table or Polars DataFrame of the other engines
+            data_frame = data_frame.to_pandas()
+        data_frame = XetraIntradayBars.from_source(data_frame, self.src_args, self.trg_args)
+        # Removing the day before extract_date, it is only needed for report 1
+        if not data_frame.empty:
+            data_frame = data_frame[data_frame[self.src_args.src_col_date] >=
+                                    self.extract_date].reset_index(drop=True)
+        self._logger.info(
+            'Applying transformations to Xetra source data finished...')
+        return data_frame
+
+    def transform_rolling_windows(self, data_frame: pd.DataFrame):
+        """
+        Applies the necessary transformations to create the rolling-window report
+
+        Report 1 is created first, its closing prices are appended to the persisted
+        rolling-window state which is written by self.load_rolling_windows().
+
+        Params:
+            data_frame (pd.DataFrame): Pandas DataFrame as input
+
+        Returns:
+            data_frame = moving averages and volatilities of the closing prices
+        """
+        data_frame = self.transform_report1(data_frame)
+        if not isinstance(data_frame, pd.DataFrame):
+            # Arrow table or Polars DataFrame of the other engines
+            data_frame = data_frame.to_pandas()
+        self._logger.info(
+            'Applying transformations to report 1 for the rolling windows started...')
+        capacity = max(self.trg_args.trg_rolling_windows) + 1
+        try:
+            self.rolling_state = XetraRollingState.from_bytes(
+                self.s3_bucket_trg.read_object(self._rolling_state_key()), capacity)
+        except self.s3_bucket_trg.key_not_found_exception:
+            self.rolling_state = XetraRollingState(capacity)
+        data_frame = self.rolling_state.update(data_frame, self.src_args, self.trg_args)
+        self._logger.info(
+            'Applying transformations to report 1 finished...')
+        return data_frame
+
     def load(self, data_frame: pd.DataFrame):
         """
         Saves a Pandas Dataframe to the target
@@ -189,26 +542,173 @@ class XetraETL():
             f'{datetime.today().strftime(self.trg_args.trg_key_date_format)}'
             f'{self.trg_args.trg_format}'
         )
-        # Writing to target
-        self.s3_bucket_trg.write_df_to_s3(
-            data_frame, target_key, self.trg_args.trg_format)
+        hashes = None
+        if self.load_manifest and len(data_frame):
+            # Hashing the report of every engine as Pandas DataFrame, empty reports
+            # are not written anyway
+            report = data_frame
+            if not isinstance(report, pd.DataFrame):
+                report = report.to_pandas()
+            hashes = {LoadManifestFormat.SINGLE_PARTITION.value:
+                      LoadManifest.content_hash(report)}
+        if hashes and self.load_manifest.is_unchanged(self.trg_args.trg_key, hashes):
+            self._logger.info('Xetra target data unchanged, the write is skipped.')
+        else:
+            # Writing to target
+            self._write_target(data_frame, target_key)
+            self._logger.info('Xetra target data successfully written.')
+            if hashes:
+                self.load_manifest.record(self.trg_args.trg_key, hashes, target_key)
+        # Updating meta file
+        self._update_meta_file()
+        return True
+
+    def load_partitioned(self, data_frame: pd.DataFrame):
+        """
+        Saves a Pandas Dataframe as parquet files partitioned by resolution and date
+
+        The files are written below the prefix trg_key + timestamp as
+        <resolution column>=<resolution>/<date column>=<date>/part-0.parquet,
+        followed by the commit marker _SUCCESS once all files are written
+
+        Params:
+            data_frame (pd.DataFrame): dataframe to load
+        """
+        # Creating target prefix
+        target_prefix = (
+            f'{self.trg_args.trg_key}'
+            f'{datetime.today().strftime(self.trg_args.trg_key_date_format)}'
+        )
+        partition_cols = [self.trg_args.trg_col_bar_resolution, self.src_args.src_col_date]
+        partitions = {}
+        if len(data_frame):
+            partitions = {
+                f'{partition_cols[0]}={resolution}/{partition_cols[1]}={date}/'
+                f'part-0.{S3FileTypes.PARQUET.value}':
+                partition.drop(columns=partition_cols).reset_index(drop=True)
+                for (resolution, date), partition in data_frame.groupby(
+                    partition_cols, sort=True)}
+        hashes = None
+        if self.load_manifest and partitions:
+            hashes = {key: LoadManifest.content_hash(partition)
+                      for key, partition in partitions.items()}
+        if hashes and self.load_manifest.is_unchanged(self.trg_args.trg_key, hashes):
+            # All partitions are unchanged, a new prefix with a part of them would be incomplete
+            self._logger.info('Xetra target data unchanged, the write is skipped.')
+        else:
+            # Writing one file per partition to target concurrently, the commit marker
+            # is written last and only if all partitions were written
+            self.s3_bucket_trg.write_dfs_to_s3(
+                {f'{target_prefix}/{key}': partition for key, partition in partitions.items()},
+                S3FileTypes.PARQUET.value,
+                commit_key=f'{target_prefix}/{BatchWriteFormat.COMMIT_MARKER.value}',
+                max_workers=self.run_args.write_workers)
+            self._logger.info('Xetra target data successfully written.')
+            if hashes:
+                self.load_manifest.record(self.trg_args.trg_key, hashes, target_prefix)
+        # Updating meta file
+        self._update_meta_file()
+        return True
+
+    def load_rolling_windows(self, data_frame: pd.DataFrame):
+        """
+        Saves the rolling-window report and the updated rolling-window state to the target
+
+        Params:
+            data_frame (pd.DataFrame): dataframe to load
+        """
+        # Creating target key
+        target_key = (
+            f'{self.trg_args.trg_key}'
+            f'{datetime.today().strftime(self.trg_args.trg_key_date_format)}'
+            f'{self.trg_args.trg_format}'
+        )
+        # Writing to target, the state follows the report so no day is lost on failures
+        self.s3_bucket_trg.write_df_to_s3(data_frame, target_key, self.trg_args.trg_format)
+        self.s3_bucket_trg.write_object(
+            self.rolling_state.to_bytes(), self._rolling_state_key())
         self._logger.info('Xetra target data successfully written.')
         # Updating meta file
+        self._update_meta_file()
+        return True
+
+    def _update_meta_file(self):
+        """
+        Helper function for the load methods updating the meta file with
+        self.meta_update_list, skipped without new dates if the load manifest is used
+        """
+        if self.load_manifest and not self.meta_update_list:
+            self._logger.info('No new Xetra dates, the meta file is not rewritten.')
+            return
         MetaProcess.update_meta_file(
             self.meta_update_list, self.meta_key, self.s3_bucket_trg)
         self._logger.info('Xetra meta file successfully updated.')
-        return True
 
+    def _rolling_state_key(self):
+        """
+        Helper function returning the key of the persisted rolling-window state
+        """
+        return self.trg_args.trg_rolling_state_key or f'{self.trg_args.trg_key}rolling_state.npz'
+
+    def _write_target(self, data_frame: pd.DataFrame, target_key: str):
+        """
+        Helper function for self.load() writing the report to the target
+
+        Params:
+            data_frame (pd.DataFrame): dataframe to write
+            target_key (str): key of the target file
+        """
+        return self.s3_bucket_trg.write_df_to_s3(
+            data_frame, target_key, self.trg_args.trg_format)
 
     def etl_report1(self):
         """
         Extract, transform and load to create report 1
         """
 
-        # Extrcation
-        data_frame = self.extract()
-        # Transformation
-        data_frame = self.transform_report1(data_frame)
+        run_timestamp = datetime.today().strftime(self.trg_args.trg_key_date_format)
+        if self.run_args.summary_prefix:
+            # Extraction and transformation from the cached summaries of the source files
+            with self.metrics.stage('extract'):
+                partials = self.extract_summaries()
+            rows_in = sum(len(partial) for partial in partials)
+            self.metrics.add_rows('extract', 0, rows_in)
+            with self.metrics.stage('transform_report1'):
+                data_frame = self.transform_report1_from_partials(partials)
+            self.metrics.add_rows('transform_report1', rows_in, len(data_frame))
+        elif self.run_args.max_memory_mb:
+            # Extraction and transformation within the memory budget
+            data_frame = self.extract_transform_report1()
+        else:
+            # Extrcation
+            with self.metrics.stage('extract'):
+                data_frame = self.extract()
+            self.metrics.add_rows('extract', 0, len(data_frame))
+            # Transformation
+            rows_in = len(data_frame)
+            with self.metrics.stage('transform_report1'):
+                data_frame = self.transform_report1(data_frame)
+            self.metrics.add_rows('transform_report1', rows_in, len(data_frame))
         # Load
-        self.load(data_frame)
+        with self.metrics.stage('load'):
+            self.load(data_frame)
+        self.metrics.add_rows('load', len(data_frame), len(data_frame))
+        # Removing the intermediate files of the finished run
+        if self.intermediate:
+            self.intermediate.clear()
+        if self.metrics.enabled:
+            self._write_run_report(run_timestamp)
         return True
+
+    def _write_run_report(self, run_timestamp: str):
+        """
+        Helper function for self.etl_report1() logging and optionally saving the run report
+
+        Params:
+            run_timestamp (str): start of the run in the target key date format
+        """
+        run_report = self.metrics.report()
+        self._logger.info('Xetra run report: %s', json.dumps(run_report))
+        if self.run_args.run_report_to_target:
+            self.s3_bucket_trg.write_json_to_s3(
+                run_report, f'{self.trg_args.trg_key}{run_timestamp}_run_report.json')
@@ -0,0 +1,160 @@
+""" Universe filter for the Xetra source data"""
+import hashlib
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from xetra.common.config import XetraSourceConfig
+
+
+class XetraUniverse():
+    """
+    Class for the allow-lists of ISINs, mnemonics and security types of the source
+    configuration
+
+    A row is kept if its value is in every configured allow-list. The filters are passed
+    to the csv readers of the storage connectors: most lines outside of the universe are
+    removed before parsing and the remaining rows are filtered per parsed chunk, so the
+    filtered rows are never collected.
+    """
+
+    def __init__(self, allowed: dict):
+        """
+        Constructor for XetraUniverse
+
+        Params:
+            allowed (dict): allowed values by source column
+        """
+        self.allowed = {column: sorted(set(values)) for column, values in allowed.items()}
+
+    @staticmethod
+    def from_config(src_args: XetraSourceConfig):
+        """
+        Creating the universe of the source configuration
+
+        Params:
+            src_args (XetraSourceConfig): NamedTuple class with source configuration data
+
+        Returns:
+            universe (XetraUniverse): universe, None if no allow-list is configured
+        """
+        allowed = {column: values for column, values in [
+            (src_args.src_col_isin, src_args.src_isins),
+            (src_args.src_col_mnemonic, src_args.src_mnemonics),
+            (src_args.src_col_security_type, src_args.src_security_types)]
+            if values is not None}
+        if not allowed:
+            return None
+        return XetraUniverse(allowed)
+
+    @staticmethod
+    def csv_filters(universe, as_table: bool = False):
+        """
+        Returning the filter arguments of the csv readers of the storage connectors
+
+        Params:
+            universe (XetraUniverse): universe, None reads all rows
+            as_table (bool): True for read_csv_to_table, False for read_csv_to_df
+
+        Returns:
+            filters (dict): row_filter and line_filter arguments, empty without universe
+        """
+        if universe is None:
+            return {}
+        return {'row_filter': universe.filter_table if as_table else universe.filter_df,
+                'line_filter': universe.filter_lines}
+
+    @staticmethod
+    def fingerprint_of(universe):
+        """
+        Returning the fingerprint of a universe, e.g. to separate the intermediate files
+        of runs on different universes
+
+        Params:
+            universe (XetraUniverse): universe, None reads all rows
+
+        Returns:
+            fingerprint (str): hash of the allow-lists, '' without universe
+        """
+        return universe.fingerprint() if universe else ''
+
+    def fingerprint(self):
+        """
+        Returning a short hash of the allow-lists, e.g. to separate cached source data
+        of different universes
+
+        Returns:
+            fingerprint (str): hash of the allowed values by column
+        """
+        return hashlib.sha1(repr(sorted(self.allowed.items())).encode(
+            'utf-8')).hexdigest()[:8]
+
+    def filter_lines(self, body: bytes, sep: str = ','):
+        """
+        Removing the lines of a csv file outside of the universe before the file is parsed
+
+        Only the column with the shortest allow-list is checked, filter_df or filter_table
+        is applied to the parsed rows afterwards. Files with quoted fields are returned
+        unchanged, as a separator could be part of a field.
+
+        Params:
+            body (bytes): content of the csv file
+            sep (str): seperator of the csv file
+
+        Returns:
+            body (bytes): header and the lines that can be in the universe
+        """
+        header_end = body.find(b'\n')
+        if header_end < 0 or body.find(b'"') >= 0:
+            return body
+        columns = body[:header_end].rstrip(b'\r').decode('utf-8').split(sep)
+        # The last field of a line can end with a carriage return
+        candidates = [(len(values), columns.index(column), values)
+                      for column, values in self.allowed.items() if column in columns[:-1]]
+        if not candidates:
+            return body
+        _, index, values = min(candidates)
+        allowed = {value.encode('utf-8') for value in values}
+        sep = sep.encode('utf-8')
+        lines = body[header_end + 1:].split(b'\n')
+        if index == 0:
+            kept = [line for line in lines if line[:line.find(sep)] in allowed]
+        else:
+            kept = [line for line, fields in ((line, line.split(sep, index + 1))
+                                              for line in lines)
+                    if len(fields) > index and fields[index] in allowed]
+        return b'\n'.join([body[:header_end]] + kept + [b''])
+
+    def filter_df(self, data_frame: pd.DataFrame):
+        """
+        Filtering a Pandas DataFrame
+
+        Params:
+            data_frame (pd.DataFrame): Pandas DataFrame with Xetra source data
+
+        Returns:
+            data_frame (pd.DataFrame): rows of the universe
+        """
+        mask = np.ones(len(data_frame), dtype=bool)
+        for column, values in self.allowed.items():
+            mask &= data_frame[column].isin(values).to_numpy()
+        return data_frame[mask]
+
+    def filter_table(self, table):
+        """
+        Filtering an Arrow table or record batch, like in Pandas rows with missing
+        values in the filtered columns are removed
+
+        Params:
+            table (pa.Table | pa.RecordBatch): Arrow data with Xetra source data
+
+        Returns:
+            table (pa.Table | pa.RecordBatch): rows of the universe
+        """
+        mask = None
+        for column, values in self.allowed.items():
+            column_mask = pc.is_in(table.column(column), value_set=pa.array(values))
+            mask = column_mask if mask is None else pc.and_(mask, column_mask)
+        return table.filter(mask)
@@ -0,0 +1,203 @@
+""" Watch mode for near-real-time intraday updates of the Xetra reports"""
+from datetime import datetime, timedelta
+import logging
+import threading
+
+import pandas as pd
+
+from xetra.common.constants import MetaProcessFormat
+from xetra.common.listing import ListingManifest
+from xetra.common.meta_process import MetaProcess
+from xetra.transformations.xetra_aggregations import XetraPartialAggregates
+from xetra.transformations.xetra_transformations import XetraETL
+from xetra.transformations.xetra_universe import XetraUniverse
+
+
+class XetraWatcher():
+    """
+    Polls the source listing and updates the report partitions of the watched days
+    with the newly published source files only
+    """
+
+    def __init__(self, xetra_etl: XetraETL, interval: int):
+        """
+        Constructor for XetraWatcher
+
+        Params:
+            xetra_etl (XetraETL): XetraETL instance with connections and configuration data
+            interval (int): seconds between two polls of the source listing
+        """
+        self._logger = logging.getLogger(__name__)
+        self.xetra_etl = xetra_etl
+        self.interval = interval
+        self.seen_keys = set()
+        self.partials = pd.DataFrame()
+        self.meta_dates = set()
+        self.today = datetime.today().date()
+        today = self.today.strftime(MetaProcessFormat.META_DATE_FORMAT.value)
+        # First day with report partitions and meta entries, today if the meta file
+        # already has all days, e.g. after the daily batch run, never moved forward
+        self.report_start = min(xetra_etl.extract_date, today)
+        # The day before self.report_start is read for the previous closing price
+        self.watch_dates = sorted(set(xetra_etl.extract_date_list)
+                                  | {self._previous_date(self.report_start), today})
+
+    def poll_once(self):
+        """
+        Reading the newly published source files and updating the report partitions
+
+        Returns:
+            updated_dates (list): dates whose report partitions were written
+        """
+        today = datetime.today().date()
+        if today != self.today:
+            self._refresh_dates(today)
+        self._extend_watch_dates(today)
+        new_keys = [
+            key for date in self.watch_dates
+            for key in self.xetra_etl.s3_bucket_src.list_files_in_prefix(date)
+            if key not in self.seen_keys]
+        if not new_keys:
+            self._logger.info('No new Xetra source files found.')
+            return []
+        new_partials = []
+        for key in new_keys:
+            data_frame = self.xetra_etl.s3_bucket_src.read_csv_to_df(
+                key, **XetraUniverse.csv_filters(self.xetra_etl.universe))
+            if not data_frame.empty:
+                new_partials.append(XetraPartialAggregates.from_source(
+                    data_frame, self.xetra_etl.src_args, self.xetra_etl.trg_args))
+        self.seen_keys.update(new_keys)
+        new_partials = [partial for partial in new_partials if not partial.empty]
+        if not new_partials:
+            return []
+        date_col = self.xetra_etl.src_args.src_col_date
+        updated_dates = sorted(
+            set().union(*[set(partial[date_col]) for partial in new_partials]))
+        # Keeping the aggregation state in memory between the polls
+        self.partials = XetraPartialAggregates.merge(
+            [self.partials] + new_partials, self.xetra_etl.src_args, self.xetra_etl.trg_args)
+        report = XetraPartialAggregates.to_report1(
+            self.partials, self.xetra_etl.src_args, self.xetra_etl.trg_args,
+            self.report_start)
+        updated_dates = [date for date in updated_dates if date >= self.report_start]
+        self.xetra_etl.s3_bucket_trg.write_dfs_to_s3(
+            {self.partition_key(date): report[report[date_col] == date].reset_index(drop=True)
+             for date in updated_dates},
+            self.xetra_etl.trg_args.trg_format,
+            max_workers=self.xetra_etl.run_args.write_workers)
+        self._update_meta(today)
+        self._prune_state()
+        return updated_dates
+
+    def run(self, stop_event: threading.Event):
+        """
+        Polling the source listing until stop_event is set, a failed poll is logged
+        and retried after the interval
+
+        Params:
+            stop_event (threading.Event): event signalling the shutdown
+        """
+        self._logger.info('Xetra watcher started with an interval of %s seconds', self.interval)
+        while not stop_event.is_set():
+            try:
+                self.poll_once()
+            except Exception:  # pylint: disable=broad-except
+                self._logger.exception(
+                    'Polling the Xetra source files failed, retrying in %s seconds',
+                    self.interval)
+            stop_event.wait(self.interval)
+        self._logger.info('Xetra watcher stopped')
+
+    def partition_key(self, date: str):
+        """
+        Returning the target key of the report partition of a day
+
+        Params:
+            date (str): source date
+
+        Returns:
+            key (str): target key of the report partition
+        """
+        return f'{self.xetra_etl.trg_args.trg_key}_intraday_{date}.{self.xetra_etl.trg_args.trg_format}'
+
+    def _refresh_dates(self, today):
+        """
+        Helper function recomputing the dates of the XetraETL instance from the meta file
+        after the midnight rollover and watching the days that are not processed yet
+        """
+        xetra_etl = self.xetra_etl
+        xetra_etl.extract_date, xetra_etl.extract_date_list = MetaProcess.return_date_list(
+            xetra_etl.src_args.src_first_extract_date, xetra_etl.meta_key,
+            xetra_etl.s3_bucket_trg)
+        xetra_etl.meta_update_list = [
+            date for date in xetra_etl.extract_date_list if date >= xetra_etl.extract_date]
+        new_dates = {date for date in xetra_etl.extract_date_list
+                     if date >= xetra_etl.extract_date and date not in self.meta_dates}
+        if xetra_etl.extract_date < self.report_start:
+            # Days were removed from the meta file since the start
+            self.report_start = xetra_etl.extract_date
+            new_dates.add(self._previous_date(self.report_start))
+        self.watch_dates = sorted(set(self.watch_dates) | new_dates)
+        self.today = today
+
+    @staticmethod
+    def _previous_date(date: str):
+        """
+        Helper function returning the day before a date
+        """
+        date_format = MetaProcessFormat.META_DATE_FORMAT.value
+        return (datetime.strptime(date, date_format).date()
+                - timedelta(days=1)).strftime(date_format)
+
+    def _extend_watch_dates(self, today):
+        """
+        Helper function adding the days passed since the last poll to the watched days
+        """
+        last_date = datetime.strptime(
+            self.watch_dates[-1], MetaProcessFormat.META_DATE_FORMAT.value).date()
+        self.watch_dates.extend(
+            (last_date + timedelta(days=day)).strftime(MetaProcessFormat.META_DATE_FORMAT.value)
+            for day in range(1, (today - last_date).days + 1))
+
+    def _update_meta(self, today):
+        """
+        Helper function registering the closed days in the meta file
+        """
+        today = today.strftime(MetaProcessFormat.META_DATE_FORMAT.value)
+        closed_dates = [
+            date for date in self.watch_dates
+            if self.report_start <= date < today and date not in self.meta_dates]
+        if closed_dates:
+            MetaProcess.update_meta_file(
+                closed_dates, self.xetra_etl.meta_key, self.xetra_etl.s3_bucket_trg)
+            self.meta_dates.update(closed_dates)
+
+    def _prune_state(self):
+        """
+        Helper function removing the finished days from the watched days and keeping
+        only the days needed for the previous closing price of the watched days
+
+        A day older than the newest day stays watched until no more source files are
+        published for it and it is registered in the meta file, so late files of the
+        previous day are read after the midnight rollover.
+        """
+        date_col = self.xetra_etl.src_args.src_col_date
+        state_dates = sorted(set(self.partials[date_col]))
+        self.watch_dates = [date for date in self.watch_dates
+                            if date >= state_dates[-1] or not self._is_finished(date)]
+        previous_dates = [date for date in state_dates if date < self.watch_dates[0]]
+        if previous_dates:
+            self.partials = self.partials[
+                self.partials[date_col] >= previous_dates[-1]].reset_index(drop=True)
+        self.seen_keys = {
+            key for key in self.seen_keys
+            if any(key.startswith(date) for date in self.watch_dates)}
+
+    def _is_finished(self, date: str):
+        """
+        Helper function checking if a day is closed and, unless it is only read for the
+        previous closing price, registered in the meta file
+        """
+        return ListingManifest.is_closed(date) and (
+            date < self.report_start or date in self.meta_dates)